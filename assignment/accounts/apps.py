@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        # 시그널 수신기 등록
+        from . import signals  # noqa: F401
+
+        # 요청별 구간 측정에 DB 쿼리 수와 시간 포함 (측정 중이 아닌 요청은 그대로 실행)
+        from django.db.backends.signals import connection_created
+
+        from .instrumentation import install_query_wrapper
+
+        connection_created.connect(install_query_wrapper)
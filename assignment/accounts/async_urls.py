@@ -0,0 +1,16 @@
+from django.urls import path
+from . import async_views
+from .urls import urlpatterns as sync_urlpatterns
+
+# 비동기 버전이 있는 API는 같은 URL과 이름으로 교체하고 나머지는 동기 뷰 유지
+async_urlpatterns = [
+    path("signup/", async_views.AsyncSignupAPIView.as_view(), name="signup"),
+    path("login/", async_views.AsyncLoginAPIView.as_view(), name="login"),
+    path("auth-test/", async_views.AsyncAuthTestAPIView.as_view(), name="auth-test"),
+]
+
+_async_names = {pattern.name for pattern in async_urlpatterns}
+
+urlpatterns = async_urlpatterns + [
+    pattern for pattern in sync_urlpatterns if pattern.name not in _async_names
+]
@@ -0,0 +1,199 @@
+"""
+ASGI 환경을 위한 비동기 API 뷰
+
+DRF APIView는 동기 뷰이므로 ASGI에서는 요청마다 sync_to_async 스레드 전환이 발생합니다.
+이 모듈의 뷰는 Django 비동기 뷰로 동작하면서 views.py의 API와 같은 URL, 같은 응답/에러 형식을 유지합니다.
+
+- 요청 파싱, 응답 렌더링, 예외 처리는 DRF의 파서/JSONRenderer/custom_exception_handler를 그대로 사용
+- 인증 사용자 조회(aget)와 회원가입 INSERT(acreate, ainsert_user)는 Django 비동기 ORM으로 수행
+- 로그인 시도 제한과 감사 기록은 비동기 버전(acheck 등, arecord_event)을 사용하여
+  캐시 서버 통신 등 blocking 작업을 이벤트 루프에서 기다리지 않음
+- 비밀번호 해시는 accounts.hashing을 통해 이벤트 루프 밖(스레드 또는 프로세스 풀)에서 계산
+
+settings.ACCOUNTS_ASYNC_VIEWS가 True이면 config.urls가 accounts.async_urls를 사용합니다.
+"""
+
+from django.contrib.auth import aauthenticate
+from django.http import HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, serializers, status
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.request import Request
+
+from . import hashing
+from .audit import arecord_event
+from .authentication import StatelessJWTAuthentication
+from .exception_handler import custom_exception_handler
+from .models import AuditEvent, User
+from .parsers import FastJSONParser
+from .ratelimit import LoginThrottled, get_client_ip, get_login_rate_limiter
+from .serializers import INVALID_CREDENTIALS_ERROR, ainsert_user
+from .renderers import FastJSONRenderer
+from .instrumentation import phase
+from .tokens import issue_tokens
+from .validation import login_validator, signup_validator
+from .views import AUTH_SUCCESS_RESPONSE
+
+
+class AsyncAPIView(View):
+    """
+    DRF APIView와 같은 형식으로 요청/응답/예외를 처리하는 비동기 뷰 기반 클래스
+    """
+
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
+    authentication_class = StatelessJWTAuthentication
+    renderer = FastJSONRenderer()
+
+    # 인증이 필요한 API 여부
+    requires_authentication = False
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # DRF APIView와 마찬가지로 CSRF 검사 제외 (JWT 인증 사용)
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        # 파싱/예외 처리에서 DRF와 같은 동작을 위해 요청 래핑
+        self.request = Request(
+            request, parsers=[parser() for parser in self.parser_classes]
+        )
+
+        try:
+            method = request.method.lower()
+            handler = getattr(self, method, None)
+            if method not in self.http_method_names or handler is None:
+                raise exceptions.MethodNotAllowed(request.method)
+
+            if self.requires_authentication:
+                await self.authenticate(self.request)
+
+            response = await handler(self.request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            response = self.handle_exception(exc)
+
+        # DRF APIView.finalize_response와 같은 헤더 추가
+        response["Allow"] = ", ".join(self._allowed_methods())
+        response["Vary"] = "Accept"
+        return response
+
+    async def authenticate(self, request):
+        result = await self.authentication_class().aauthenticate(request)
+        if result is None:
+            raise exceptions.NotAuthenticated()
+        request.user, request.auth = result
+
+    def handle_exception(self, exc):
+        # 401 응답에 WWW-Authenticate 헤더 추가 (DRF APIView.handle_exception과 동일)
+        if isinstance(
+            exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)
+        ):
+            exc.auth_header = self.authentication_class().authenticate_header(
+                self.request
+            )
+
+        response = custom_exception_handler(
+            exc,
+            {
+                "view": self,
+                "args": self.args,
+                "kwargs": self.kwargs,
+                "request": self.request,
+            },
+        )
+        if response is None:
+            raise exc
+
+        return self.render(
+            response.data, response.status_code, headers=response.items()
+        )
+
+    def render(self, data, status_code, headers=()):
+        response = HttpResponse(
+            self.renderer.render(data),
+            status=status_code,
+            content_type=self.renderer.media_type,
+        )
+        for name, value in headers:
+            if name.lower() != "content-type":
+                response[name] = value
+        return response
+
+
+class AsyncSignupAPIView(AsyncAPIView):
+    # 회원가입 기능
+    async def post(self, request):
+        with phase("validate"):
+            data, errors = signup_validator.validate(request.data)
+        if errors is not None:
+            return self.render(errors, status.HTTP_400_BAD_REQUEST)
+
+        # 비밀번호 해시는 이벤트 루프 밖에서 계산
+        user = User(
+            username=data["username"],
+            nickname=data["nickname"],
+            password=await hashing.amake_password(data["password"]),
+        )
+
+        # 한 번의 INSERT로 저장, 중복 사용자는 unique 제약으로 확인
+        try:
+            user = await ainsert_user(user)
+        except serializers.ValidationError as e:
+            return self.render(e.detail, status.HTTP_400_BAD_REQUEST)
+
+        await arecord_event(
+            AuditEvent.SIGNUP, user.username, user=user, request=request
+        )
+        return self.render(
+            {"username": user.username, "nickname": user.nickname},
+            status.HTTP_201_CREATED,
+        )
+
+
+class AsyncLoginAPIView(AsyncAPIView):
+    # 로그인 기능
+    async def post(self, request):
+        # 필드 검증만 수행, 사용자 인증은 aauthenticate()로 수행
+        with phase("validate"):
+            data, errors = login_validator.validate(request.data)
+        if errors is not None:
+            return self.render(errors, status.HTTP_400_BAD_REQUEST)
+
+        username = data["username"]
+
+        # 시도 제한 확인 (제한된 요청은 비밀번호 해시 없이 429로 거절)
+        # (거절된 시도도 대입 공격 추적을 위해 감사 기록에 남김)
+        limiter = get_login_rate_limiter()
+        if limiter is not None:
+            try:
+                await limiter.acheck(username, get_client_ip(request))
+            except LoginThrottled:
+                await arecord_event(
+                    AuditEvent.LOGIN_THROTTLED, username, request=request
+                )
+                raise
+
+        # 사용자 인증 (비밀번호 검증은 이벤트 루프 밖에서 수행)
+        with phase("authenticate"):
+            user = await aauthenticate(username=username, password=data["password"])
+        if not user:
+            if limiter is not None:
+                await limiter.afailure(username)
+            await arecord_event(AuditEvent.LOGIN_FAILURE, username, request=request)
+            return self.render(INVALID_CREDENTIALS_ERROR, status.HTTP_400_BAD_REQUEST)
+
+        if limiter is not None:
+            await limiter.asuccess(username)
+        await arecord_event(
+            AuditEvent.LOGIN_SUCCESS, username, user=user, request=request
+        )
+
+        return self.render(issue_tokens(user), status.HTTP_200_OK)
+
+
+class AsyncAuthTestAPIView(AsyncAPIView):
+    requires_authentication = True
+
+    # 인증 테스트 기능
+    async def get(self, request):
+        return self.render(AUTH_SUCCESS_RESPONSE, status.HTTP_200_OK)
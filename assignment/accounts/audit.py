@@ -0,0 +1,230 @@
+"""
+로그인/회원가입 감사 기록 모듈
+
+로그인 성공/실패와 회원가입마다 감사 기록(AuditEvent)을 남기되, 요청 처리 중에 DB 쓰기를 하지 않도록
+프로세스 내 대기열에 추가만 하고 백그라운드 스레드가 모아서 저장합니다.
+
+- 저장 시점: 대기열에 BATCH_SIZE개가 모이거나 FLUSH_INTERVAL(초)이 지나면 bulk_create로 저장
+- 과부하: 대기열(MAX_QUEUE)이 가득 차면 요청을 기다리게 하지 않고 기록을 버린 뒤 dropped로 집계
+  (/metrics/의 accounts_audit_* 지표로 확인)
+- last_login: 로그인 성공 시 사용자별 최근 시각만 보관하여 같은 주기에 bulk_update로 한 번에 갱신
+- 종료: 프로세스 정상 종료 시(atexit) 남은 기록 저장 (gunicorn 워커의 graceful shutdown 포함)
+"""
+
+import atexit
+import ipaddress
+import logging
+import threading
+from collections import deque
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, router
+from django.utils import timezone
+
+from .models import AuditEvent, User
+from .ratelimit import get_client_ip
+from .sharding import encode_user_id
+
+logger = logging.getLogger(__name__)
+
+
+def _ip_address(request):
+    # 유효한 IP 주소만 저장 (프록시 헤더 값이 잘못된 경우 None)
+    if request is None:
+        return None
+    try:
+        return str(ipaddress.ip_address(get_client_ip(request)))
+    except ValueError:
+        return None
+
+
+class AuditLog:
+    """
+    감사 기록 대기열과 백그라운드 저장 스레드
+    """
+
+    def __init__(self, max_queue=10000, batch_size=500, flush_interval=1.0):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._events = deque()
+        # (DB 별칭, pk) -> 최근 로그인 시각
+        self._last_logins = {}
+        self._thread = None
+        self._closed = False
+        self._counters = {"written": 0, "dropped": 0, "failed": 0, "last_logins": 0}
+
+    def record(self, event, username, user=None, request=None):
+        """
+        감사 기록을 대기열에 추가 (대기열이 가득 차면 False)
+        - 로그인 성공 기록은 사용자의 last_login 갱신도 함께 예약
+        """
+        now = timezone.now()
+        entry = AuditEvent(
+            event=event,
+            username=(username or "")[:150],
+            user_id=encode_user_id(user) if user is not None else None,
+            ip_address=_ip_address(request),
+            created_at=now,
+        )
+        if event == AuditEvent.LOGIN_SUCCESS and user is not None:
+            last_login = (router.db_for_write(User, instance=user), user.pk)
+        else:
+            last_login = None
+
+        with self._condition:
+            if self._closed or len(self._events) >= self.max_queue:
+                self._counters["dropped"] += 1
+                return False
+            self._events.append(entry)
+            if last_login is not None and (
+                last_login in self._last_logins
+                or len(self._last_logins) < self.max_queue
+            ):
+                self._last_logins[last_login] = now
+            if len(self._events) >= self.batch_size:
+                self._condition.notify()
+            self._start()
+        return True
+
+    def _start(self):
+        # self._condition을 잡은 상태에서 호출
+        if self._thread is None:
+            atexit.register(self.close)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="accounts-audit", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._events) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                closed = self._closed
+            if self.flush():
+                # 워커 스레드의 DB 연결도 CONN_MAX_AGE에 따라 정리
+                close_old_connections()
+            if closed:
+                return
+
+    def flush(self):
+        """
+        대기열의 기록과 예약된 last_login을 모두 저장하고 저장 시도한 기록 수 반환
+        """
+        with self._flush_lock:
+            with self._condition:
+                events = list(self._events)
+                self._events.clear()
+                last_logins, self._last_logins = self._last_logins, {}
+
+            for start in range(0, len(events), self.batch_size):
+                batch = events[start : start + self.batch_size]
+                try:
+                    AuditEvent.objects.bulk_create(batch)
+                except Exception:
+                    logger.exception("Failed to write %d audit events", len(batch))
+                    self._count("failed", len(batch))
+                else:
+                    self._count("written", len(batch))
+
+            self._update_last_logins(last_logins)
+            return len(events) + len(last_logins)
+
+    def _update_last_logins(self, last_logins):
+        by_database = {}
+        for (using, pk), logged_in_at in last_logins.items():
+            by_database.setdefault(using, []).append(
+                User(pk=pk, last_login=logged_in_at)
+            )
+        for using, users in by_database.items():
+            try:
+                User.objects.using(using).bulk_update(
+                    users, ["last_login"], batch_size=self.batch_size
+                )
+            except Exception:
+                logger.exception("Failed to update last_login of %d users", len(users))
+            else:
+                self._count("last_logins", len(users))
+
+    def _count(self, name, value):
+        with self._condition:
+            self._counters[name] += value
+
+    def close(self, timeout=5.0):
+        """
+        새 기록을 받지 않고 저장 스레드를 종료한 뒤 남은 기록 저장
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    def stats(self):
+        with self._condition:
+            return {
+                **self._counters,
+                "queued": len(self._events),
+                "pending_last_logins": len(self._last_logins),
+            }
+
+
+_audit_log = None
+_audit_log_lock = threading.Lock()
+
+
+def get_audit_log():
+    """
+    settings.AUDIT_LOG으로 만든 프로세스 내 감사 기록기, 비활성화된 경우 None
+    """
+    global _audit_log
+    config = getattr(settings, "AUDIT_LOG", {})
+    if not config.get("ENABLED", False):
+        return None
+    if _audit_log is None:
+        with _audit_log_lock:
+            if _audit_log is None:
+                _audit_log = AuditLog(
+                    max_queue=config.get("MAX_QUEUE", 10000),
+                    batch_size=config.get("BATCH_SIZE", 500),
+                    flush_interval=config.get("FLUSH_INTERVAL", 1.0),
+                )
+    return _audit_log
+
+
+def reset_audit_log():
+    """
+    감사 기록기 종료 후 초기화 (테스트, 설정 변경 후 사용)
+    """
+    global _audit_log
+    with _audit_log_lock:
+        audit_log, _audit_log = _audit_log, None
+    if audit_log is not None:
+        atexit.unregister(audit_log.close)
+        audit_log.close()
+
+
+def record_event(event, username, user=None, request=None):
+    """
+    감사 기록 추가 (감사 기록이 비활성화된 경우 아무 동작도 하지 않음)
+    """
+    audit_log = get_audit_log()
+    if audit_log is not None:
+        audit_log.record(event, username, user=user, request=request)
+
+
+async def arecord_event(event, username, user=None, request=None):
+    """
+    record_event()의 비동기 버전 (대기열 잠금과 저장 스레드 시작을 이벤트 루프 밖에서 수행)
+    """
+    if get_audit_log() is not None:
+        await sync_to_async(record_event, thread_sensitive=False)(
+            event, username, user=user, request=request
+        )
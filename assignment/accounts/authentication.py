@@ -0,0 +1,205 @@
+"""
+JWT 인증 백엔드 모듈
+
+기본 JWTAuthentication은 토큰 검증 후 매 요청마다 user_id로 User 테이블을 조회합니다.
+이 모듈의 인증 클래스는 토큰에 서명된 클레임(id, username, nickname, is_active)만으로
+사용자 객체를 구성하여 보호된 API에서 DB 조회를 생략합니다.
+
+- StatelessJWTAuthentication: 기본 인증 클래스, 설정(JWT_VERIFY_USER_IN_DB)에 따라 DB 검증 여부 결정
+- VerifiedJWTAuthentication: 최신 사용자 상태가 필요한 API에서 명시적으로 사용하는 DB 검증 모드
+
+JWT_VERIFY_USER_IN_DB 설정에 따른 DB 검증은 accounts.cache.user_cache를 거쳐 반복 조회를 줄입니다.
+(다른 워커의 변경이나 QuerySet.update()는 시그널로 무효화되지 않으므로 최대 USER_CACHE["TTL"] 동안 이전 상태로 인증)
+VerifiedJWTAuthentication은 캐시를 사용하지 않고 매 요청 사용자를 조회합니다.
+사용자는 읽기 복제본이 있으면 복제본에서 조회합니다 (가입 직후 사용자는 기본 DB, accounts.routers).
+사용자 샤드가 있으면 토큰의 user_id에 기록된 샤드만 조회합니다 (accounts.sharding).
+서명 검증을 통과한 토큰은 accounts.cache.token_cache에 보관하여 같은 토큰의 반복 검증을 생략합니다.
+로그아웃 등으로 폐기된 토큰은 accounts.denylist.token_denylist(메모리)로 확인하여 DB 조회 없이 거절합니다.
+"""
+
+import copy
+import time
+
+from django.conf import settings
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .cache import token_cache, token_cache_key, user_cache
+from .denylist import token_denylist
+from .routers import primary_if_written
+from .sharding import user_queryset
+
+
+class ClaimsUser(TokenUser):
+    """
+    토큰 클레임 기반의 경량 사용자 객체
+    - DB에 저장되지 않으며, 토큰에 담긴 값만 읽어 제공
+    """
+
+    @cached_property
+    def nickname(self):
+        return self.token.get("nickname", "")
+
+    @cached_property
+    def is_active(self):
+        # is_active 클레임이 없는 이전 토큰은 발급 시점에 활성 사용자였던 것으로 간주
+        return self.token.get("is_active", True)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    토큰 클레임만으로 사용자를 구성하는 JWT 인증 클래스
+    - verify_user가 None이면 settings.JWT_VERIFY_USER_IN_DB 값을 따름
+    - verify_user가 True이면 기본 JWTAuthentication처럼 DB에서 사용자를 조회
+    - use_user_cache가 True이면 DB 조회 결과를 user_cache에 보관 (최대 TTL 동안 이전 상태 허용)
+    """
+
+    verify_user = None
+    use_user_cache = True
+
+    def should_verify_user(self):
+        if self.verify_user is not None:
+            return self.verify_user
+        return getattr(settings, "JWT_VERIFY_USER_IN_DB", False)
+
+    def get_validated_token(self, raw_token):
+        validated_token = self.get_verified_token(raw_token)
+
+        # 폐기된 토큰 거부
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if jti is not None and token_denylist.is_revoked(jti):
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+
+        return validated_token
+
+    def get_verified_token(self, raw_token):
+        """
+        서명 검증을 통과한 토큰 (token_cache에 있으면 디코딩과 서명 검증 생략)
+        - 검증 실패(만료, 잘못된 토큰)는 캐시하지 않으므로 기존과 같은 예외 발생
+        - 캐시된 토큰 객체는 요청 간에 공유되므로 읽기 전용으로 사용
+        """
+        config = getattr(settings, "TOKEN_CACHE", {})
+        if not config.get("ENABLED", False):
+            return super().get_validated_token(raw_token)
+
+        key = token_cache_key(raw_token)
+        validated_token = token_cache.get(key)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+
+            # 토큰 만료 시각이 지나면 캐시에서도 만료되도록 유효 시간 제한
+            exp = validated_token.get("exp")
+            if exp is not None:
+                ttl = min(exp - time.time(), token_cache.ttl)
+                if ttl > 0:
+                    token_cache.set(key, validated_token, ttl=ttl)
+
+        return validated_token
+
+    def get_user(self, validated_token):
+        # DB 검증 모드인 경우 캐시를 거쳐 사용자 조회
+        if self.should_verify_user():
+            return self.get_db_user(validated_token)
+
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        user = ClaimsUser(validated_token)
+
+        # 비활성 사용자로 발급된 토큰 거부
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        return user
+
+    def get_db_user(self, validated_token):
+        """
+        JWTAuthentication.get_user와 같은 검증을 수행하되, User 조회 결과를 캐시
+        """
+        user_id = self.get_user_id(validated_token)
+
+        user = user_cache.get(user_id) if self.use_user_cache else None
+        if user is None:
+            try:
+                with primary_if_written(f"user:{user_id}"):
+                    user = user_queryset(user_id).get()
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            if self.use_user_cache:
+                user_cache.set(user_id, user)
+
+        return self.check_db_user(copy.copy(user), validated_token)
+
+    async def aauthenticate(self, request):
+        """
+        authenticate()의 비동기 버전 (ASGI 비동기 뷰에서 사용)
+        - 토큰 디코딩과 서명 검증은 I/O가 없으므로 이벤트 루프에서 바로 수행
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        if not self.should_verify_user():
+            return self.get_user(validated_token)
+
+        user_id = self.get_user_id(validated_token)
+
+        user = user_cache.get(user_id) if self.use_user_cache else None
+        if user is None:
+            try:
+                with primary_if_written(f"user:{user_id}"):
+                    user = await user_queryset(user_id).aget()
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            if self.use_user_cache:
+                user_cache.set(user_id, user)
+
+        return self.check_db_user(copy.copy(user), validated_token)
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+    def check_db_user(self, user, validated_token):
+        """
+        DB에서 조회한 사용자의 활성 상태와 비밀번호 변경 여부 확인
+        - user는 캐시된 인스턴스가 요청 간에 변경되지 않도록 복사본을 전달
+        """
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    "The user's password has been changed.", code="password_changed"
+                )
+
+        return user
+
+
+class VerifiedJWTAuthentication(StatelessJWTAuthentication):
+    """
+    항상 DB에서 사용자를 조회하는 JWT 인증 클래스
+    - 권한 변경, 비활성화 등 최신 사용자 상태가 필요한 API에서 authentication_classes로 지정
+    - 다른 워커의 변경도 바로 반영되도록 사용자 캐시를 사용하지 않음
+    """
+
+    verify_user = True
+    use_user_cache = False
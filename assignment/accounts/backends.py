@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from . import hashing
+from .routers import primary_if_written
+from .sharding import shard_for_username
+
+UserModel = get_user_model()
+
+
+class HashPoolModelBackend(ModelBackend):
+    """
+    비밀번호 검증을 accounts.hashing 작업 풀에서 수행하는 인증 백엔드
+    - 동작은 ModelBackend와 같으며, 해시 갱신(업그레이드)도 작업 풀에서 계산
+    - 사용자 샤드가 있으면 username의 샤드만 조회
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        try:
+            # 가입 직후에는 복제본 대신 기본 DB에서 조회
+            with primary_if_written(f"username:{username}"):
+                user = UserModel._default_manager.db_manager(
+                    shard_for_username(username)
+                ).get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # 존재하지 않는 사용자도 해시를 한 번 계산하여 응답 시간 차이를 줄임
+            hashing.make_password(password)
+        else:
+            if self.check_password(user, password) and self.user_can_authenticate(user):
+                return user
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        try:
+            with primary_if_written(f"username:{username}"):
+                user = await UserModel._default_manager.db_manager(
+                    shard_for_username(username)
+                ).aget_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            await hashing.amake_password(password)
+        else:
+            if await self.acheck_password(
+                user, password
+            ) and self.user_can_authenticate(user):
+                return user
+
+    def check_password(self, user, password):
+        is_correct, must_update = hashing.verify_password(password, user.password)
+
+        # 저장된 해시의 알고리즘/작업 비용이 현재 설정과 다르면 갱신
+        if is_correct and must_update:
+            user.password = hashing.make_password(password)
+            user.save(update_fields=["password"])
+
+        return is_correct
+
+    async def acheck_password(self, user, password):
+        is_correct, must_update = await hashing.averify_password(
+            password, user.password
+        )
+
+        if is_correct and must_update:
+            user.password = await hashing.amake_password(password)
+            await user.asave(update_fields=["password"])
+
+        return is_correct
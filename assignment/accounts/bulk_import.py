@@ -0,0 +1,163 @@
+"""
+사용자 대량 가져오기 모듈
+
+제휴사에서 받은 username/password/nickname 목록(JSONL 또는 CSV)을 스트림으로 읽어
+청크 단위로 회원가입 처리합니다. 파일 전체를 메모리에 올리지 않으며,
+각 행의 처리 결과(created / duplicate / invalid)를 청크마다 순서대로 반환합니다.
+
+- 행 검증은 SignupSerializer와 같은 규칙 사용 (accounts.validation)
+- 비밀번호 해시는 여러 프로세스에서 병렬로 계산
+- 저장은 청크마다 bulk_create 한 번으로 수행 (사용자 샤드가 있으면 샤드마다 한 번)
+"""
+
+import csv
+import json
+from contextlib import nullcontext
+from itertools import islice
+
+from django.contrib.auth import hashers
+from django.db import router
+
+from .hashing import create_hash_executor
+from .models import User
+from .sharding import shard_for_username
+from .validation import signup_validator
+
+FORMATS = ("jsonl", "csv")
+
+CREATED = "created"
+DUPLICATE = "duplicate"
+INVALID = "invalid"
+
+
+def read_rows(stream, fmt="jsonl", encoding="utf-8"):
+    """
+    스트림에서 한 행씩 읽어 (행 번호, 데이터) 반환
+    - stream은 텍스트/바이트 줄을 순회할 수 있는 객체 (파일, HttpRequest 등)
+    - JSON 형식이 아닌 행은 데이터 대신 None 반환
+    """
+    lines = (
+        line if isinstance(line, str) else line.decode(encoding) for line in stream
+    )
+
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_no, row if isinstance(row, dict) else None
+
+
+def import_users(rows, chunk_size=1000, workers=1):
+    """
+    (행 번호, 데이터) 목록을 청크 단위로 저장하고 행별 결과를 순서대로 반환
+    - workers가 2 이상이면 비밀번호 해시를 프로세스 풀에서 병렬 계산
+    """
+    rows = iter(rows)
+    executor = create_hash_executor(workers) if workers > 1 else None
+
+    with executor or nullcontext():
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            yield from _import_chunk(chunk, executor)
+
+
+def _import_chunk(chunk, executor):
+    results = []
+    pending = {}
+
+    # 1. 행 검증 및 청크 내 중복 확인
+    for line_no, row in chunk:
+        if row is None:
+            results.append(
+                _result(line_no, None, INVALID, {"error": ["Malformed row."]})
+            )
+            continue
+
+        data, errors = signup_validator.validate(row)
+        if errors is not None:
+            results.append(_result(line_no, row.get("username"), INVALID, errors))
+            continue
+
+        if data["username"] in pending:
+            results.append(_result(line_no, data["username"], DUPLICATE))
+            continue
+
+        result = _result(line_no, data["username"], CREATED)
+        pending[data["username"]] = (result, data)
+        results.append(result)
+
+    if not pending:
+        return results
+
+    # 2. 이미 가입된 사용자 확인 (저장할 DB마다 조회 한 번)
+    for using, usernames in _group_by_database(pending).items():
+        existing = set(
+            User.objects.using(using)
+            .filter(username__in=usernames)
+            .values_list("username", flat=True)
+        )
+        for username in existing:
+            result, _ = pending.pop(username)
+            result["status"] = DUPLICATE
+
+    if not pending:
+        return results
+
+    # 3. 비밀번호 해시 병렬 계산
+    passwords = [data["password"] for _, data in pending.values()]
+    if executor is None:
+        encoded = [hashers.make_password(password) for password in passwords]
+    else:
+        encoded = list(executor.map(hashers.make_password, passwords))
+
+    users = [
+        User(username=data["username"], nickname=data["nickname"], password=password)
+        for (_, data), password in zip(pending.values(), encoded)
+    ]
+
+    # 4. 청크 단위 저장, 조회 이후 동시에 가입된 사용자는 무시 후 결과에 반영
+    by_username = {user.username: user for user in users}
+    for using, usernames in _group_by_database(by_username).items():
+        User.objects.using(using).bulk_create(
+            [by_username[username] for username in usernames], ignore_conflicts=True
+        )
+        stored = dict(
+            User.objects.using(using)
+            .filter(username__in=usernames)
+            .values_list("username", "password")
+        )
+        for username in usernames:
+            if stored.get(username) != by_username[username].password:
+                pending[username][0]["status"] = DUPLICATE
+
+    return results
+
+
+def _group_by_database(usernames):
+    """
+    username을 저장할 DB별로 분류 (샤딩하지 않으면 모두 라우터가 선택한 DB)
+    """
+    default = router.db_for_write(User)
+    groups = {}
+    for username in usernames:
+        using = shard_for_username(username) or default
+        groups.setdefault(using, []).append(username)
+    return groups
+
+
+def _result(line_no, username, status, errors=None):
+    result = {"line": line_no, "username": username, "status": status}
+    if errors is not None:
+        result["errors"] = errors
+    return result
@@ -0,0 +1,113 @@
+"""
+프로세스 내 사용자/토큰 캐시 모듈
+
+JWT 인증의 DB 검증 모드(JWT_VERIFY_USER_IN_DB)는 매 요청마다 user_id로 User를 조회합니다.
+소수의 사용자가 대부분의 트래픽을 차지하므로, 크기가 제한된 LRU/TTL 캐시로
+반복 조회를 줄입니다.
+
+- 항목 수는 MAX_SIZE로 제한되며, 초과 시 가장 오래 사용되지 않은 항목부터 제거
+- User 저장/삭제 시그널(accounts.signals)로 같은 프로세스의 항목을 즉시 무효화
+- QuerySet.update() 등 시그널 없는 변경과 다른 프로세스의 변경은 TTL이 지나야 반영
+  (최신 상태가 필요한 VerifiedJWTAuthentication은 이 캐시를 사용하지 않음)
+
+같은 클라이언트는 같은 액세스 토큰을 연속으로 보내므로, 서명 검증을 통과한 토큰도
+원본 토큰의 다이제스트를 키로 token_cache에 보관하여 반복 요청의 디코딩과 서명 검증을 생략합니다.
+(항목 유효 시간은 토큰의 exp를 넘지 않음, 폐기 여부는 캐시와 관계없이 매 요청 확인)
+"""
+
+import hashlib
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class LRUCache:
+    """
+    스레드 안전한 LRU/TTL 캐시
+    - hits/misses/evictions 카운터를 stats()로 제공
+    """
+
+    def __init__(self, max_size=1024, ttl=60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            # 만료된 항목은 제거 후 miss로 처리
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+
+            # 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "max_size": self.max_size,
+            }
+
+
+_user_cache_settings = getattr(settings, "USER_CACHE", {})
+
+# JWT 인증에서 사용하는 user_id -> User 캐시
+user_cache = LRUCache(
+    max_size=_user_cache_settings.get("MAX_SIZE", 1024),
+    ttl=_user_cache_settings.get("TTL", 60),
+)
+
+_token_cache_settings = getattr(settings, "TOKEN_CACHE", {})
+
+# JWT 인증에서 사용하는 토큰 다이제스트 -> 검증된 토큰 캐시
+token_cache = LRUCache(
+    max_size=_token_cache_settings.get("MAX_SIZE", 10000),
+    ttl=_token_cache_settings.get("TTL", 300),
+)
+
+
+def token_cache_key(raw_token):
+    """
+    원본 토큰(bytes 또는 str)의 다이제스트, 토큰 자체를 키로 보관하지 않음
+    """
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode()
+    return hashlib.blake2b(raw_token, digest_size=32).digest()
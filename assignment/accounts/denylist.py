@@ -0,0 +1,188 @@
+"""
+토큰 폐기 목록(denylist) 모듈
+
+로그아웃, 리프레시 토큰 교체(rotation) 시 기존 토큰의 jti를 만료 시각(exp)까지 폐기 목록에 보관하고,
+인증된 요청마다 폐기 여부를 확인합니다. 요청마다 DB를 조회하지 않도록 프로세스 메모리에 보관합니다.
+
+- 블룸 필터: 폐기되지 않은 토큰(대부분의 요청)은 비트 배열 확인만으로 O(1)에 통과
+- 정확한 집합(jti -> exp): 블룸 필터가 "있을 수 있음"이라고 답한 경우에만 확인하여 오탐 제거
+- 항목은 토큰 exp가 지나면 제거되며 (만료된 토큰은 서명 검증에서 이미 거절됨),
+  제거된 항목이 많아지면 블룸 필터를 남은 항목으로 다시 구성
+- 폐기 시 Django 캐시(settings.TOKEN_DENYLIST["CACHE_ALIAS"])에도 기록하여 다른 프로세스와 공유
+- 리프레시 토큰 재사용 확인은 항상 캐시까지 조회, 액세스 토큰은 CHECK_SHARED가 True인 경우에만 캐시 조회
+  (기본값은 각 프로세스의 메모리만 확인하므로, 다른 워커에서 폐기한 액세스 토큰은 만료 전까지 통과할 수 있음)
+"""
+
+import hashlib
+import heapq
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class BloomFilter:
+    """
+    고정 크기 블룸 필터 (capacity개 저장 시 오탐률이 error_rate 이하가 되도록 크기 결정)
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001):
+        self.capacity = capacity
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # 128비트 해시 하나를 둘로 나누어 hash_count개의 위치 계산 (double hashing)
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class TokenDenylist:
+    """
+    폐기된 토큰 jti 목록 (블룸 필터 + 정확한 집합, 항목별 exp 만료)
+    """
+
+    def __init__(
+        self, capacity=100000, error_rate=0.001, cache_alias=None, check_shared=False
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.cache_alias = cache_alias
+        self.check_shared = check_shared
+        self._lock = threading.Lock()
+        self.clear()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias] if self.cache_alias else None
+
+    def clear(self):
+        with self._lock:
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            self._entries = {}
+            self._expiry = []
+
+    def _purge(self, now):
+        expiry = self._expiry
+        entries = self._entries
+        while expiry and expiry[0][0] <= now:
+            exp, jti = heapq.heappop(expiry)
+            if entries.get(jti) == exp:
+                del entries[jti]
+
+        # 블룸 필터에서는 항목을 지울 수 없으므로, 설계 용량을 넘으면 남은 항목으로 다시 구성
+        # (남은 항목이 용량을 넘는 경우 용량을 늘려 오탐률 유지)
+        if self._bloom.count >= self._bloom.capacity:
+            self._bloom = BloomFilter(
+                max(self.capacity, len(entries) * 2), self.error_rate
+            )
+            for jti in entries:
+                self._bloom.add(jti)
+
+    def _add_local(self, jti, exp, now):
+        """
+        메모리에 항목 추가, 이미 폐기된 항목이면 False 반환
+        """
+        with self._lock:
+            self._purge(now)
+            if self._entries.get(jti, 0) > now:
+                return False
+            if jti not in self._entries:
+                self._bloom.add(jti)
+            self._entries[jti] = exp
+            heapq.heappush(self._expiry, (exp, jti))
+            return True
+
+    def revoke(self, jti, exp, now=None):
+        """
+        토큰을 exp까지 폐기, 다른 프로세스와 공유하기 위해 캐시에도 기록
+        """
+        now = time.time() if now is None else now
+        if exp <= now:
+            return
+
+        self._add_local(jti, exp, now)
+        if self.cache is not None:
+            self.cache.set(self._cache_key(jti), exp, timeout=math.ceil(exp - now))
+
+    def claim(self, jti, exp, now=None):
+        """
+        토큰을 한 번만 사용할 수 있도록 폐기 목록에 원자적으로 추가 (리프레시 토큰 교체용)
+        - 이미 폐기된 토큰이면 False 반환
+        """
+        now = time.time() if now is None else now
+        if exp <= now:
+            return False
+
+        if self.cache is not None and not self.cache.add(
+            self._cache_key(jti), exp, timeout=math.ceil(exp - now)
+        ):
+            # 다른 프로세스에서 이미 사용(폐기)한 토큰
+            self._add_local(jti, exp, now)
+            return False
+
+        return self._add_local(jti, exp, now)
+
+    def is_revoked(self, jti, now=None, shared=None):
+        """
+        폐기 여부 확인
+        - shared(기본값 check_shared)가 True이면 메모리에 없는 경우 캐시에서도 확인
+        """
+        now = time.time() if now is None else now
+        if jti in self._bloom:
+            exp = self._entries.get(jti)
+            if exp is not None and exp > now:
+                return True
+
+        if shared is None:
+            shared = self.check_shared
+        if shared and self.cache is not None:
+            exp = self.cache.get(self._cache_key(jti))
+            if exp is not None:
+                # 다른 프로세스에서 폐기한 토큰은 이후 메모리에서 확인
+                self._add_local(jti, exp, now)
+                return True
+        return False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bloom_count": self._bloom.count,
+                "bloom_bytes": len(self._bloom.bits),
+            }
+
+    @staticmethod
+    def _cache_key(jti):
+        return f"token-denylist:{jti}"
+
+
+_denylist_settings = getattr(settings, "TOKEN_DENYLIST", {})
+
+# 인증 클래스와 리프레시/로그아웃 API에서 사용하는 폐기 목록
+token_denylist = TokenDenylist(
+    capacity=_denylist_settings.get("CAPACITY", 100000),
+    error_rate=_denylist_settings.get("ERROR_RATE", 0.001),
+    cache_alias=_denylist_settings.get("CACHE_ALIAS", "default"),
+    check_shared=_denylist_settings.get("CHECK_SHARED", False),
+)
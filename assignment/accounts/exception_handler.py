@@ -1,6 +1,16 @@
+from functools import lru_cache
 from rest_framework.views import exception_handler
 from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
 from rest_framework.response import Response
+from .renderers import PreEncodedDict
+
+
+@lru_cache(maxsize=None)
+def error_envelope(code, message):
+    """
+    에러 응답 본문, 코드/메시지 조합마다 한 번만 만들고 인코딩 결과 재사용
+    """
+    return PreEncodedDict({"error": {"code": code, "message": message}})
 
 
 def custom_exception_handler(exc, context):
@@ -11,7 +21,11 @@ def custom_exception_handler(exc, context):
         and "error" in exc.detail
     ):
         # 예외 객체의 원본 데이터를 기반으로 응답 생성
-        return Response(exc.detail, status=exc.status_code)
+        headers = {}
+        # 재시도 대기 시간이 있는 예외(503, 429 등)는 Retry-After 헤더 추가
+        if getattr(exc, "wait", None):
+            headers["Retry-After"] = "%d" % exc.wait
+        return Response(exc.detail, status=exc.status_code, headers=headers)
 
     # 기본 예외 처리를 호출
     response = exception_handler(exc, context)
@@ -22,34 +36,44 @@ def custom_exception_handler(exc, context):
 
     # 인증 관련 예외 처리 (401 에러)
     if isinstance(exc, (AuthenticationFailed, NotAuthenticated)):
-        error_code = "AUTHENTICATION_ERROR"
-        error_message = "인증에 실패했습니다."
-
-        # AuthenticationFailed 예외 세부 처리
-        if isinstance(exc, AuthenticationFailed):
-            error_code = "AUTHENTICATION_FAILED"
-
-            # 오류 메시지에 따라 다른 코드 반환
-            error_str = str(exc.detail).lower()
-            if "expired" in error_str:
-                error_code = "TOKEN_EXPIRED"
-                error_message = "토큰이 만료되었습니다."
-            elif "invalid" in error_str:
-                error_code = "INVALID_TOKEN"
-                error_message = "토큰이 유효하지 않습니다."
-            else:
-                error_message = "잘못된 인증 정보입니다."
-
-        # NotAuthenticated 예외 세부 처리
-        elif isinstance(exc, NotAuthenticated):
-            error_code = "TOKEN_NOT_FOUND"
-
-            # 오류 메시지에 따라 다른 메시지 반환
-            error_str = str(exc.detail).lower()
-            if error_str or "no token" in error_str:
-                error_message = "토큰이 없습니다."
-
         # 응답 데이터 구조화
-        response.data = {"error": {"code": error_code, "message": error_message}}
+        response.data = error_envelope(*authentication_error(exc))
 
     return response
+
+
+def authentication_error(exc):
+    """
+    인증 예외의 에러 코드와 메시지 (에러 응답과 토큰 일괄 검증 결과에서 공통 사용)
+    """
+    error_code = "AUTHENTICATION_ERROR"
+    error_message = "인증에 실패했습니다."
+
+    # AuthenticationFailed 예외 세부 처리
+    if isinstance(exc, AuthenticationFailed):
+        error_code = "AUTHENTICATION_FAILED"
+
+        # 오류 메시지에 따라 다른 코드 반환
+        error_str = str(exc.detail).lower()
+        if "revoked" in error_str:
+            error_code = "TOKEN_REVOKED"
+            error_message = "폐기된 토큰입니다."
+        elif "expired" in error_str:
+            error_code = "TOKEN_EXPIRED"
+            error_message = "토큰이 만료되었습니다."
+        elif "invalid" in error_str:
+            error_code = "INVALID_TOKEN"
+            error_message = "토큰이 유효하지 않습니다."
+        else:
+            error_message = "잘못된 인증 정보입니다."
+
+    # NotAuthenticated 예외 세부 처리
+    elif isinstance(exc, NotAuthenticated):
+        error_code = "TOKEN_NOT_FOUND"
+
+        # 오류 메시지에 따라 다른 메시지 반환
+        error_str = str(exc.detail).lower()
+        if error_str or "no token" in error_str:
+            error_message = "토큰이 없습니다."
+
+    return error_code, error_message
@@ -0,0 +1,117 @@
+"""
+사용자 목록 내보내기 모듈
+
+운영 대조용으로 사용자 테이블 전체(id, username, nickname, date_joined, is_active)를
+NDJSON 또는 CSV로 스트리밍합니다. 사용자 수와 관계없이 메모리 사용량이 일정하도록
+pk 순서로 chunk_size개씩 keyset 방식(pk > 이전 페이지의 마지막 pk)으로 조회하고, 페이지마다 문자열 하나로 반환합니다.
+
+- OFFSET을 사용하지 않으므로 뒤쪽 페이지도 pk 인덱스로 바로 찾아 페이지당 조회 비용이 일정
+- 사용자 샤드가 있으면 샤드 순서대로 내보내며, id는 토큰의 user_id 클레임과 같은 값 (accounts.sharding)
+- 샤드가 하나이면 라우터가 고른 DB(읽기 복제본) 하나에서 끝까지 조회
+"""
+
+import csv
+import io
+import json
+
+from django.db import router
+
+from .models import User
+from .sharding import SHARD_ID_SHIFT, get_shards
+
+FORMATS = ("ndjson", "csv")
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+FIELDS = ("id", "username", "nickname", "date_joined", "is_active")
+
+
+def _databases():
+    # (조회할 DB 별칭, id에 더할 샤드 번호 비트)
+    shards = get_shards()
+    if len(shards) == 1:
+        return [(router.db_for_read(User), 0)]
+    return [(shard, index << SHARD_ID_SHIFT) for index, shard in enumerate(shards)]
+
+
+def iter_pages(chunk_size=1000):
+    """
+    모든 사용자를 최대 chunk_size개씩 FIELDS 순서의 튜플 목록으로 반환
+    """
+    for using, id_offset in _databases():
+        last_pk = 0
+        while True:
+            queryset = (
+                User.objects.using(using)
+                .filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list(*FIELDS)[:chunk_size]
+            )
+            # 조회 결과를 QuerySet에 캐시하지 않음
+            page = list(queryset.iterator(chunk_size=chunk_size))
+            if not page:
+                break
+            last_pk = page[-1][0]
+            yield [(id_offset | pk, *values) for pk, *values in page]
+            if len(page) < chunk_size:
+                break
+
+
+def _ndjson(page):
+    return "".join(
+        json.dumps(
+            {
+                "id": user_id,
+                "username": username,
+                "nickname": nickname,
+                "date_joined": date_joined.isoformat(),
+                "is_active": is_active,
+            },
+            ensure_ascii=False,
+        )
+        + "\n"
+        for user_id, username, nickname, date_joined, is_active in page
+    )
+
+
+def _csv(page):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for user_id, username, nickname, date_joined, is_active in page:
+        writer.writerow(
+            [
+                user_id,
+                username,
+                nickname,
+                date_joined.isoformat(),
+                "true" if is_active else "false",
+            ]
+        )
+    return buffer.getvalue()
+
+
+def render_header(fmt):
+    """
+    fmt 형식의 머리글 (CSV만 열 이름 행, NDJSON은 빈 문자열)
+    """
+    if fmt != "csv":
+        return ""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(FIELDS)
+    return buffer.getvalue()
+
+
+def render_page(fmt, page):
+    """
+    iter_pages()의 페이지 하나를 fmt 형식의 문자열로 변환
+    """
+    return _csv(page) if fmt == "csv" else _ndjson(page)
+
+
+def export_users(fmt="ndjson", chunk_size=1000):
+    """
+    사용자 목록을 fmt 형식의 문자열 조각으로 반환 (CSV는 첫 조각이 머리글)
+    """
+    header = render_header(fmt)
+    if header:
+        yield header
+    for page in iter_pages(chunk_size):
+        yield render_page(fmt, page)
@@ -0,0 +1,64 @@
+"""
+작업 비용을 설정으로 조정할 수 있는 비밀번호 해셔 모듈
+
+Django 기본 해셔는 작업 비용(반복 횟수, 메모리 비용 등)이 클래스 속성으로 고정되어 있습니다.
+이 모듈의 해셔는 settings.PASSWORD_HASHER_OPTIONS 값을 읽어 환경별로 비용을 조정합니다.
+
+- 알고리즘 이름은 Django 기본 해셔와 같으므로 기존에 저장된 해시를 그대로 검증
+- 저장된 해시의 비용이 현재 설정과 다르면 must_update()가 True를 반환하여
+  로그인 성공 시 User.check_password()가 현재 설정으로 해시를 다시 저장
+- 사용할 해셔 목록은 settings.PASSWORD_HASHER_PROFILES에서 프로필 단위로 선택
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+def _option(name, default):
+    return getattr(settings, "PASSWORD_HASHER_OPTIONS", {}).get(name, default)
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return _option("PBKDF2_ITERATIONS", PBKDF2PasswordHasher.iterations)
+
+
+class TunableScryptPasswordHasher(ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return _option("SCRYPT_WORK_FACTOR", ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return _option("SCRYPT_BLOCK_SIZE", ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return _option("SCRYPT_PARALLELISM", ScryptPasswordHasher.parallelism)
+
+    @property
+    def maxmem(self):
+        return _option("SCRYPT_MAXMEM", ScryptPasswordHasher.maxmem)
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    argon2-cffi 패키지가 설치된 경우에만 사용 가능
+    """
+
+    @property
+    def time_cost(self):
+        return _option("ARGON2_TIME_COST", Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return _option("ARGON2_MEMORY_COST", Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return _option("ARGON2_PARALLELISM", Argon2PasswordHasher.parallelism)
@@ -0,0 +1,196 @@
+"""
+비밀번호 해시 작업 풀 모듈
+
+로그인의 비밀번호 검증과 회원가입의 비밀번호 해시는 CPU를 오래 점유하는 작업입니다.
+settings.PASSWORD_HASH_POOL["ENABLED"]가 True이면 이 작업을 크기가 제한된 프로세스 풀에서
+실행하여 요청 처리 스레드(WSGI) 또는 이벤트 루프(ASGI)가 해시 계산에 묶이지 않도록 합니다.
+
+- MAX_WORKERS: 해시 작업을 수행하는 프로세스 수
+- MAX_PENDING: 실행 중인 작업 외에 대기할 수 있는 작업 수
+- 대기열이 가득 차면 지연이 계속 늘어나는 대신 즉시 503(Retry-After 포함)으로 응답
+- 풀을 사용하지 않으면 같은 함수를 현재 프로세스에서 바로 실행
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .instrumentation import phase
+
+
+class HashPoolBusy(APIException):
+    """
+    해시 작업 대기열이 가득 찬 경우 발생하는 예외 (503, Retry-After 헤더 포함)
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = {
+        "error": {
+            "code": "SERVICE_BUSY",
+            "message": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+        }
+    }
+
+    def __init__(self, wait):
+        super().__init__()
+        self.wait = wait
+
+
+def _init_worker(password_hashers, hasher_options):
+    # 자식 프로세스에서 Django 설정을 로드하고 부모 프로세스의 해셔 설정을 그대로 적용
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    settings.PASSWORD_HASHERS = password_hashers
+    settings.PASSWORD_HASHER_OPTIONS = hasher_options
+
+
+def create_hash_executor(max_workers, start_method="spawn"):
+    """
+    현재 프로세스의 해셔 설정을 그대로 사용하는 해시 전용 ProcessPoolExecutor 생성
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_worker,
+        initargs=(
+            list(settings.PASSWORD_HASHERS),
+            dict(getattr(settings, "PASSWORD_HASHER_OPTIONS", {})),
+        ),
+    )
+
+
+class PasswordHashPool:
+    """
+    대기열 크기가 제한된 해시 전용 프로세스 풀
+    - 프로세스는 첫 작업 요청 시 생성되며, gunicorn --preload 이후 fork된 워커에서는 다시 생성
+    """
+
+    def __init__(
+        self, max_workers=2, max_pending=16, retry_after=1, start_method="spawn"
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self.start_method = start_method
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+        self._pid = None
+
+    def _ensure_executor(self):
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = create_hash_executor(
+                    self.max_workers, self.start_method
+                )
+                # 실행 중 + 대기 중인 작업 수 제한
+                self._slots = threading.BoundedSemaphore(
+                    self.max_workers + self.max_pending
+                )
+                self._pid = os.getpid()
+            return self._executor, self._slots
+
+    def submit(self, fn, *args):
+        executor, slots = self._ensure_executor()
+
+        # 빈 자리가 없으면 기다리지 않고 바로 거절
+        if not slots.acquire(blocking=False):
+            raise HashPoolBusy(self.retry_after)
+
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future
+
+    def run(self, fn, *args):
+        return self.submit(fn, *args).result()
+
+    async def arun(self, fn, *args):
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_hash_pool = None
+_hash_pool_lock = threading.Lock()
+
+
+def get_hash_pool():
+    """
+    설정에서 풀을 사용하도록 지정된 경우 공용 풀 반환, 아니면 None
+    """
+    global _hash_pool
+
+    pool_settings = getattr(settings, "PASSWORD_HASH_POOL", {})
+    if not pool_settings.get("ENABLED", False):
+        return None
+
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            _hash_pool = PasswordHashPool(
+                max_workers=pool_settings.get("MAX_WORKERS", 2),
+                max_pending=pool_settings.get("MAX_PENDING", 16),
+                retry_after=pool_settings.get("RETRY_AFTER", 1),
+                start_method=pool_settings.get("START_METHOD", "spawn"),
+            )
+        return _hash_pool
+
+
+def make_password(password):
+    """
+    비밀번호 해시 생성
+    """
+    pool = get_hash_pool()
+    with phase("hash"):
+        if pool is None:
+            return hashers.make_password(password)
+        return pool.run(hashers.make_password, password)
+
+
+def verify_password(password, encoded):
+    """
+    비밀번호 검증, (일치 여부, 해시 갱신 필요 여부) 반환
+    """
+    pool = get_hash_pool()
+    with phase("hash"):
+        if pool is None:
+            return hashers.verify_password(password, encoded)
+        return pool.run(hashers.verify_password, password, encoded)
+
+
+async def amake_password(password):
+    pool = get_hash_pool()
+    with phase("hash"):
+        if pool is None:
+            # 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+            return await sync_to_async(hashers.make_password, thread_sensitive=False)(
+                password
+            )
+        return await pool.arun(hashers.make_password, password)
+
+
+async def averify_password(password, encoded):
+    pool = get_hash_pool()
+    with phase("hash"):
+        if pool is None:
+            return await sync_to_async(hashers.verify_password, thread_sensitive=False)(
+                password, encoded
+            )
+        return await pool.arun(hashers.verify_password, password, encoded)
@@ -0,0 +1,340 @@
+"""
+요청별 구간 측정(instrumentation) 모듈
+
+로그인 지연 시간이 늘었을 때 비밀번호 해시, DB, JWT 서명, 직렬화/렌더링 중 어디에서 시간이 걸렸는지
+확인할 수 있도록 요청마다 구간별 시간을 기록합니다.
+
+- phase(name): 현재 요청의 구간 시간 측정 (요청 밖이거나 측정이 꺼져 있으면 아무 일도 하지 않음)
+- DB 쿼리: 연결 생성 시 execute_wrapper를 등록하여 쿼리 수와 시간 기록
+- InstrumentationMiddleware: 요청 단위로 측정을 시작하고,
+  SERVER_TIMING 설정 시 Server-Timing 응답 헤더로 구간별 시간 제공
+- registry: 뷰/구간별 Prometheus 히스토그램 (/metrics/에서 텍스트 형식으로 제공, 프로세스별 집계),
+  레이블은 URL 이름(일치하지 않으면 "unmatched")과 표준 HTTP 메서드(그 외는 "other")로 제한
+
+구간은 중첩될 수 있습니다. (예: validate 구간에 authenticate, db 구간 포함)
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.crypto import constant_time_compare
+from rest_framework.permissions import BasePermission
+
+# 히스토그램 구간 경계(초)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_timings = ContextVar("accounts_request_timings", default=None)
+
+
+def instrumentation_enabled():
+    return getattr(settings, "INSTRUMENTATION", {}).get("ENABLED", False)
+
+
+class RequestTimings:
+    """
+    요청 하나의 구간별 누적 시간(초)과 횟수
+    """
+
+    __slots__ = ("phases", "queries")
+
+    def __init__(self):
+        self.phases = {}
+        self.queries = 0
+
+    def add(self, name, duration):
+        total, count = self.phases.get(name, (0.0, 0))
+        self.phases[name] = (total + duration, count + 1)
+
+
+class _Phase:
+    __slots__ = ("name", "timings", "started")
+
+    def __init__(self, name, timings):
+        self.name = name
+        self.timings = timings
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timings.add(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_null_phase = _NullPhase()
+
+
+def phase(name):
+    """
+    현재 요청의 구간 시간을 측정하는 컨텍스트 매니저
+    """
+    timings = _timings.get()
+    if timings is None:
+        return _null_phase
+    return _Phase(name, timings)
+
+
+def query_wrapper(execute, sql, params, many, context):
+    """
+    DB 쿼리 수와 시간 기록 (connection.execute_wrappers에 등록)
+    """
+    timings = _timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add("db", time.perf_counter() - started)
+        timings.queries += 1
+
+
+def install_query_wrapper(sender, connection, **kwargs):
+    """
+    connection_created 시그널 수신기, 새 DB 연결에 query_wrapper 등록
+    """
+    if query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_wrapper)
+
+
+class Histogram:
+    """
+    레이블별 Prometheus 히스토그램 (누적 구간 개수, 합계, 개수)
+    """
+
+    def __init__(self, name, help_text, label_names, buckets=BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            counts = series[0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = {
+                labels: (list(counts), total, count)
+                for labels, (counts, total, count) in self._series.items()
+            }
+        for labels, (counts, total, count) in sorted(series.items()):
+            label_text = ",".join(
+                f'{name}="{value}"' for name, value in zip(self.label_names, labels)
+            )
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(
+                    f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{self.name}_bucket{{{label_text},le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total:.6f}")
+            lines.append(f"{self.name}_count{{{label_text}}} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    요청/구간/쿼리 수 히스토그램 모음
+    """
+
+    def __init__(self):
+        self.request_seconds = Histogram(
+            "accounts_request_seconds",
+            "Request latency in seconds.",
+            ("view", "method", "status"),
+        )
+        self.phase_seconds = Histogram(
+            "accounts_phase_seconds",
+            "Time spent per request phase in seconds.",
+            ("view", "phase"),
+        )
+        self.db_queries = Histogram(
+            "accounts_db_queries",
+            "SQL queries per request.",
+            ("view",),
+            buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+        )
+
+    def record(self, view, method, status, duration, timings):
+        self.request_seconds.observe((view, method, str(status)), duration)
+        for name, (total, _) in timings.phases.items():
+            self.phase_seconds.observe((view, name), total)
+        self.db_queries.observe((view,), timings.queries)
+
+    def clear(self):
+        for histogram in (self.request_seconds, self.phase_seconds, self.db_queries):
+            histogram.clear()
+
+    def render(self):
+        lines = []
+        for histogram in (self.request_seconds, self.phase_seconds, self.db_queries):
+            lines.extend(histogram.render())
+        lines.extend(_cache_metrics())
+        lines.extend(_audit_metrics())
+        return "\n".join(lines) + "\n"
+
+
+def _cache_metrics():
+    # 프로세스 내 캐시 카운터
+    from .cache import token_cache, user_cache
+    from .denylist import token_denylist
+
+    lines = []
+    for prefix, cache in (("user_cache", user_cache), ("token_cache", token_cache)):
+        stats = cache.stats()
+        for name in ("hits", "misses", "evictions"):
+            lines.append(f"# TYPE accounts_{prefix}_{name}_total counter")
+            lines.append(f"accounts_{prefix}_{name}_total {stats[name]}")
+        lines.append(f"# TYPE accounts_{prefix}_size gauge")
+        lines.append(f"accounts_{prefix}_size {stats['size']}")
+    lines.append("# TYPE accounts_token_denylist_size gauge")
+    lines.append(f"accounts_token_denylist_size {token_denylist.stats()['size']}")
+    return lines
+
+
+def _audit_metrics():
+    # 감사 기록 대기열 카운터 (감사 기록이 비활성화된 경우 생략)
+    from .audit import get_audit_log
+
+    audit_log = get_audit_log()
+    if audit_log is None:
+        return []
+
+    stats = audit_log.stats()
+    lines = []
+    for name in ("written", "dropped", "failed", "last_logins"):
+        lines.append(f"# TYPE accounts_audit_{name}_total counter")
+        lines.append(f"accounts_audit_{name}_total {stats[name]}")
+    lines.append("# TYPE accounts_audit_queued gauge")
+    lines.append(f"accounts_audit_queued {stats['queued']}")
+    return lines
+
+
+registry = MetricsRegistry()
+
+
+def server_timing(timings, total):
+    """
+    Server-Timing 헤더 값 (구간별 누적 시간, 밀리초)
+    """
+    entries = []
+    for name, (duration, _) in timings.phases.items():
+        if name == "db":
+            entries.append(
+                f'db;dur={duration * 1000:.2f};desc="{timings.queries} queries"'
+            )
+        else:
+            entries.append(f"{name};dur={duration * 1000:.2f}")
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+# 측정값 method 레이블로 사용하는 HTTP 메서드 (그 외는 "other")
+HTTP_METHODS = frozenset(
+    ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT")
+)
+
+
+class HasMetricsToken(BasePermission):
+    """
+    Authorization: Bearer <settings.INSTRUMENTATION["METRICS_TOKEN"]> 요구
+    - METRICS_TOKEN이 설정되지 않으면 모든 요청 거부 (측정값을 공개하지 않음)
+    """
+
+    def has_permission(self, request, view):
+        token = settings.INSTRUMENTATION.get("METRICS_TOKEN")
+        if not token:
+            return False
+        header = request.META.get("HTTP_AUTHORIZATION", "")
+        return constant_time_compare(header, f"Bearer {token}")
+
+
+class InstrumentationMiddleware:
+    """
+    요청별 구간 측정 미들웨어 (settings.INSTRUMENTATION["ENABLED"]가 False이면 제외)
+    - settings.MIDDLEWARE의 가장 앞에 두어 미들웨어와 렌더링 시간까지 포함
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not instrumentation_enabled():
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _timings.reset(token)
+        return self.finish(request, response, timings, started)
+
+    async def __acall__(self, request):
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _timings.reset(token)
+        return self.finish(request, response, timings, started)
+
+    def finish(self, request, response, timings, started):
+        total = time.perf_counter() - started
+        # 레이블 값은 URL 설정과 표준 메서드로 제한 (요청 값마다 시계열이 늘어나지 않도록)
+        match = getattr(request, "resolver_match", None)
+        view = (match.url_name or match.view_name) if match else "unmatched"
+        method = request.method if request.method in HTTP_METHODS else "other"
+        registry.record(view, method, response.status_code, total, timings)
+
+        if settings.INSTRUMENTATION.get("SERVER_TIMING", False):
+            response["Server-Timing"] = server_timing(timings, total)
+        return response
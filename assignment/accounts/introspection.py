@@ -0,0 +1,82 @@
+"""
+토큰 일괄 검증(introspection) 모듈
+
+게이트웨이가 토큰마다 /auth-test/를 호출하면 토큰 수만큼 HTTP 요청과 사용자 조회가 발생합니다.
+introspect_tokens()는 여러 토큰을 한 번에 검증하고 사용자는 id__in 쿼리 한 번으로 조회합니다.
+
+- 토큰 검증은 /auth-test/와 같은 StatelessJWTAuthentication 경로 사용 (서명, 만료, 토큰 종류, 폐기 목록)
+- 사용자 검증은 VerifiedJWTAuthentication과 같은 기준 (존재 여부, 활성 상태, 비밀번호 변경 여부),
+  최신 상태를 반환하도록 사용자 캐시 없이 매번 조회
+- 실패한 토큰의 에러 코드/메시지는 custom_exception_handler의 401 응답과 동일
+"""
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import StatelessJWTAuthentication
+from .exception_handler import authentication_error
+from .sharding import split_user_ids
+
+
+def load_users(user_ids):
+    """
+    user_id -> User, 쿼리 한 번(샤드마다 한 번)으로 조회
+    """
+    auth = StatelessJWTAuthentication()
+    users = {}
+
+    id_field = api_settings.USER_ID_FIELD
+    for using, user_ids in split_user_ids(user_ids).items():
+        queryset = auth.user_model.objects.using(using).filter(
+            **{f"{id_field}__in": list(user_ids)}
+        )
+        for user in queryset:
+            users[user_ids[getattr(user, id_field)]] = user
+
+    return users
+
+
+def _error_result(exc):
+    code, message = authentication_error(exc)
+    return {"active": False, "error": {"code": code, "message": message}}
+
+
+def introspect_tokens(raw_tokens):
+    """
+    토큰별 검증 결과 목록 (요청 순서와 동일)
+    - 유효한 토큰: {"active": True, "user_id", "username", "nickname", "exp"}
+    - 유효하지 않은 토큰: {"active": False, "error": {"code", "message"}}
+    """
+    auth = StatelessJWTAuthentication()
+    results = [None] * len(raw_tokens)
+
+    # 1단계: 서명/만료/폐기 여부 검증
+    validated = {}
+    for index, raw_token in enumerate(raw_tokens):
+        try:
+            token = auth.get_validated_token(raw_token)
+            validated[index] = (token, auth.get_user_id(token))
+        except AuthenticationFailed as exc:
+            results[index] = _error_result(exc)
+
+    # 2단계: 유효한 토큰의 사용자를 한 번에 조회하여 검증
+    users = load_users({user_id for _, user_id in validated.values()})
+    for index, (token, user_id) in validated.items():
+        try:
+            user = users.get(user_id)
+            if user is None:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            auth.check_db_user(user, token)
+        except AuthenticationFailed as exc:
+            results[index] = _error_result(exc)
+            continue
+
+        results[index] = {
+            "active": True,
+            "user_id": user_id,
+            "username": user.username,
+            "nickname": user.nickname,
+            "exp": token["exp"],
+        }
+
+    return results
@@ -0,0 +1,276 @@
+"""
+JWT 서명 키 모듈
+
+기본 TokenBackend는 알고리즘과 키를 하나만 사용하므로 키를 교체하면 기존 토큰이 모두 무효가 되고,
+HS256에서는 토큰을 검증하려는 모든 서비스가 SECRET_KEY를 알아야 합니다.
+KeyringTokenBackend는 여러 키를 kid로 구분하여 보관합니다.
+
+- 서명: 활성 키(ACTIVE_KID)로 서명하고 JWT 헤더에 kid 기록
+- 검증: 헤더의 kid로 키를 선택, kid가 없는 토큰은 기존 설정(SIMPLE_JWT)의 키로 검증
+- 키 교체: 새 키를 활성화한 뒤에도 이전 키 파일을 남겨두면, 이전 키로 서명한 토큰은 만료 전까지 계속 검증됨
+- RS256/EdDSA 등 비대칭 키의 공개 키는 JWKS(/.well-known/jwks.json)로 제공하여 다른 서비스가 직접 검증
+- 키 파일은 시작 후 처음 사용할 때 한 번 읽어 키 객체로 변환해 두고, 토큰마다 다시 파싱하지 않음
+- 같은 키로 서명한 토큰은 헤더 부분이 같으므로, 헤더에서 읽은 kid도 헤더 문자열별로 캐시
+
+settings.JWT_KEYS["DIR"]의 <kid>.pem 파일이 키 하나입니다.
+비대칭 알고리즘은 비공개 키 PEM(서명+검증) 또는 공개 키 PEM(검증 전용), HS 알고리즘은 비밀 값 자체를 저장합니다.
+RS256/EdDSA는 cryptography 패키지가 필요합니다.
+"""
+
+import json
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import jwt
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from jwt import ExpiredSignatureError, InvalidAlgorithmError, InvalidTokenError
+from jwt.utils import base64url_decode
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import (
+    TokenBackendError,
+    TokenBackendExpiredToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import token_cache
+from .renderers import PreEncodedDict
+
+
+@lru_cache(maxsize=64)
+def header_kid(header_segment):
+    """
+    토큰 헤더 부분(base64url)의 kid, 헤더가 올바르지 않으면 ValueError
+    """
+    header = json.loads(base64url_decode(header_segment))
+    if not isinstance(header, dict):
+        raise ValueError("Invalid header")
+    kid = header.get("kid")
+    if not isinstance(kid, (str, type(None))):
+        raise ValueError("Invalid kid")
+    return kid
+
+
+class JWTKey:
+    """
+    kid, 알고리즘과 미리 변환한 서명/검증 키 객체
+    - signing_key가 없으면 검증 전용 키
+    """
+
+    def __init__(self, kid, algorithm, signing_key=None, verifying_key=None):
+        try:
+            self.algorithm_obj = jwt.PyJWS().get_algorithm_by_name(algorithm)
+        except NotImplementedError:
+            raise ImproperlyConfigured(
+                f"JWT algorithm {algorithm!r} is not available "
+                "(RS*/ES*/EdDSA require the cryptography package)."
+            )
+
+        self.kid = kid
+        self.algorithm = algorithm
+        self.signing_key = (
+            self.algorithm_obj.prepare_key(signing_key) if signing_key else None
+        )
+
+        if algorithm.startswith("HS"):
+            self.verifying_key = self.signing_key
+        elif verifying_key:
+            self.verifying_key = self.algorithm_obj.prepare_key(verifying_key)
+        elif self.signing_key is not None:
+            # 비공개 키에서 공개 키 추출
+            self.verifying_key = self.signing_key.public_key()
+        else:
+            raise ImproperlyConfigured(f"JWT key {kid!r} has no verifying key.")
+
+    @property
+    def is_public(self):
+        # HS 알고리즘의 비밀 값은 공개하지 않음
+        return not self.algorithm.startswith("HS")
+
+    def to_jwk(self):
+        jwk = self.algorithm_obj.to_jwk(self.verifying_key, as_dict=True)
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+
+class KeyRing:
+    """
+    kid -> JWTKey 목록과 서명에 사용하는 활성 키
+    """
+
+    def __init__(self, keys, active_kid=None):
+        self.keys = {key.kid: key for key in keys}
+        if active_kid is not None:
+            if active_kid not in self.keys:
+                raise ImproperlyConfigured(f"Unknown active JWT key {active_kid!r}.")
+            self.active = self.keys[active_kid]
+        else:
+            signing_keys = [key for key in keys if key.signing_key is not None]
+            if not signing_keys:
+                raise ImproperlyConfigured("No JWT signing key configured.")
+            self.active = signing_keys[-1]
+
+        if self.active.signing_key is None:
+            raise ImproperlyConfigured(
+                f"Active JWT key {self.active.kid!r} has no private key."
+            )
+
+    def get(self, kid):
+        return self.keys.get(kid)
+
+    @cached_property
+    def jwks(self):
+        """
+        공개 키 목록 (JWKS 응답 본문, 한 번만 만들고 인코딩 결과 재사용)
+        """
+        return PreEncodedDict(
+            {
+                "keys": [
+                    key.to_jwk()
+                    for key in self.keys.values()
+                    if key.kid is not None and key.is_public
+                ]
+            }
+        )
+
+    @classmethod
+    def from_directory(cls, path, algorithm, active_kid=None, legacy_key=None):
+        """
+        디렉토리의 <kid>.pem 파일로 키 목록 구성 (파일 이름 순서, 활성 키 기본값은 마지막 서명 키)
+        - legacy_key: kid가 없는 토큰을 검증할 키 (검증 전용)
+        """
+        keys = []
+        for file in sorted(Path(path).glob("*.pem")):
+            data = file.read_bytes()
+            if algorithm.startswith("HS"):
+                keys.append(JWTKey(file.stem, algorithm, signing_key=data.strip()))
+            elif b"PRIVATE KEY" in data:
+                keys.append(JWTKey(file.stem, algorithm, signing_key=data))
+            else:
+                keys.append(JWTKey(file.stem, algorithm, verifying_key=data))
+
+        ring = cls(keys, active_kid=active_kid or None)
+        if legacy_key is not None:
+            ring.keys[None] = legacy_key
+        return ring
+
+
+class KeyringTokenBackend(TokenBackend):
+    """
+    KeyRing으로 서명/검증하는 TokenBackend (audience, issuer, leeway는 SIMPLE_JWT 설정 사용)
+    """
+
+    def __init__(self, keyring):
+        super().__init__(
+            keyring.active.algorithm,
+            audience=api_settings.AUDIENCE,
+            issuer=api_settings.ISSUER,
+            leeway=api_settings.LEEWAY,
+            json_encoder=api_settings.JSON_ENCODER,
+        )
+        self.keyring = keyring
+
+    def encode(self, payload):
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+
+        key = self.keyring.active
+        return jwt.encode(
+            jwt_payload,
+            key.signing_key,
+            algorithm=key.algorithm,
+            headers={"kid": key.kid} if key.kid is not None else None,
+            json_encoder=self.json_encoder,
+        )
+
+    def get_key(self, token):
+        if isinstance(token, bytes):
+            token = token.decode("utf-8", "replace")
+        try:
+            kid = header_kid(token.split(".", 1)[0])
+        except ValueError as ex:
+            # JSON/base64 오류 (UnicodeDecodeError, binascii.Error 포함)
+            raise TokenBackendError(_("Token is invalid")) from ex
+
+        key = self.keyring.get(kid)
+        if key is None:
+            raise TokenBackendError(_("Token is invalid"))
+        return key
+
+    def decode(self, token, verify=True):
+        key = self.get_key(token)
+        try:
+            return jwt.decode(
+                token,
+                key.verifying_key,
+                algorithms=[key.algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.get_leeway(),
+                options={
+                    "verify_aud": self.audience is not None,
+                    "verify_signature": verify,
+                },
+            )
+        except InvalidAlgorithmError as ex:
+            raise TokenBackendError(_("Invalid algorithm specified")) from ex
+        except ExpiredSignatureError as ex:
+            raise TokenBackendExpiredToken(_("Token is expired")) from ex
+        except InvalidTokenError as ex:
+            raise TokenBackendError(_("Token is invalid")) from ex
+
+
+def build_keyring(config=None):
+    """
+    settings.JWT_KEYS로 KeyRing 구성
+    - DIR이 없으면 SIMPLE_JWT의 ALGORITHM/SIGNING_KEY 하나만 사용 (kid 없음, 기존 토큰과 동일)
+    """
+    config = config if config is not None else getattr(settings, "JWT_KEYS", {})
+    default_key = JWTKey(
+        None,
+        api_settings.ALGORITHM,
+        signing_key=api_settings.SIGNING_KEY,
+        verifying_key=api_settings.VERIFYING_KEY,
+    )
+    if not config.get("DIR"):
+        return KeyRing([default_key])
+
+    return KeyRing.from_directory(
+        config["DIR"],
+        config.get("ALGORITHM", "RS256"),
+        active_kid=config.get("ACTIVE_KID"),
+        legacy_key=default_key if config.get("ACCEPT_LEGACY", True) else None,
+    )
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_token_backend():
+    """
+    토큰 클래스가 사용하는 KeyringTokenBackend (처음 사용할 때 키 파일을 읽어 생성)
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = KeyringTokenBackend(build_keyring())
+    return _backend
+
+
+def reset_token_backend():
+    """
+    키 설정을 다시 읽도록 백엔드 초기화 (테스트, 키 교체 후 사용)
+    """
+    global _backend
+    with _backend_lock:
+        _backend = None
+    # 이전 키로 검증한 토큰이 캐시에서 계속 인정되지 않도록 함께 비움
+    token_cache.clear()
@@ -0,0 +1,56 @@
+from contextlib import nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.export import FORMATS, iter_pages, render_header, render_page
+
+
+class Command(BaseCommand):
+    help = (
+        "모든 사용자의 id/username/nickname/date_joined/is_active를 pk 순서로 "
+        "NDJSON 또는 CSV로 출력합니다. 사용자 수와 관계없이 chunk_size명씩 조회합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            nargs="?",
+            default="-",
+            help="저장할 파일 경로 (기본값 '-': 표준 출력)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="출력 형식 (기본값: 파일 확장자로 판단, 표준 출력은 ndjson)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="한 번에 조회할 사용자 수",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or ("csv" if path.endswith(".csv") else "ndjson")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        if path == "-":
+            # 조각마다 줄바꿈을 붙이지 않고 그대로 출력
+            self.stdout.ending = ""
+            output = nullcontext(self.stdout)
+        else:
+            try:
+                output = open(path, "w", encoding="utf-8", newline="")
+            except OSError as exc:
+                raise CommandError(str(exc))
+
+        exported = 0
+        with output as stream:
+            stream.write(render_header(fmt))
+            for page in iter_pages(options["chunk_size"]):
+                stream.write(render_page(fmt, page))
+                exported += len(page)
+
+        self.stderr.write(f"exported={exported}")
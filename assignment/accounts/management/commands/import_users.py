@@ -0,0 +1,61 @@
+import json
+import os
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.bulk_import import FORMATS, import_users, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "JSONL/CSV 파일의 username/password/nickname 목록으로 사용자를 대량 생성하고 "
+        "행별 결과를 JSONL로 출력합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="가져올 파일 경로 ('-'이면 표준 입력)")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="입력 형식 (기본값: 파일 확장자로 판단, 표준 입력은 jsonl)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="bulk_create 한 번에 저장할 행 수",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="비밀번호 해시에 사용할 프로세스 수",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or ("csv" if path.endswith(".csv") else "jsonl")
+
+        if path == "-":
+            stream = sys.stdin
+        else:
+            try:
+                stream = open(path, encoding="utf-8", newline="")
+            except OSError as exc:
+                raise CommandError(str(exc))
+
+        counts = {"created": 0, "duplicate": 0, "invalid": 0}
+        with stream:
+            results = import_users(
+                read_rows(stream, fmt),
+                chunk_size=options["chunk_size"],
+                workers=options["workers"],
+            )
+            for result in results:
+                counts[result["status"]] += 1
+                self.stdout.write(json.dumps(result, ensure_ascii=False))
+
+        self.stderr.write(
+            "created={created} duplicate={duplicate} invalid={invalid}".format(**counts)
+        )
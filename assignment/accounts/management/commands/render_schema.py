@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.schema_cache import FILE_RENDERERS, RenderedSchema, generate_schema
+
+
+class Command(BaseCommand):
+    help = (
+        "OpenAPI 스키마를 미리 렌더링하여 schema.yaml / schema.json과 "
+        "압축본(.gz, brotli 설치 시 .br)을 저장합니다. "
+        "SCHEMA_CACHE_DIR로 지정하면 /schema/ 요청 시 스키마를 생성하지 않고 이 파일을 사용합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=getattr(settings, "SCHEMA_CACHE", {}).get("DIR"),
+            help="저장할 디렉토리 (기본값: SCHEMA_CACHE_DIR)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=list(FILE_RENDERERS),
+            action="append",
+            help="저장할 형식 (여러 번 지정 가능, 기본값: 모든 형식)",
+        )
+
+    def handle(self, *args, **options):
+        if not options["output"]:
+            raise CommandError("--output 또는 SCHEMA_CACHE_DIR를 지정해야 합니다.")
+
+        output = Path(options["output"])
+        output.mkdir(parents=True, exist_ok=True)
+
+        schema = generate_schema()
+        for fmt in options["format"] or FILE_RENDERERS:
+            rendered = RenderedSchema(FILE_RENDERERS[fmt]().render(schema))
+
+            path = output / f"schema.{fmt}"
+            path.write_bytes(rendered.body)
+            path.with_name(f"{path.name}.gz").write_bytes(rendered.gzip_body)
+            if rendered.brotli_body is not None:
+                path.with_name(f"{path.name}.br").write_bytes(rendered.brotli_body)
+
+            self.stdout.write(f"{path} ({len(rendered.body)} bytes, {rendered.etag})")
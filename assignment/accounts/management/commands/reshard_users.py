@@ -0,0 +1,102 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from accounts.models import User
+from accounts.sharding import get_shards, shard_for_username
+
+
+class Command(BaseCommand):
+    help = (
+        "settings.USER_SHARDS 기준으로 username의 샤드가 아닌 DB에 저장된 사용자를 "
+        "해당 샤드로 이동합니다. 샤드를 목록 뒤에 추가한 뒤 실행하며, 다시 실행해도 안전합니다. "
+        "이동한 사용자는 새 샤드에서 pk가 바뀌므로 DB 검증 모드에서는 다시 로그인해야 하며, "
+        "그룹/권한 연결은 이동하지 않습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 조회/이동할 사용자 수",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="이동 대상 수만 출력하고 저장하지 않음",
+        )
+
+    def handle(self, *args, **options):
+        shards = get_shards()
+        if len(shards) == 1:
+            raise CommandError("USER_SHARDS has a single shard, nothing to reshard.")
+
+        totals = {"moved": 0, "conflicts": 0}
+        for source in shards:
+            counts = self.reshard(source, options["batch_size"], options["dry_run"])
+            for key in totals:
+                totals[key] += counts[key]
+            self.stdout.write(
+                f"{source}: moved={counts['moved']} conflicts={counts['conflicts']}"
+            )
+
+        self.stderr.write("moved={moved} conflicts={conflicts}".format(**totals))
+
+    def reshard(self, source, batch_size, dry_run):
+        """
+        source에 저장된 사용자를 pk 순서로 batch_size씩 읽어 다른 샤드에 속한 사용자를 이동
+        - 대상 샤드에 먼저 저장한 뒤 source에서 삭제 (중단 후 다시 실행하면 남은 사용자만 이동)
+        - 대상 샤드에 같은 username의 다른 사용자가 있으면 이동하지 않고 conflicts로 집계
+        """
+        fields = [
+            field.attname
+            for field in User._meta.concrete_fields
+            if not field.primary_key
+        ]
+        counts = {"moved": 0, "conflicts": 0}
+        last_pk = 0
+        while True:
+            batch = list(
+                User.objects.using(source)
+                .filter(pk__gt=last_pk)
+                .order_by("pk")[:batch_size]
+            )
+            if not batch:
+                return counts
+            last_pk = batch[-1].pk
+
+            targets = {}
+            for user in batch:
+                target = shard_for_username(user.username)
+                if target != source:
+                    targets.setdefault(target, []).append(user)
+
+            for target, users in targets.items():
+                if dry_run:
+                    counts["moved"] += len(users)
+                    continue
+
+                # 새 샤드의 pk는 새로 할당 (샤드마다 pk 범위가 겹치므로)
+                copies = [
+                    User(**{name: getattr(user, name) for name in fields})
+                    for user in users
+                ]
+                User.objects.using(target).bulk_create(copies, ignore_conflicts=True)
+
+                # 이동 전 사용자와 같은 비밀번호 해시/가입 시각이 저장된 경우만 이동 완료로 처리
+                stored = {
+                    username: (password, date_joined)
+                    for username, password, date_joined in User.objects.using(target)
+                    .filter(username__in=[user.username for user in users])
+                    .values_list("username", "password", "date_joined")
+                }
+                moved = [
+                    user.pk
+                    for user in users
+                    if stored.get(user.username) == (user.password, user.date_joined)
+                ]
+                with transaction.atomic(using=source):
+                    User.objects.using(source).filter(pk__in=moved).delete()
+
+                counts["moved"] += len(moved)
+                counts["conflicts"] += len(users) - len(moved)
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("signup", "회원가입"),
+                            ("login_success", "로그인 성공"),
+                            ("login_failure", "로그인 실패"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("username", models.CharField(max_length=150)),
+                ("user_id", models.BigIntegerField(blank=True, null=True)),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["username", "created_at"],
+                        name="accounts_au_usernam_07eb20_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_auditevent"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="auditevent",
+            name="event",
+            field=models.CharField(
+                choices=[
+                    ("signup", "회원가입"),
+                    ("login_success", "로그인 성공"),
+                    ("login_failure", "로그인 실패"),
+                    ("login_throttled", "로그인 시도 제한"),
+                ],
+                max_length=20,
+            ),
+        ),
+    ]
@@ -4,3 +4,30 @@ from django.db import models
 
 class User(AbstractUser):
     nickname = models.CharField(max_length=50)
+
+
+class AuditEvent(models.Model):
+    """
+    로그인/회원가입 감사 기록 (accounts.audit이 모아서 bulk_create로 저장)
+    - 사용자 샤드와 관계없이 기본 DB에 저장하므로 User 외래 키 대신 토큰의 user_id 값 보관
+    """
+
+    SIGNUP = "signup"
+    LOGIN_SUCCESS = "login_success"
+    LOGIN_FAILURE = "login_failure"
+    LOGIN_THROTTLED = "login_throttled"
+    EVENT_CHOICES = [
+        (SIGNUP, "회원가입"),
+        (LOGIN_SUCCESS, "로그인 성공"),
+        (LOGIN_FAILURE, "로그인 실패"),
+        (LOGIN_THROTTLED, "로그인 시도 제한"),
+    ]
+
+    event = models.CharField(max_length=20, choices=EVENT_CHOICES)
+    username = models.CharField(max_length=150)
+    user_id = models.BigIntegerField(null=True, blank=True)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    created_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["username", "created_at"])]
@@ -0,0 +1,78 @@
+"""
+JSON 요청 파서 및 콘텐츠 협상 모듈
+
+- FastJSONParser: orjson으로 요청 본문을 파싱하고, 실패하면 JSONParser로 다시 파싱하여
+  JSONParser와 같은 결과와 같은 에러 메시지를 반환
+- FastJSONContentNegotiation: 일반적인 JSON 요청(Accept 없음, */*, application/json)은
+  전체 협상 과정 없이 첫 번째 JSON 렌더러/파서를 바로 선택
+"""
+
+import re
+
+from django.conf import settings
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer, orjson
+
+# orjson은 64비트를 넘는 정수를 실수로 변환하므로 긴 숫자가 있으면 JSONParser 사용
+_long_number_pattern = re.compile(rb"[0-9]{19}")
+
+_UTF8 = ("utf-8", "utf8")
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower() not in _UTF8:
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if not _long_number_pattern.search(body):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+
+        # 에러 메시지와 예외 처리는 JSONParser와 동일하게 유지
+        return super().parse(_BytesStream(body), media_type, parser_context)
+
+
+class _BytesStream:
+    # 이미 읽은 본문을 JSONParser에 다시 전달하기 위한 스트림
+    def __init__(self, body):
+        self.body = body
+
+    def read(self, size=-1):
+        body, self.body = self.body, b""
+        return body
+
+
+class FastJSONContentNegotiation(DefaultContentNegotiation):
+    """
+    일반적인 JSON 요청은 협상 없이 처리하는 콘텐츠 협상 클래스
+    - 협상 결과는 DefaultContentNegotiation과 같음
+    """
+
+    def select_parser(self, request, parsers):
+        if (
+            parsers
+            and parsers[0].media_type == "application/json"
+            and request.content_type == "application/json"
+        ):
+            return parsers[0]
+        return super().select_parser(request, parsers)
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        if (
+            renderers
+            and renderers[0].media_type == "application/json"
+            and format_suffix is None
+            and request.META.get("HTTP_ACCEPT", "*/*") in ("*/*", "application/json")
+            and not request.query_params.get(self.settings.URL_FORMAT_OVERRIDE)
+        ):
+            return renderers[0], renderers[0].media_type
+        return super().select_renderer(request, renderers, format_suffix)
@@ -0,0 +1,353 @@
+"""
+샘플링 프로파일러 모듈
+
+요청별 구간 측정(accounts.instrumentation)보다 자세한 함수 단위 분석이 필요할 때,
+지정한 뷰의 요청 중 일부만 골라 실행 중인 스택을 주기적으로 수집합니다.
+
+- 켜기/끄기: 관리자 API(/profiling/) 또는 settings.PROFILING["CONTROL_FILE"] 파일 수정 (재배포 불필요)
+  CONTROL_FILE을 설정하면 각 워커가 파일 수정 시각(mtime)을 최대 1초에 한 번 확인하여 모든 워커에 반영
+- 샘플링: 백그라운드 스레드 하나가 INTERVAL마다 sys._current_frames()로 프로파일 중인 요청 스레드의 스택 수집
+- 출력: DIR/profile-<pid>.collapsed 파일에 collapsed stack 형식("뷰;모듈:함수;... 횟수")으로 기록
+  (flamegraph.pl, speedscope 등에서 바로 사용 가능)
+- 크기 제한: 서로 다른 스택은 MAX_STACKS개까지만 보관하고 나머지는 [truncated]로 집계
+- ASGI에서 동기 뷰는 뷰를 실행하는 스레드, 비동기 뷰는 이벤트 루프 스레드의 스택을 수집
+  (비동기 뷰는 같은 시점에 이벤트 루프에서 실행 중인 다른 요청이 함께 기록될 수 있음)
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+
+# 스택에서 기록할 최대 프레임 수 (호출 깊이가 더 깊으면 바깥쪽 프레임 생략)
+MAX_DEPTH = 128
+
+# 파일 기록 최소 간격(초)
+FLUSH_INTERVAL = 1.0
+
+# 제어 파일 확인 최소 간격(초)
+CONTROL_POLL_INTERVAL = 1.0
+
+
+class ProfilingConfig:
+    """
+    프로파일 대상 뷰(url_name), 샘플링 비율, 종료 시각
+    """
+
+    def __init__(self, views=(), rate=1.0, until=0.0):
+        self.views = frozenset(views)
+        self.rate = rate
+        self.until = until
+
+    def is_active(self, now=None):
+        now = time.time() if now is None else now
+        return bool(self.views) and self.until > now
+
+    def as_dict(self):
+        return {
+            "views": sorted(self.views),
+            "rate": self.rate,
+            "until": self.until,
+            "active": self.is_active(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("views", ()), data.get("rate", 1.0), data.get("until", 0))
+
+
+class SamplingProfiler:
+    """
+    요청 스레드 스택 샘플러와 collapsed stack 집계
+    """
+
+    def __init__(
+        self,
+        output_dir,
+        interval=0.005,
+        max_stacks=5000,
+        control_file=None,
+        clock=time.time,
+    ):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.max_stacks = max_stacks
+        self.control_file = control_file
+        self.clock = clock
+        self.config = ProfilingConfig()
+        self.stacks = Counter()
+        self.samples = 0
+
+        self._lock = threading.Lock()
+        self._targets = {}
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._control_mtime = None
+        self._control_checked = 0.0
+        self._last_flush = 0.0
+        self._dirty = False
+
+    @property
+    def output_path(self):
+        return os.path.join(self.output_dir, f"profile-{os.getpid()}.collapsed")
+
+    # 설정
+
+    def configure(self, views, rate, duration):
+        """
+        프로파일 시작 (duration초 동안), CONTROL_FILE이 있으면 파일에 기록하여 모든 워커에 반영
+        """
+        config = ProfilingConfig(views, rate, self.clock() + duration)
+        self._apply(config)
+        return config
+
+    def disable(self):
+        self._apply(ProfilingConfig())
+
+    def _apply(self, config):
+        if self.control_file:
+            tmp = f"{self.control_file}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(config.as_dict(), f)
+            os.replace(tmp, self.control_file)
+            self._control_checked = 0.0
+        self.config = config
+
+    def refresh_config(self):
+        """
+        제어 파일이 바뀌었으면 다시 읽음 (최대 CONTROL_POLL_INTERVAL에 한 번 확인)
+        """
+        if not self.control_file:
+            return self.config
+
+        now = time.monotonic()
+        if now - self._control_checked < CONTROL_POLL_INTERVAL:
+            return self.config
+        self._control_checked = now
+
+        try:
+            mtime = os.stat(self.control_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._control_mtime:
+            self._control_mtime = mtime
+            try:
+                with open(self.control_file) as f:
+                    self.config = ProfilingConfig.from_dict(json.load(f))
+            except (OSError, ValueError):
+                self.config = ProfilingConfig()
+        return self.config
+
+    def should_profile(self, view_name):
+        config = self.refresh_config()
+        return (
+            view_name in config.views
+            and config.is_active(self.clock())
+            and random.random() < config.rate
+        )
+
+    # 샘플링
+
+    def start(self, view_name, thread_id=None):
+        thread_id = threading.get_ident() if thread_id is None else thread_id
+        with self._lock:
+            self._targets[thread_id] = view_name
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="accounts-profiler", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+        return thread_id
+
+    def stop(self, thread_id):
+        with self._lock:
+            self._targets.pop(thread_id, None)
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                idle = not self._targets
+                if idle:
+                    self._wakeup.clear()
+            if idle:
+                # 프로파일 중인 요청이 없으면 다음 요청까지 대기
+                self._wakeup.wait()
+                continue
+            time.sleep(self.interval)
+            self.sample()
+
+    def sample(self):
+        """
+        프로파일 중인 스레드의 현재 스택을 한 번 수집
+        """
+        with self._lock:
+            targets = dict(self._targets)
+        if not targets:
+            return
+
+        frames = sys._current_frames()
+        for thread_id, view_name in targets.items():
+            frame = frames.get(thread_id)
+            if frame is None:
+                continue
+            self._record(view_name, frame)
+
+    def _record(self, view_name, frame):
+        names = []
+        while frame is not None and len(names) < MAX_DEPTH:
+            code = frame.f_code
+            module = frame.f_globals.get("__name__", "?")
+            names.append(f"{module}:{code.co_name}")
+            frame = frame.f_back
+        names.append(view_name)
+        stack = ";".join(reversed(names))
+
+        with self._lock:
+            if stack not in self.stacks and len(self.stacks) >= self.max_stacks:
+                stack = f"{view_name};[truncated]"
+            self.stacks[stack] += 1
+            self.samples += 1
+            self._dirty = True
+
+    # 출력
+
+    def flush(self, force=False):
+        """
+        집계 결과를 파일에 기록 (최대 FLUSH_INTERVAL에 한 번, 파일 전체를 교체)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not self._dirty or (
+                not force and now - self._last_flush < FLUSH_INTERVAL
+            ):
+                return None
+            lines = [f"{stack} {count}\n" for stack, count in self.stacks.items()]
+            self._dirty = False
+            self._last_flush = now
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = self.output_path
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            f.writelines(lines)
+        os.replace(tmp, path)
+        return path
+
+    def reset(self):
+        with self._lock:
+            self.stacks.clear()
+            self.samples = 0
+            self._dirty = False
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self.config.as_dict(),
+                "samples": self.samples,
+                "stacks": len(self.stacks),
+                "max_stacks": self.max_stacks,
+                "output": self.output_path,
+            }
+
+
+class ProfilingMiddleware:
+    """
+    프로파일 대상 뷰의 요청을 샘플링 비율에 따라 골라 프로파일러에 등록하는 미들웨어
+    - 대상이 없을 때는 설정 확인만 수행
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+            # Django 핸들러가 동기 process_view를 요청마다 sync_to_async로 호출하지 않도록 코루틴으로 제공
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        try:
+            return self.get_response(request)
+        finally:
+            self.finish(request)
+
+    async def __acall__(self, request):
+        try:
+            return await self.get_response(request)
+        finally:
+            self.finish(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_name = self.select(request)
+        if view_name:
+            request._profiling_thread = get_profiler().start(view_name)
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        view_name = self.select(request)
+        if not view_name:
+            return None
+        if iscoroutinefunction(view_func):
+            # 비동기 뷰는 이벤트 루프 스레드(현재 스레드)에서 실행
+            request._profiling_thread = get_profiler().start(view_name)
+        else:
+            # 동기 뷰는 요청의 thread_sensitive 스레드에서 실행되므로 같은 스레드에서 등록
+            request._profiling_thread = await sync_to_async(get_profiler().start)(
+                view_name
+            )
+        return None
+
+    def select(self, request):
+        # 프로파일할 요청이면 뷰 이름, 아니면 None
+        view_name = request.resolver_match.url_name
+        if view_name and get_profiler().should_profile(view_name):
+            return view_name
+        return None
+
+    def finish(self, request):
+        thread_id = getattr(request, "_profiling_thread", None)
+        if thread_id is not None:
+            get_profiler().stop(thread_id)
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    """
+    settings.PROFILING으로 만든 프로세스 내 프로파일러
+    """
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                config = settings.PROFILING
+                _profiler = SamplingProfiler(
+                    output_dir=config["DIR"],
+                    interval=config.get("INTERVAL", 0.005),
+                    max_stacks=config.get("MAX_STACKS", 5000),
+                    control_file=config.get("CONTROL_FILE") or None,
+                )
+    return _profiler
+
+
+def reset_profiler():
+    """
+    프로파일러 초기화 (테스트, 설정 변경 후 사용)
+    """
+    global _profiler
+    with _profiler_lock:
+        _profiler = None
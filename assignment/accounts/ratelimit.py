@@ -0,0 +1,300 @@
+"""
+로그인 시도 제한 모듈
+
+로그인 실패 한 번에도 전체 비밀번호 해시 비용이 들기 때문에, 무제한 시도를 허용하면
+대입 공격(credential stuffing)만으로 CPU를 소모시킬 수 있습니다.
+이 모듈은 비밀번호 검증 전에 시도 횟수를 확인하여 제한된 요청을 해시 없이 429로 거절합니다.
+
+- IP별: WINDOW 동안 IP_LIMIT회를 넘는 로그인 시도 거절
+- 사용자별: WINDOW 동안 USERNAME_LIMIT회 실패하면 LOCKOUT 동안 해당 username 로그인 잠금,
+  로그인 성공 시 실패 횟수 초기화
+- 횟수는 두 구간(이전/현재 WINDOW) 카운터로 계산하는 sliding window 방식이며,
+  키마다 정수 두 개만 저장하므로 증가/조회 모두 O(1)
+
+카운터 저장소는 settings.LOGIN_RATE_LIMIT["BACKEND"]로 선택합니다.
+- memory: 프로세스 내 저장소 (단일 프로세스 배포용)
+- cache: Django 캐시(settings.CACHES) 저장소, Redis 등 공유 캐시를 사용하면 여러 워커가 카운터 공유
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+
+
+class LoginThrottled(APIException):
+    """
+    로그인 시도 제한을 넘은 경우 발생하는 예외 (429, Retry-After 헤더 포함)
+    """
+
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    default_detail = {
+        "error": {
+            "code": "TOO_MANY_LOGIN_ATTEMPTS",
+            "message": "로그인 시도가 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+        }
+    }
+
+    def __init__(self, wait):
+        super().__init__()
+        self.wait = wait
+
+
+class MemoryBackend:
+    """
+    프로세스 내 카운터 저장소
+    - 키 수는 max_size로 제한되며, 초과 시 가장 오래 사용되지 않은 키부터 제거
+    """
+
+    # 프로세스 내 잠금만 사용하므로 이벤트 루프에서 바로 호출 가능
+    blocking = False
+
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self._counters = OrderedDict()
+        self._locks = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _put(self, data, key, value):
+        data[key] = value
+        data.move_to_end(key)
+        while len(data) > self.max_size:
+            data.popitem(last=False)
+
+    def _counts(self, key, window_id):
+        # (구간 번호, 현재 구간 횟수, 이전 구간 횟수)를 window_id 기준으로 변환
+        entry = self._counters.get(key)
+        if entry is None:
+            return 0, 0
+
+        stored_id, current, previous = entry
+        if stored_id == window_id:
+            return current, previous
+        if stored_id == window_id - 1:
+            return 0, current
+        return 0, 0
+
+    def incr(self, key, window_id):
+        with self._lock:
+            current, previous = self._counts(key, window_id)
+            current += 1
+            self._put(self._counters, key, (window_id, current, previous))
+            return current, previous
+
+    def get(self, key, window_id):
+        with self._lock:
+            return self._counts(key, window_id)
+
+    def reset(self, key, window_id):
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def lock(self, key, until, timeout):
+        with self._lock:
+            self._put(self._locks, key, until)
+
+    def locked_until(self, key):
+        with self._lock:
+            return self._locks.get(key)
+
+
+class CacheBackend:
+    """
+    Django 캐시 기반 카운터 저장소
+    - 구간별 카운터를 별도 키로 저장하고, 두 구간이 지나면 캐시 만료로 삭제
+    """
+
+    # 캐시 서버와 통신하므로 비동기 뷰에서는 이벤트 루프 밖에서 호출
+    blocking = True
+
+    def __init__(self, alias="default", window=60, prefix="login-rl"):
+        self.cache = caches[alias]
+        self.window = window
+        self.prefix = prefix
+
+    def _key(self, key, suffix):
+        # username은 임의 문자열이므로 캐시 키에 사용할 수 있도록 해시
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return f"{self.prefix}:{digest}:{suffix}"
+
+    def incr(self, key, window_id):
+        current_key = self._key(key, window_id)
+        # 키가 없으면 만료 시간과 함께 생성 후 원자적으로 증가
+        self.cache.add(current_key, 0, timeout=self.window * 2)
+        try:
+            current = self.cache.incr(current_key)
+        except ValueError:
+            # add와 incr 사이에 만료된 경우
+            self.cache.set(current_key, 1, timeout=self.window * 2)
+            current = 1
+        previous = self.cache.get(self._key(key, window_id - 1), 0)
+        return current, previous
+
+    def get(self, key, window_id):
+        current_key = self._key(key, window_id)
+        previous_key = self._key(key, window_id - 1)
+        values = self.cache.get_many([current_key, previous_key])
+        return values.get(current_key, 0), values.get(previous_key, 0)
+
+    def reset(self, key, window_id):
+        self.cache.delete_many(
+            [self._key(key, window_id), self._key(key, window_id - 1)]
+        )
+
+    def lock(self, key, until, timeout):
+        self.cache.set(self._key(key, "lock"), until, timeout=timeout)
+
+    def locked_until(self, key):
+        return self.cache.get(self._key(key, "lock"))
+
+
+class LoginRateLimiter:
+    """
+    IP별 시도 횟수 제한과 username별 실패 잠금을 수행하는 로그인 제한기
+    - check(): 비밀번호 검증 전에 호출, 제한된 경우 LoginThrottled 발생
+    - failure()/success(): 비밀번호 검증 결과 반영
+    - acheck()/afailure()/asuccess(): 비동기 뷰용, 저장소가 blocking이면 이벤트 루프 밖에서 실행
+    """
+
+    def __init__(
+        self,
+        backend,
+        window=60,
+        ip_limit=30,
+        username_limit=5,
+        lockout=300,
+        clock=time.time,
+    ):
+        self.backend = backend
+        self.window = window
+        self.ip_limit = ip_limit
+        self.username_limit = username_limit
+        self.lockout = lockout
+        self.clock = clock
+
+    def _estimate(self, current, previous, now):
+        # 이전 구간 횟수는 현재 구간에서 지난 비율만큼 줄여서 반영
+        elapsed = (now % self.window) / self.window
+        return previous * (1 - elapsed) + current
+
+    def _retry_after(self, current, previous, now, limit):
+        # 새 시도가 없을 때 추정 횟수가 limit 아래로 내려가기까지 남은 시간
+        elapsed = now % self.window
+        if current < limit and previous:
+            wait = self.window * (1 - (limit - current) / previous) - elapsed
+        else:
+            wait = (self.window - elapsed) + self.window * (1 - limit / current)
+        return max(1, math.ceil(wait))
+
+    def check(self, username, ip):
+        now = self.clock()
+        window_id = int(now // self.window)
+
+        # 잠긴 username은 IP 카운터도 증가시키지 않고 거절
+        if username:
+            until = self.backend.locked_until(f"user:{username}")
+            if until is not None and until > now:
+                raise LoginThrottled(max(1, math.ceil(until - now)))
+
+        if ip:
+            current, previous = self.backend.incr(f"ip:{ip}", window_id)
+            if self._estimate(current, previous, now) > self.ip_limit:
+                raise LoginThrottled(
+                    self._retry_after(current, previous, now, self.ip_limit)
+                )
+
+    def failure(self, username):
+        if not username:
+            return
+
+        now = self.clock()
+        key = f"user:{username}"
+        current, previous = self.backend.incr(key, int(now // self.window))
+        if self._estimate(current, previous, now) >= self.username_limit:
+            self.backend.lock(key, now + self.lockout, self.lockout)
+
+    def success(self, username):
+        if username:
+            now = self.clock()
+            self.backend.reset(f"user:{username}", int(now // self.window))
+
+    async def _arun(self, method, *args):
+        if self.backend.blocking:
+            return await sync_to_async(method, thread_sensitive=False)(*args)
+        return method(*args)
+
+    async def acheck(self, username, ip):
+        return await self._arun(self.check, username, ip)
+
+    async def afailure(self, username):
+        return await self._arun(self.failure, username)
+
+    async def asuccess(self, username):
+        return await self._arun(self.success, username)
+
+
+def get_client_ip(request):
+    """
+    요청한 클라이언트 IP
+    - 기본값은 REMOTE_ADDR (X-Forwarded-For는 클라이언트가 임의로 보낼 수 있으므로 사용하지 않음)
+    - REST_FRAMEWORK["NUM_PROXIES"]가 1 이상이면 X-Forwarded-For에서
+      신뢰하는 프록시 수만큼 뒤에 있는 주소 사용 (프록시가 추가한 값만 사용)
+    """
+    num_proxies = api_settings.NUM_PROXIES
+    xff = request.META.get("HTTP_X_FORWARDED_FOR")
+    if num_proxies and xff:
+        addrs = xff.split(",")
+        return addrs[-min(num_proxies, len(addrs))].strip()
+    return request.META.get("REMOTE_ADDR")
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_login_rate_limiter():
+    """
+    설정에서 로그인 제한을 사용하도록 지정된 경우 공용 제한기 반환, 아니면 None
+    """
+    global _limiter
+
+    limit_settings = getattr(settings, "LOGIN_RATE_LIMIT", {})
+    if not limit_settings.get("ENABLED", False):
+        return None
+
+    with _limiter_lock:
+        if _limiter is None:
+            window = limit_settings.get("WINDOW", 60)
+            if limit_settings.get("BACKEND", "memory") == "cache":
+                backend = CacheBackend(
+                    alias=limit_settings.get("CACHE_ALIAS", "default"), window=window
+                )
+            else:
+                backend = MemoryBackend(max_size=limit_settings.get("MAX_SIZE", 100000))
+
+            _limiter = LoginRateLimiter(
+                backend,
+                window=window,
+                ip_limit=limit_settings.get("IP_LIMIT", 30),
+                username_limit=limit_settings.get("USERNAME_LIMIT", 5),
+                lockout=limit_settings.get("LOCKOUT", 300),
+            )
+        return _limiter
+
+
+def reset_login_rate_limiter():
+    """
+    공용 제한기 제거, 다음 호출 시 현재 설정으로 다시 생성 (테스트용)
+    """
+    global _limiter
+
+    with _limiter_lock:
+        _limiter = None
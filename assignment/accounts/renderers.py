@@ -0,0 +1,117 @@
+"""
+JSON 응답 렌더러 모듈
+
+accounts API의 응답은 작은 dict이므로 DRF JSONRenderer(json.dumps + JSONEncoder)의
+고정 비용이 실제 작업보다 큽니다. FastJSONRenderer는 orjson이 설치된 경우 이를 사용하고,
+결과는 JSONRenderer와 바이트 단위로 같도록 유지합니다.
+
+- JSONRenderer와 출력 형식이 달라질 수 있는 경우(들여쓰기, ensure_ascii, 실수 값 등)는 JSONRenderer로 렌더링
+  (실수 값은 인코딩 전에 데이터에서 확인하므로 토큰 등 문자열 응답은 orjson으로 한 번만 인코딩)
+- \\u2028, \\u2029는 JSONRenderer와 같이 이스케이프
+- PreEncodedDict로 만든 고정 응답은 최초 한 번만 인코딩한 결과를 재사용
+"""
+
+from django.utils.functional import cached_property
+from rest_framework.renderers import JSONRenderer
+
+from .instrumentation import phase
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_float(value):
+    # orjson과 json.dumps의 실수 표기(1e-05 / 1e-5 등)가 다를 수 있으므로 실수 값이 있으면 JSONRenderer 사용
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_has_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_float(item) for item in value)
+    return False
+
+
+class PreEncodedDict(dict):
+    """
+    인코딩 결과를 보관하는 고정 응답용 dict
+    - 상수로만 사용하며, 인코딩 결과가 바뀌지 않도록 값 변경 메서드는 지원하지 않음
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("PreEncodedDict is read-only.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    @cached_property
+    def encoded(self):
+        return JSONRenderer().render(dict(self))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson을 사용하는 JSONRenderer (orjson이 없으면 JSONRenderer와 동일)
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with phase("render"):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        # JSONRenderer 기본 출력(압축 구분자, 비 ASCII 문자 그대로, NaN 금지)이 아니면 그대로 위임
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if isinstance(data, PreEncodedDict):
+            return data.encoded
+
+        if orjson is None or _has_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self._default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            # dict 키가 문자열이 아니거나 64비트를 넘는 정수 등 orjson이 처리하지 못하는 값,
+            # default 변환 결과에 실수 값이 있는 경우 (Decimal 등)
+            # (NaN은 orjson이 null로 출력하지만 JSONRenderer에서도 렌더링 오류이므로 구분하지 않음)
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+    @cached_property
+    def _default(self):
+        # 날짜, Decimal, 지연 번역 문자열 등은 DRF JSONEncoder와 같은 방식으로 변환
+        convert = self.encoder_class().default
+
+        def default(value):
+            value = convert(value)
+            if _has_float(value):
+                raise TypeError("Float values are rendered by JSONRenderer.")
+            return value
+
+        return default
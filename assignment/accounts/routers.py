@@ -0,0 +1,132 @@
+"""
+읽기 복제본 DB 라우터 모듈
+
+settings.DATABASE_ROUTING["REPLICAS"]에 복제본이 있으면 읽기 쿼리(로그인 시 username 조회,
+DB 검증 모드의 토큰 사용자 조회 등)를 복제본으로 보내고, 쓰기 쿼리는 기본 DB(default)에서 수행합니다.
+복제본이 없으면 라우터는 관여하지 않습니다(None 반환).
+사용자 샤드가 있으면 User 인스턴스 관련 쿼리(저장, 관계 조회)는 해당 샤드에서 수행합니다 (accounts.sharding).
+
+- 기본 DB 트랜잭션 안의 읽기와 use_primary() 블록 안의 읽기는 기본 DB에서 수행
+- 회원가입 직후에는 복제 지연으로 새 사용자가 복제본에 없을 수 있으므로,
+  mark_written()으로 공유 캐시에 기록한 키는 STICKY_SECONDS 동안 기본 DB에서 조회 (read-your-writes)
+"""
+
+import random
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .sharding import shard_for_user
+
+# 스레드(동기 뷰)와 코루틴(비동기 뷰)별로 적용
+_use_primary = ContextVar("use_primary", default=False)
+
+
+def get_replicas():
+    return getattr(settings, "DATABASE_ROUTING", {}).get("REPLICAS", [])
+
+
+@contextmanager
+def use_primary():
+    """
+    블록 안의 읽기 쿼리를 기본 DB에서 수행
+    """
+    token = _use_primary.set(True)
+    try:
+        yield
+    finally:
+        _use_primary.reset(token)
+
+
+def _sticky_key(key):
+    return f"db-primary:{key}"
+
+
+def mark_written(*keys):
+    """
+    방금 기록한 데이터의 키(예: "username:<username>")를 STICKY_SECONDS 동안 기본 DB 조회 대상으로 등록
+    """
+    if not get_replicas():
+        return
+    config = settings.DATABASE_ROUTING
+    caches[config["CACHE_ALIAS"]].set_many(
+        {_sticky_key(key): True for key in keys}, config["STICKY_SECONDS"]
+    )
+
+
+async def amark_written(*keys):
+    """
+    mark_written()의 비동기 버전 (공유 캐시 기록을 이벤트 루프에서 기다리지 않음)
+    """
+    if not get_replicas():
+        return
+    config = settings.DATABASE_ROUTING
+    await caches[config["CACHE_ALIAS"]].aset_many(
+        {_sticky_key(key): True for key in keys}, config["STICKY_SECONDS"]
+    )
+
+
+def primary_if_written(key):
+    """
+    key가 최근에 기록되었으면 use_primary(), 아니면 아무 동작도 하지 않는 컨텍스트 관리자
+    """
+    if get_replicas():
+        cache = caches[settings.DATABASE_ROUTING["CACHE_ALIAS"]]
+        if cache.get(_sticky_key(key)):
+            return use_primary()
+    return nullcontext()
+
+
+class PrimaryReplicaRouter:
+    """
+    읽기는 복제본(무작위 선택), 쓰기는 기본 DB로 보내는 라우터
+    """
+
+    def _user_shard(self, hints):
+        # 샤드에서 조회한(또는 저장할) 사용자 인스턴스는 해당 샤드 사용
+        instance = hints.get("instance")
+        if isinstance(instance, get_user_model()):
+            return shard_for_user(instance)
+        return None
+
+    def db_for_read(self, model, **hints):
+        shard = self._user_shard(hints)
+        if shard is not None:
+            return shard
+
+        replicas = get_replicas()
+        if not replicas:
+            return None
+        if _use_primary.get():
+            return DEFAULT_DB_ALIAS
+        # 트랜잭션 안에서 방금 기록한 데이터를 읽을 수 있도록 기본 DB 사용
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        shard = self._user_shard(hints)
+        if shard is not None:
+            return shard
+
+        # 복제본에서 조회한 인스턴스를 저장하는 경우에도 기본 DB에 기록
+        if not get_replicas():
+            return None
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 기본 DB와 복제본은 같은 데이터이므로 서로 관계 설정 허용
+        databases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본의 스키마는 기본 DB에서 복제
+        if db in get_replicas():
+            return False
+        return None
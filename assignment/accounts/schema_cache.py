@@ -0,0 +1,239 @@
+"""
+OpenAPI 스키마 캐시 모듈
+
+SpectacularAPIView는 요청마다 모든 뷰와 @extend_schema, 후처리 훅을 다시 분석하여 스키마를 생성합니다.
+스키마는 배포 이후 바뀌지 않으므로, 이 모듈의 뷰는 형식(yaml/json)별로 한 번만 생성/렌더링한
+결과를 메모리에 보관하고 그대로 응답합니다.
+
+- ETag 헤더를 제공하고, If-None-Match가 일치하면 본문 없이 304 응답
+- gzip(및 brotli 패키지가 설치된 경우 brotli) 압축본을 미리 만들어 Accept-Encoding에 따라 응답
+- 압축본은 본문 바이트가 다르므로 ETag에 압축 방식을 붙여 구분 (예: "<hash>-gzip")
+- settings.SCHEMA_CACHE["DIR"]이 지정되면 render_schema 명령으로 빌드 시점에 미리 만든 파일을 사용
+- docs 프로필은 시작 시(wsgi/asgi) 기본 언어/버전의 스키마를 미리 렌더링 (warm_schema_cache)
+"""
+
+import gzip
+import hashlib
+import re
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import translation
+from django.utils.http import parse_etags
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import patched_settings, spectacular_settings
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+from rest_framework.settings import api_settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 파일로 미리 렌더링하는 형식 (확장자 -> 렌더러)
+FILE_RENDERERS = {
+    "yaml": OpenApiYamlRenderer,
+    "json": OpenApiJsonRenderer,
+}
+
+_accepts_gzip = re.compile(r"\bgzip\b")
+_accepts_brotli = re.compile(r"\bbr\b")
+
+
+class RenderedSchema:
+    """
+    렌더링된 스키마 본문과 압축본, ETag (etag는 압축하지 않은 본문의 값)
+    """
+
+    def __init__(self, body, gzip_body=None, brotli_body=None):
+        self.body = body
+        self.digest = hashlib.sha256(body).hexdigest()[:32]
+        self.etag = '"%s"' % self.digest
+        # mtime=0으로 고정하여 같은 본문이면 항상 같은 압축 결과 생성
+        self.gzip_body = gzip_body or gzip.compress(body, compresslevel=9, mtime=0)
+        if brotli_body is None and brotli is not None:
+            brotli_body = brotli.compress(body)
+        self.brotli_body = brotli_body
+
+    def encoded(self, accept_encoding):
+        """
+        Accept-Encoding에 맞는 (본문, Content-Encoding, ETag) 반환
+        """
+        if self.brotli_body is not None and _accepts_brotli.search(accept_encoding):
+            return self.brotli_body, "br", '"%s-br"' % self.digest
+        if _accepts_gzip.search(accept_encoding):
+            return self.gzip_body, "gzip", '"%s-gzip"' % self.digest
+        return self.body, None, self.etag
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        render_schema 명령으로 만든 파일과 압축본(.gz, .br) 로드
+        """
+        path = Path(path)
+        compressed = {}
+        for suffix in ("gz", "br"):
+            compressed_path = path.with_name(f"{path.name}.{suffix}")
+            if compressed_path.exists():
+                compressed[suffix] = compressed_path.read_bytes()
+        return cls(
+            path.read_bytes(),
+            gzip_body=compressed.get("gz"),
+            brotli_body=compressed.get("br"),
+        )
+
+
+class SchemaCache:
+    """
+    (형식, 언어, 버전)별 렌더링 결과를 보관하는 스레드 안전한 캐시
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+
+        # 동시에 들어온 첫 요청들이 스키마를 중복 생성하지 않도록 잠금
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = build()
+                self._entries[key] = entry
+            return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+schema_cache = SchemaCache()
+
+
+def get_schema_lang(lang):
+    """
+    settings.LANGUAGES에 있는 언어 코드만 반환 (그 외는 None, 기본 언어)
+    """
+    if settings.USE_I18N and lang in dict(settings.LANGUAGES):
+        return lang
+    return None
+
+
+def get_schema_version(version):
+    """
+    ALLOWED_VERSIONS에 있는 버전만 반환 (그 외는 None)
+    """
+    if version in (api_settings.ALLOWED_VERSIONS or ()):
+        return version
+    return None
+
+
+def load_schema_file(fmt):
+    """
+    SCHEMA_CACHE["DIR"]에 render_schema 명령으로 미리 만든 fmt 형식 파일이 있으면 로드
+    """
+    schema_dir = getattr(settings, "SCHEMA_CACHE", {}).get("DIR")
+    if not schema_dir:
+        return None
+    path = Path(schema_dir) / f"schema.{fmt}"
+    if not path.exists():
+        return None
+    return RenderedSchema.from_file(path)
+
+
+def generate_schema():
+    """
+    요청 없이 공개 스키마 생성 (spectacular 관리 명령과 같은 방식)
+    """
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS(
+        urlconf=spectacular_settings.SERVE_URLCONF
+    )
+    return generator.get_schema(request=None, public=True)
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    스키마를 한 번만 생성하여 메모리에서 응답하는 SpectacularAPIView
+    """
+
+    # 캐시 키는 요청 값 그대로가 아니라 정해진 값으로만 만들어 항목 수가 늘어나지 않도록 함
+    # (docstring은 스키마의 API 설명으로 노출되므로 주석으로 기록)
+    # - lang: settings.LANGUAGES에 있는 언어만 사용 (그 외는 기본 언어)
+    # - version: ALLOWED_VERSIONS에 있는 버전만 사용 (설정하지 않으면 ?version= 무시)
+    # - 형식: 렌더러의 media_type 사용 (Accept의 indent 등 매개변수 무시)
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        lang = get_schema_lang(request.GET.get("lang"))
+        with patched_settings(self.custom_settings):
+            if lang is None:
+                return self._get_schema_response(request, lang)
+            with translation.override(lang):
+                return self._get_schema_response(request, lang)
+
+    def _get_schema_response(self, request, lang=None):
+        renderer = request.accepted_renderer
+        version = self.api_version or get_schema_version(
+            request.version or request.GET.get("version")
+        )
+
+        entry = schema_cache.get_or_build(
+            (renderer.format, renderer.media_type, lang, version),
+            lambda: self._build(request, renderer, lang, version),
+        )
+
+        body, encoding, etag = entry.encoded(request.headers.get("Accept-Encoding", ""))
+        headers = {"ETag": etag, "Vary": "Accept, Accept-Encoding"}
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            if "*" in etags or etag in etags:
+                return HttpResponseNotModified(headers=headers)
+
+        filename = self._get_filename(request, version)
+        headers["Content-Disposition"] = f'inline; filename="{filename}"'
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        return HttpResponse(body, content_type=content_type, headers=headers)
+
+    def _build(self, request, renderer, lang, version):
+        # 빌드 시점에 미리 렌더링한 파일이 있으면 사용 (기본 언어/버전만 해당)
+        if lang is None and version is None:
+            rendered = load_schema_file(renderer.format)
+            if rendered is not None:
+                return rendered
+
+        generator = self.generator_class(
+            urlconf=self.urlconf, api_version=version, patterns=self.patterns
+        )
+        schema = generator.get_schema(request=request, public=self.serve_public)
+        return RenderedSchema(renderer.render(schema, renderer.media_type))
+
+
+def warm_schema_cache():
+    """
+    기본 언어/버전의 스키마를 모든 형식으로 미리 렌더링하여 캐시에 저장 (docs 프로필 시작 시 호출)
+    """
+    schema = None
+    for renderer_class in CachedSpectacularAPIView.renderer_classes:
+        renderer = renderer_class()
+        rendered = load_schema_file(renderer.format)
+        if rendered is None:
+            if schema is None:
+                schema = generate_schema()
+            rendered = RenderedSchema(renderer.render(schema, renderer.media_type))
+        schema_cache.get_or_build(
+            (renderer.format, renderer.media_type, None, None), lambda: rendered
+        )
@@ -0,0 +1,34 @@
+"""
+drf_spectacular 확장 모듈
+
+확장 클래스는 정의(import)되는 시점에 등록되며, drf_spectacular의 extensions/plumbing(yaml 등 포함)을 함께 불러옵니다.
+API만 처리하는 워커가 이 비용을 부담하지 않도록 뷰 모듈에서 import하지 않고,
+스키마 생성기(SPECTACULAR_SETTINGS["DEFAULT_GENERATOR_CLASS"])를 불러올 때만 불러옵니다.
+뷰의 API 문서(@extend_schema, accounts.schemas)도 이때 적용합니다.
+"""
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from drf_spectacular.drainage import set_override
+from drf_spectacular.generators import SchemaGenerator
+
+from .authentication import VerifiedJWTAuthentication
+from .schemas import extend_view_schemas
+
+
+# accounts.authentication의 JWT 인증 클래스를 기존 jwtAuth 보안 스키마로 문서화
+class AccountsJWTScheme(SimpleJWTScheme):
+    target_class = "accounts.authentication.StatelessJWTAuthentication"
+    match_subclasses = True
+
+
+# 하위 클래스도 같은 jwtAuth 스키마를 사용하므로 이름 충돌 경고 생략
+set_override(VerifiedJWTAuthentication, "suppress_collision_warning", True)
+
+# 뷰 모듈은 문서화 코드를 불러오지 않으므로 스키마 생성 전에 한 번 적용
+extend_view_schemas()
+
+
+class AccountsSchemaGenerator(SchemaGenerator):
+    """
+    accounts 확장과 뷰 문서를 적용한 뒤 스키마를 생성하는 생성기 (이 모듈을 불러오기 위한 클래스)
+    """
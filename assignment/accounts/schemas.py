@@ -16,7 +16,8 @@ API 문서화를 위한 스키마 및 예시 정의 모듈
 """
 
 from rest_framework import serializers
-from drf_spectacular.utils import OpenApiExample
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 
 
 # API 정렬을 위한 간단한 후처리 훅
@@ -59,6 +60,7 @@ class ErrorResponseSerializer(serializers.Serializer):
 # 토큰 응답 시리얼라이저
 class TokenResponseSerializer(serializers.Serializer):
     token = serializers.CharField()
+    refresh = serializers.CharField()
 
 
 # 메시지 응답 시리얼라이저
@@ -66,6 +68,46 @@ class MessageResponseSerializer(serializers.Serializer):
     message = serializers.CharField()
 
 
+# 사용자 캐시 통계 응답 시리얼라이저
+class CacheStatsResponseSerializer(serializers.Serializer):
+    hits = serializers.IntegerField()
+    misses = serializers.IntegerField()
+    evictions = serializers.IntegerField()
+    size = serializers.IntegerField()
+    max_size = serializers.IntegerField()
+
+
+# 토큰 일괄 검증 응답 시리얼라이저
+class TokenIntrospectionResultSerializer(serializers.Serializer):
+    active = serializers.BooleanField()
+    user_id = serializers.IntegerField(required=False)
+    username = serializers.CharField(required=False)
+    nickname = serializers.CharField(required=False)
+    exp = serializers.IntegerField(required=False)
+    error = ErrorDetailSerializer(required=False)
+
+
+class TokenIntrospectionResponseSerializer(serializers.Serializer):
+    results = TokenIntrospectionResultSerializer(many=True)
+
+
+# JWKS 응답 시리얼라이저
+class JWKSResponseSerializer(serializers.Serializer):
+    keys = serializers.ListField(child=serializers.DictField())
+
+
+# 프로파일러 상태 응답 시리얼라이저
+class ProfilingStatusResponseSerializer(serializers.Serializer):
+    views = serializers.ListField(child=serializers.CharField())
+    rate = serializers.FloatField()
+    until = serializers.FloatField()
+    active = serializers.BooleanField()
+    samples = serializers.IntegerField()
+    stacks = serializers.IntegerField()
+    max_stacks = serializers.IntegerField()
+    output = serializers.CharField()
+
+
 # 공통 예시 정의
 # 회원가입 예시
 SIGNUP_REQUEST_EXAMPLE = OpenApiExample(
@@ -101,7 +143,10 @@ LOGIN_SUCCESS_EXAMPLE = OpenApiExample(
     "로그인 성공 응답",
     response_only=True,
     status_codes=["200"],
-    value={"token": "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKL"},
+    value={
+        "token": "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKL",
+        "refresh": "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKR",
+    },
 )
 
 LOGIN_ERROR_EXAMPLE = OpenApiExample(
@@ -116,6 +161,18 @@ LOGIN_ERROR_EXAMPLE = OpenApiExample(
     },
 )
 
+LOGIN_THROTTLED_EXAMPLE = OpenApiExample(
+    "로그인 시도 제한 응답",
+    response_only=True,
+    status_codes=["429"],
+    value={
+        "error": {
+            "code": "TOO_MANY_LOGIN_ATTEMPTS",
+            "message": "로그인 시도가 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+        }
+    },
+)
+
 # 인증 관련 예시
 AUTH_SUCCESS_EXAMPLE = OpenApiExample(
     "인증 성공 응답",
@@ -144,3 +201,328 @@ TOKEN_NOT_FOUND_EXAMPLE = OpenApiExample(
     status_codes=["401"],
     value={"error": {"code": "TOKEN_NOT_FOUND", "message": "토큰이 없습니다."}},
 )
+
+TOKEN_REVOKED_EXAMPLE = OpenApiExample(
+    "폐기된 토큰",
+    response_only=True,
+    status_codes=["401"],
+    value={"error": {"code": "TOKEN_REVOKED", "message": "폐기된 토큰입니다."}},
+)
+
+# 토큰 갱신 / 로그아웃 예시
+TOKEN_REFRESH_REQUEST_EXAMPLE = OpenApiExample(
+    "토큰 갱신 요청",
+    request_only=True,
+    value={"refresh": "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKR"},
+)
+
+TOKEN_REFRESH_SUCCESS_EXAMPLE = OpenApiExample(
+    "토큰 갱신 성공 응답",
+    response_only=True,
+    status_codes=["200"],
+    value={
+        "token": "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKA",
+        "refresh": "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKB",
+    },
+)
+
+LOGOUT_REQUEST_EXAMPLE = OpenApiExample(
+    "로그아웃 요청",
+    request_only=True,
+    value={"refresh": "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKR"},
+)
+
+LOGOUT_SUCCESS_EXAMPLE = OpenApiExample(
+    "로그아웃 성공 응답",
+    response_only=True,
+    status_codes=["200"],
+    value={"message": "로그아웃 성공"},
+)
+
+# 토큰 일괄 검증 예시
+TOKEN_INTROSPECTION_REQUEST_EXAMPLE = OpenApiExample(
+    "토큰 일괄 검증 요청",
+    request_only=True,
+    value={
+        "tokens": [
+            "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKA",
+            "eKDIkdfjoakIdkfjpekdkcjdkoIOdjOKJDFOlLDKFJKB",
+        ]
+    },
+)
+
+TOKEN_INTROSPECTION_SUCCESS_EXAMPLE = OpenApiExample(
+    "토큰 일괄 검증 응답",
+    response_only=True,
+    status_codes=["200"],
+    value={
+        "results": [
+            {
+                "active": True,
+                "user_id": 1,
+                "username": "JIN HO",
+                "nickname": "Mentos",
+                "exp": 1735689600,
+            },
+            {
+                "active": False,
+                "error": {"code": "TOKEN_EXPIRED", "message": "토큰이 만료되었습니다."},
+            },
+        ]
+    },
+)
+
+# JWKS 예시
+JWKS_EXAMPLE = OpenApiExample(
+    "공개 키 목록 응답",
+    response_only=True,
+    status_codes=["200"],
+    value={
+        "keys": [
+            {
+                "kty": "OKP",
+                "crv": "Ed25519",
+                "x": "11qYAYKxCrfVS_7TyWQHOg7hcvPapiMlrwIaaPcHURo",
+                "kid": "2025-01",
+                "alg": "EdDSA",
+                "use": "sig",
+            }
+        ]
+    },
+)
+
+# 프로파일러 예시
+PROFILING_REQUEST_EXAMPLE = OpenApiExample(
+    "프로파일 시작 요청",
+    request_only=True,
+    value={"views": ["login", "signup"], "rate": 0.1, "duration": 300},
+)
+
+PROFILING_STATUS_EXAMPLE = OpenApiExample(
+    "프로파일러 상태 응답",
+    response_only=True,
+    status_codes=["200"],
+    value={
+        "views": ["login", "signup"],
+        "rate": 0.1,
+        "until": 1735689600.0,
+        "active": True,
+        "samples": 1532,
+        "stacks": 87,
+        "max_stacks": 5000,
+        "output": "/tmp/accounts-profiles/profile-4312.collapsed",
+    },
+)
+
+
+def extend_view_schemas():
+    """
+    accounts 뷰에 API 문서(@extend_schema) 적용
+    - 뷰 모듈이 drf_spectacular와 이 모듈을 불러오지 않도록 스키마 생성기(accounts.schema_extensions)를
+      불러올 때 한 번만 호출 (API만 처리하는 프로세스는 호출하지 않음)
+    """
+    from . import views
+    from .export import FORMATS
+    from .serializers import (
+        LoginSerializer,
+        LogoutSerializer,
+        ProfilingSerializer,
+        SignupSerializer,
+        TokenIntrospectionSerializer,
+        TokenRefreshSerializer,
+    )
+
+    extend_schema(
+        tags=["Signup"],
+        operation_id="2_signup",
+        description="회원가입을 위한 API. 과제 요구사항에 따라 비밀번호 유효성 검사 수정(CommonPasswordValidator, NumericPasswordValidator 주석처리)",
+        request=SignupSerializer,
+        responses={201: SignupSerializer, 400: ErrorResponseSerializer},
+        examples=[SIGNUP_REQUEST_EXAMPLE, SIGNUP_SUCCESS_EXAMPLE, SIGNUP_ERROR_EXAMPLE],
+    )(views.SignupAPIView)
+
+    extend_schema(
+        tags=["Login"],
+        operation_id="1_login",
+        description="로그인을 위한 API. 과제 요구사항에 따라 비밀번호 유효성 검사 옵션 수정(CommonPasswordValidator, NumericPasswordValidator 주석처리)",
+        request=LoginSerializer,
+        responses={
+            200: TokenResponseSerializer,
+            400: ErrorResponseSerializer,
+            429: ErrorResponseSerializer,
+        },
+        examples=[
+            LOGIN_REQUEST_EXAMPLE,
+            LOGIN_SUCCESS_EXAMPLE,
+            LOGIN_ERROR_EXAMPLE,
+            LOGIN_THROTTLED_EXAMPLE,
+        ],
+    )(views.LoginAPIView)
+
+    extend_schema(
+        tags=["Auth-Test"],
+        operation_id="3_auth_test",
+        description="인증 테스트를 위한 API.",
+        responses={200: MessageResponseSerializer, 401: ErrorResponseSerializer},
+        examples=[
+            AUTH_SUCCESS_EXAMPLE,
+            TOKEN_EXPIRED_EXAMPLE,
+            INVALID_TOKEN_EXAMPLE,
+            TOKEN_NOT_FOUND_EXAMPLE,
+            TOKEN_REVOKED_EXAMPLE,
+        ],
+    )(views.AuthTestAPIView)
+
+    extend_schema(
+        tags=["Login"],
+        operation_id="6_token_refresh",
+        description=(
+            "리프레시 토큰으로 새 액세스/리프레시 토큰을 발급하는 API. 비밀번호 검증 없이 토큰을 갱신하며, "
+            "사용한 리프레시 토큰은 폐기되어 다시 사용할 수 없음(rotation)"
+        ),
+        request=TokenRefreshSerializer,
+        responses={
+            200: TokenResponseSerializer,
+            400: ErrorResponseSerializer,
+            401: ErrorResponseSerializer,
+        },
+        examples=[
+            TOKEN_REFRESH_REQUEST_EXAMPLE,
+            TOKEN_REFRESH_SUCCESS_EXAMPLE,
+            TOKEN_EXPIRED_EXAMPLE,
+            INVALID_TOKEN_EXAMPLE,
+            TOKEN_REVOKED_EXAMPLE,
+        ],
+    )(views.TokenRefreshAPIView)
+
+    extend_schema(
+        tags=["Login"],
+        operation_id="7_logout",
+        description=(
+            "로그아웃 API. 요청에 사용한 액세스 토큰과, 요청 본문에 전달한 리프레시 토큰(선택)을 "
+            "만료 시각까지 폐기 목록에 등록"
+        ),
+        request=LogoutSerializer,
+        responses={200: MessageResponseSerializer, 401: ErrorResponseSerializer},
+        examples=[
+            LOGOUT_REQUEST_EXAMPLE,
+            LOGOUT_SUCCESS_EXAMPLE,
+            INVALID_TOKEN_EXAMPLE,
+            TOKEN_REVOKED_EXAMPLE,
+        ],
+    )(views.LogoutAPIView)
+
+    extend_schema(
+        tags=["Monitoring"],
+        operation_id="4_user_cache_stats",
+        description="JWT 인증 사용자 캐시의 hit/miss/eviction 카운터 조회 API. 관리자만 접근 가능",
+        responses={200: CacheStatsResponseSerializer, 401: ErrorResponseSerializer},
+    )(views.UserCacheStatsAPIView)
+
+    extend_schema(
+        tags=["Signup"],
+        operation_id="5_bulk_signup",
+        description=(
+            "사용자 대량 가입 API. 관리자만 접근 가능. "
+            "요청 본문은 username/password/nickname 행으로 구성된 JSONL(application/x-ndjson) 또는 CSV(text/csv)이며, "
+            "행별 처리 결과(created / duplicate / invalid)를 JSONL로 스트리밍 응답"
+        ),
+        request={"application/x-ndjson": OpenApiTypes.STR, "text/csv": OpenApiTypes.STR},
+        responses={
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            400: ErrorResponseSerializer,
+            401: ErrorResponseSerializer,
+        },
+    )(views.BulkSignupAPIView)
+
+    extend_schema(
+        tags=["Monitoring"],
+        operation_id="12_user_export",
+        description=(
+            "사용자 목록 내보내기 API. 관리자만 접근 가능. "
+            "모든 사용자의 id/username/nickname/date_joined/is_active를 pk 순서로 chunk_size명씩 조회하여 "
+            "NDJSON(output=ndjson, 기본값) 또는 CSV(output=csv)로 스트리밍 응답 (id는 토큰의 user_id와 같은 값)"
+        ),
+        parameters=[
+            OpenApiParameter("output", enum=FORMATS, default="ndjson"),
+            OpenApiParameter("chunk_size", int),
+        ],
+        responses={
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            (200, "text/csv"): OpenApiTypes.STR,
+            400: ErrorResponseSerializer,
+            401: ErrorResponseSerializer,
+        },
+    )(views.UserExportAPIView)
+
+    extend_schema(
+        tags=["Auth-Test"],
+        operation_id="8_jwks",
+        description=(
+            "토큰 검증용 공개 키 목록(JWKS) API. RS256/EdDSA 등 비대칭 키로 서명하는 경우 "
+            "다른 서비스가 이 공개 키로 토큰을 직접 검증 (HS256 비밀 키는 포함하지 않음)"
+        ),
+        responses={200: JWKSResponseSerializer},
+        examples=[JWKS_EXAMPLE],
+    )(views.JWKSAPIView)
+
+    extend_schema(
+        tags=["Auth-Test"],
+        operation_id="9_token_introspect",
+        description=(
+            "토큰 일괄 검증 API. 관리자만 접근 가능. 여러 액세스 토큰을 한 번에 검증하고 "
+            "토큰별 결과를 요청 순서대로 반환 (실패 코드는 인증 실패 응답의 에러 코드와 동일)"
+        ),
+        request=TokenIntrospectionSerializer,
+        responses={
+            200: TokenIntrospectionResponseSerializer,
+            400: ErrorResponseSerializer,
+            401: ErrorResponseSerializer,
+        },
+        examples=[TOKEN_INTROSPECTION_REQUEST_EXAMPLE, TOKEN_INTROSPECTION_SUCCESS_EXAMPLE],
+    )(views.TokenIntrospectionAPIView)
+
+    extend_schema(
+        tags=["Monitoring"],
+        operation_id="10_metrics",
+        description=(
+            "요청 지연 시간, 구간별 시간(validate/authenticate/hash/jwt/db/render), 요청당 쿼리 수 히스토그램과 "
+            "캐시 카운터를 Prometheus 텍스트 형식으로 제공하는 API (워커 프로세스별 집계). "
+            "Authorization: Bearer {METRICS_TOKEN} 필요 (METRICS_TOKEN 미설정 시 항상 403)"
+        ),
+        responses={(200, "text/plain"): OpenApiTypes.STR},
+    )(views.MetricsAPIView)
+
+    profiling_schema = {
+        "tags": ["Monitoring"],
+        "responses": {
+            200: ProfilingStatusResponseSerializer,
+            400: ErrorResponseSerializer,
+            401: ErrorResponseSerializer,
+        },
+    }
+    extend_schema(
+        operation_id="11_profiling_status",
+        description="샘플링 프로파일러 상태 조회 API. 관리자만 접근 가능",
+        examples=[PROFILING_STATUS_EXAMPLE],
+        **profiling_schema,
+    )(views.ProfilingAPIView.get)
+
+    extend_schema(
+        operation_id="11_profiling_start",
+        description=(
+            "샘플링 프로파일 시작 API. 관리자만 접근 가능. "
+            "지정한 뷰(url name)의 요청 중 rate 비율을 duration초 동안 프로파일 "
+            "(PROFILING_CONTROL_FILE 설정 시 모든 워커에 반영)"
+        ),
+        request=ProfilingSerializer,
+        examples=[PROFILING_REQUEST_EXAMPLE, PROFILING_STATUS_EXAMPLE],
+        **profiling_schema,
+    )(views.ProfilingAPIView.post)
+
+    extend_schema(
+        operation_id="11_profiling_stop",
+        description="샘플링 프로파일 종료 API. 관리자만 접근 가능. 수집한 결과를 파일에 기록",
+        examples=[PROFILING_STATUS_EXAMPLE],
+        **profiling_schema,
+    )(views.ProfilingAPIView.delete)
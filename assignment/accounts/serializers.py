@@ -1,10 +1,48 @@
+from asgiref.sync import sync_to_async
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth import get_user_model, authenticate
 from django.contrib.auth.password_validation import validate_password
-from django.db import IntegrityError
+from contextlib import nullcontext
+from django.db import IntegrityError, router, transaction
+from . import hashing
+from .audit import record_event
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+    TokenError,
+)
+from rest_framework_simplejwt.settings import api_settings
+from .denylist import token_denylist
+from .instrumentation import phase
+from .models import AuditEvent
+from .ratelimit import LoginThrottled, get_client_ip, get_login_rate_limiter
+from .renderers import PreEncodedDict
+from .routers import amark_written, mark_written, primary_if_written
+from .sharding import encode_user_id, user_queryset
+from .tokens import UserRefreshToken
 
 User = get_user_model()
 
+# 에러 응답 본문
+USER_ALREADY_EXISTS_ERROR = PreEncodedDict(
+    {
+        "error": {
+            "code": "USER_ALREADY_EXISTS",
+            "message": "이미 가입된 사용자입니다.",
+        }
+    }
+)
+
+INVALID_CREDENTIALS_ERROR = PreEncodedDict(
+    {
+        "error": {
+            "code": "INVALID_CREDENTIALS",
+            "message": "아이디 또는 비밀번호가 올바르지 않습니다.",
+        }
+    }
+)
+
 
 class SignupSerializer(serializers.ModelSerializer):
     # 비밀번호 필드를 쓰기 전용으로 설정
@@ -26,31 +64,80 @@ class SignupSerializer(serializers.ModelSerializer):
 
     # 데이터 저장 기능
     def create(self, validated_data):
-        # 데이터 저장
-        user = User.objects.create(
-            username=validated_data["username"], nickname=validated_data["nickname"]
-        )
-        # 비밀번호 설정
-        user.set_password(validated_data["password"])
-        # 데이터 저장
-        user.save()
-        return user
+        return create_user(validated_data)
 
-    # 검증
-    def validate(self, data):
 
-        # 중복 사용자 검증
-        if User.objects.filter(username=data.get("username")).exists():
-            raise serializers.ValidationError(
-                {
-                    "error": {
-                        "code": "USER_ALREADY_EXISTS",
-                        "message": "이미 가입된 사용자입니다.",
-                    }
-                }
-            )
+def create_user(validated_data):
+    """
+    검증된 회원가입 데이터로 사용자 생성
+    - 비밀번호를 먼저 해시한 뒤 한 번의 INSERT로 저장 (해시 작업 풀 사용 시 별도 프로세스에서 계산)
+    """
+    user = User(
+        username=validated_data["username"],
+        nickname=validated_data["nickname"],
+        password=hashing.make_password(validated_data["password"]),
+    )
+    insert_user(user)
+    return user
 
-        return data
+
+def insert_user(user):
+    """
+    사용자를 한 번의 INSERT로 저장
+    - 중복 사용자 검증은 별도 조회 없이 username unique 제약으로 처리
+    - 저장 DB는 라우터가 선택 (기본 DB 또는 username의 샤드)
+    - 바깥 트랜잭션(ATOMIC_REQUESTS, 테스트 등) 안에서는 savepoint로 IntegrityError를 격리
+    - 읽기 복제본 사용 시 가입 직후 로그인/조회는 기본 DB에서 수행하도록 등록
+    """
+    using = router.db_for_write(User, instance=user)
+    connection = transaction.get_connection(using)
+    context = transaction.atomic(using) if connection.in_atomic_block else nullcontext()
+
+    try:
+        with context:
+            user.save(using=using, force_insert=True)
+    except IntegrityError:
+        raise serializers.ValidationError(USER_ALREADY_EXISTS_ERROR)
+
+    mark_written(f"username:{user.username}", f"user:{encode_user_id(user)}")
+
+
+def _savepoint(using):
+    # 바깥 트랜잭션 안에서만 savepoint 생성 (insert_user와 같은 기준)
+    if transaction.get_connection(using).in_atomic_block:
+        return transaction.savepoint(using)
+    return None
+
+
+def _rollback_savepoint(savepoint_id, using):
+    # save()가 바깥 트랜잭션에 표시한 rollback 필요 상태를 해제한 뒤 savepoint로 되돌림
+    # (atomic()이 savepoint를 되돌릴 때와 같은 순서)
+    transaction.set_rollback(False, using)
+    transaction.savepoint_rollback(savepoint_id, using)
+
+
+async def ainsert_user(user):
+    """
+    insert_user()의 비동기 버전, 비동기 ORM(acreate)으로 한 번의 INSERT 수행 후 저장된 사용자 반환
+    - 비동기 ORM에는 atomic()이 없으므로 바깥 트랜잭션 안에서는 savepoint를 직접 생성/해제
+      (savepoint와 INSERT는 모두 같은 DB 연결 스레드에서 실행)
+    """
+    using = router.db_for_write(User, instance=user)
+    savepoint_id = await sync_to_async(_savepoint)(using)
+
+    try:
+        user = await User.objects.db_manager(using).acreate(
+            username=user.username, nickname=user.nickname, password=user.password
+        )
+    except IntegrityError:
+        if savepoint_id is not None:
+            await sync_to_async(_rollback_savepoint)(savepoint_id, using)
+        raise serializers.ValidationError(USER_ALREADY_EXISTS_ERROR)
+    if savepoint_id is not None:
+        await sync_to_async(transaction.savepoint_commit)(savepoint_id, using)
+
+    await amark_written(f"username:{user.username}", f"user:{encode_user_id(user)}")
+    return user
 
 
 class LoginSerializer(serializers.Serializer):
@@ -63,19 +150,118 @@ class LoginSerializer(serializers.Serializer):
         username = data.get("username")
         password = data.get("password")
 
-        # 사용자 인증
+        # 인증 성공한 사용자 정보 반환
+        data["user"] = authenticate_login(
+            username, password, request=self.context.get("request")
+        )
+        return data
+
+
+def authenticate_login(username, password, request=None):
+    """
+    로그인 사용자 인증, 실패하면 INVALID_CREDENTIALS 에러
+    - 시도 제한, 감사 기록을 함께 처리
+    """
+    # 시도 제한 확인 (제한된 요청은 비밀번호 해시 없이 429로 거절)
+    # (거절된 시도도 대입 공격 추적을 위해 감사 기록에 남김)
+    limiter = get_login_rate_limiter()
+    if limiter is not None:
+        try:
+            limiter.check(username, get_client_ip(request) if request else None)
+        except LoginThrottled:
+            record_event(AuditEvent.LOGIN_THROTTLED, username, request=request)
+            raise
+
+    # 사용자 인증
+    with phase("authenticate"):
         user = authenticate(username=username, password=password)
 
-        if not user:
-            raise serializers.ValidationError(
-                {
-                    "error": {
-                        "code": "INVALID_CREDENTIALS",
-                        "message": "아이디 또는 비밀번호가 올바르지 않습니다.",
-                    }
-                }
-            )
+    if not user:
+        if limiter is not None:
+            limiter.failure(username)
+        record_event(AuditEvent.LOGIN_FAILURE, username, request=request)
+        raise serializers.ValidationError(INVALID_CREDENTIALS_ERROR)
+
+    if limiter is not None:
+        limiter.success(username)
+
+    # 감사 기록과 last_login 갱신은 백그라운드에서 모아서 저장
+    record_event(AuditEvent.LOGIN_SUCCESS, username, user=user, request=request)
+
+    return user
+
+
+def parse_refresh_token(raw_token):
+    """
+    리프레시 토큰 문자열 검증 (서명, 만료, 토큰 종류), 유효하지 않으면 401 응답
+    """
+    try:
+        return UserRefreshToken(raw_token)
+    except TokenError as e:
+        raise InvalidToken(e.args[0])
+
+
+class TokenRefreshSerializer(serializers.Serializer):
+    refresh = serializers.CharField(required=True)
+
+    def validate(self, data):
+        refresh = parse_refresh_token(data["refresh"])
+
+        # 사용한 리프레시 토큰은 폐기 목록에 등록 (rotation)
+        # 이미 사용되었거나 로그아웃으로 폐기된 토큰이면 거절
+        if not token_denylist.claim(refresh[api_settings.JTI_CLAIM], refresh["exp"]):
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+
+        # 새 토큰의 클레임에 최신 사용자 정보를 담기 위해 사용자 조회 (비밀번호 해시 없음)
+        user_id = refresh[api_settings.USER_ID_CLAIM]
+        with primary_if_written(f"user:{user_id}"):
+            user = user_queryset(user_id).first()
+        if user is None or (api_settings.CHECK_USER_IS_ACTIVE and not user.is_active):
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
 
-        # 인증 성공한 사용자 정보 반환
         data["user"] = user
         return data
+
+
+class LogoutSerializer(serializers.Serializer):
+    refresh = serializers.CharField(required=False)
+
+    def validate(self, data):
+        # 리프레시 토큰을 함께 보낸 경우 본인 토큰인지 확인
+        if data.get("refresh"):
+            refresh = parse_refresh_token(data["refresh"])
+            request = self.context.get("request")
+            if request is not None and refresh.get(
+                api_settings.USER_ID_CLAIM
+            ) != request.auth.get(api_settings.USER_ID_CLAIM):
+                raise InvalidToken("Token is invalid")
+            data["refresh_token"] = refresh
+        return data
+
+
+class TokenIntrospectionSerializer(serializers.Serializer):
+    tokens = serializers.ListField(child=serializers.CharField(), allow_empty=False)
+
+    def validate_tokens(self, tokens):
+        # 한 요청에서 검증할 수 있는 토큰 수 제한
+        max_tokens = settings.TOKEN_INTROSPECTION["MAX_TOKENS"]
+        if len(tokens) > max_tokens:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {max_tokens}개의 토큰을 검증할 수 있습니다."
+            )
+        return tokens
+
+
+class ProfilingSerializer(serializers.Serializer):
+    views = serializers.ListField(child=serializers.CharField(), allow_empty=False)
+    rate = serializers.FloatField(min_value=0, max_value=1, default=1.0)
+    duration = serializers.IntegerField(min_value=1, default=60)
+
+    def validate_duration(self, duration):
+        # 프로파일을 끄지 않고 방치하는 경우를 막기 위해 최대 실행 시간 제한
+        max_duration = settings.PROFILING["MAX_DURATION"]
+        if duration > max_duration:
+            raise serializers.ValidationError(
+                f"최대 {max_duration}초까지 프로파일할 수 있습니다."
+            )
+        return duration
@@ -0,0 +1,123 @@
+"""
+사용자 테이블 수평 분할(샤딩) 모듈
+
+settings.USER_SHARDS(DB 별칭 목록, 0번은 default)에 샤드가 둘 이상이면
+User를 username 해시로 정한 샤드 하나에만 저장하고, 회원가입/로그인은 해당 샤드만 조회합니다.
+
+- 샤드 선택: username의 blake2b 해시에 jump consistent hash 적용
+  샤드를 목록 뒤에 추가하면 약 1/N의 사용자만 새 샤드로 이동 (manage.py reshard_users)
+- 토큰의 user_id 클레임: (샤드 번호 << SHARD_ID_SHIFT) | pk
+  토큰만으로 샤드를 알 수 있어 별도의 디렉터리 조회 없이 사용자를 조회하며,
+  0번 샤드(default)의 사용자는 pk와 같으므로 샤딩 전에 발급한 토큰도 그대로 사용 가능
+- 샤드가 하나이면 조회 DB는 라우터(accounts.routers)가 선택 (샤드별 읽기 복제본은 사용하지 않음)
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.settings import api_settings
+
+# pk는 하위 40비트, 샤드 번호는 그 위 비트 (JavaScript 정수 범위 2**53 이내에서 샤드 4096개까지)
+SHARD_ID_SHIFT = 40
+PK_MASK = (1 << SHARD_ID_SHIFT) - 1
+
+
+def get_shards():
+    return getattr(settings, "USER_SHARDS", [DEFAULT_DB_ALIAS])
+
+
+def jump_hash(key, buckets):
+    """
+    64비트 정수 key를 0 ~ buckets-1 중 하나로 대응 (Lamping & Veach, jump consistent hash)
+    - buckets를 늘려도 기존 key는 같은 버킷에 남거나 새 버킷으로만 이동
+    """
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+def shard_index(username, count=None):
+    """
+    username이 저장될 샤드 번호 (프로세스/서버와 무관하게 항상 같은 값)
+    """
+    count = len(get_shards()) if count is None else count
+    digest = hashlib.blake2b(username.encode(), digest_size=8).digest()
+    return jump_hash(int.from_bytes(digest, "big"), count)
+
+
+def shard_for_username(username):
+    """
+    username이 저장될 샤드의 DB 별칭, 샤딩하지 않으면 None (라우터가 선택)
+    """
+    shards = get_shards()
+    if len(shards) == 1:
+        return None
+    return shards[shard_index(username, len(shards))]
+
+
+def shard_for_user(user):
+    """
+    사용자 인스턴스가 저장된(저장될) 샤드의 DB 별칭, 샤딩하지 않으면 None
+    """
+    shards = get_shards()
+    if len(shards) == 1:
+        return None
+    if user._state.db in shards:
+        return user._state.db
+    return shards[shard_index(user.username, len(shards))]
+
+
+def encode_user_id(user):
+    """
+    토큰의 user_id 클레임 값 (샤드 번호와 pk)
+    """
+    pk = getattr(user, api_settings.USER_ID_FIELD)
+    shards = get_shards()
+    if len(shards) == 1:
+        return pk
+    return (shards.index(shard_for_user(user)) << SHARD_ID_SHIFT) | pk
+
+
+def decode_user_id(user_id):
+    """
+    user_id 클레임 -> (DB 별칭, pk), 샤딩하지 않으면 DB 별칭은 None
+    - 현재 설정에 없는 샤드 번호이면 LookupError
+    """
+    shards = get_shards()
+    if len(shards) == 1:
+        return None, user_id
+    index = user_id >> SHARD_ID_SHIFT
+    if index >= len(shards):
+        raise LookupError(f"Unknown user shard {index}")
+    return shards[index], user_id & PK_MASK
+
+
+def user_queryset(user_id):
+    """
+    user_id 클레임에 해당하는 사용자 QuerySet (해당 샤드만 조회)
+    """
+    User = get_user_model()
+    try:
+        using, pk = decode_user_id(user_id)
+    except LookupError:
+        return User._default_manager.none()
+    return User._default_manager.using(using).filter(**{api_settings.USER_ID_FIELD: pk})
+
+
+def split_user_ids(user_ids):
+    """
+    user_id 클레임 목록을 샤드별로 분류 ({DB 별칭: {pk: user_id}}), 알 수 없는 샤드는 제외
+    """
+    groups = {}
+    for user_id in user_ids:
+        try:
+            using, pk = decode_user_id(user_id)
+        except LookupError:
+            continue
+        groups.setdefault(using, {})[pk] = user_id
+    return groups
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import user_cache
+from .models import User
+from .sharding import encode_user_id
+
+
+# 사용자 정보 변경(비밀번호 변경, is_active 변경 등) 또는 삭제 시 캐시 무효화
+@receiver(post_save, sender=User, dispatch_uid="accounts_invalidate_user_cache_on_save")
+@receiver(
+    post_delete, sender=User, dispatch_uid="accounts_invalidate_user_cache_on_delete"
+)
+def invalidate_user_cache(sender, instance, **kwargs):
+    user_cache.delete(encode_user_id(instance))
@@ -0,0 +1,54 @@
+import pytest
+from django.core.cache import caches
+from accounts import ratelimit
+from accounts.audit import reset_audit_log
+from accounts.cache import token_cache, user_cache
+from accounts.denylist import token_denylist
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    # 테스트 간 사용자 캐시 공유 방지
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    # 테스트 간 검증된 토큰 캐시 공유 방지
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashers(settings):
+    # 테스트에서는 저비용 해시 프로필 사용
+    settings.PASSWORD_HASHERS = settings.PASSWORD_HASHER_PROFILES["fast"]
+
+
+@pytest.fixture(autouse=True)
+def reset_login_rate_limiter():
+    # 테스트 간 로그인 시도 카운터 공유 방지
+    ratelimit.reset_login_rate_limiter()
+    yield
+    ratelimit.reset_login_rate_limiter()
+
+
+@pytest.fixture(autouse=True)
+def clear_token_denylist():
+    # 테스트 간 폐기 목록(메모리, 공유 캐시) 공유 방지
+    token_denylist.clear()
+    caches["default"].clear()
+    yield
+    token_denylist.clear()
+    caches["default"].clear()
+
+
+@pytest.fixture(autouse=True)
+def disable_audit_log(settings):
+    # 백그라운드 스레드가 테스트 트랜잭션 밖에서 저장하지 않도록 비활성화 (test_audit.py에서 개별 활성화)
+    settings.AUDIT_LOG = {**settings.AUDIT_LOG, "ENABLED": False}
+    yield
+    reset_audit_log()
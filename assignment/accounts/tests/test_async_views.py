@@ -0,0 +1,161 @@
+import json
+import threading
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db.models import QuerySet
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+from accounts.async_views import (
+    AsyncAuthTestAPIView,
+    AsyncLoginAPIView,
+    AsyncSignupAPIView,
+)
+from accounts.models import User
+from accounts.ratelimit import CacheBackend, LoginRateLimiter, MemoryBackend
+from accounts.tokens import UserAccessToken
+
+
+@pytest.fixture
+def test_user():
+    return User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+
+
+def _call_async(view_class, method, path, data=None, **extra):
+    factory = AsyncRequestFactory()
+    # AsyncRequestFactory는 HTTP 헤더를 headers 인자로 전달
+    headers = {}
+    if "HTTP_AUTHORIZATION" in extra:
+        headers["Authorization"] = extra.pop("HTTP_AUTHORIZATION")
+    if method == "post":
+        request = factory.post(
+            path, data, content_type="application/json", headers=headers
+        )
+    else:
+        request = factory.get(path, headers=headers)
+    return async_to_sync(view_class.as_view())(request)
+
+
+def _assert_same_response(sync_response, async_response):
+    assert async_response.status_code == sync_response.status_code
+    assert async_response.content == sync_response.content
+    assert async_response["Content-Type"] == sync_response["Content-Type"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"username": "newuser", "password": "newpass123", "nickname": "newnick"},
+        {"username": "testuser", "password": "newpass123", "nickname": "newnick"},
+        {"username": "", "password": "short"},
+    ],
+)
+def test_signup_matches_sync_view(client, test_user, data):
+    sync_response = client.post(
+        reverse("signup"), data, content_type="application/json"
+    )
+    User.objects.filter(username="newuser").delete()
+
+    async_response = _call_async(AsyncSignupAPIView, "post", "/signup/", data)
+    _assert_same_response(sync_response, async_response)
+
+
+@pytest.mark.django_db
+def test_signup_creates_user(test_user):
+    data = {"username": "newuser", "password": "newpass123", "nickname": "newnick"}
+    with mock.patch.object(
+        QuerySet, "acreate", autospec=True, side_effect=QuerySet.acreate
+    ) as acreate:
+        response = _call_async(AsyncSignupAPIView, "post", "/signup/", data)
+    assert response.status_code == 201
+    acreate.assert_called_once()
+    assert User.objects.get(username="newuser").check_password("newpass123")
+
+
+@pytest.mark.django_db
+def test_duplicate_signup_keeps_outer_transaction_usable(test_user):
+    data = {"username": "testuser", "password": "newpass123", "nickname": "newnick"}
+    response = _call_async(AsyncSignupAPIView, "post", "/signup/", data)
+    assert response.status_code == 400
+    # 바깥 트랜잭션(테스트)에서 이후 쿼리 실행 가능 (savepoint로 되돌림)
+    assert User.objects.filter(username="testuser").count() == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"username": "testuser", "password": "wrongpass"},
+        {"username": "testuser"},
+    ],
+)
+def test_login_errors_match_sync_view(client, test_user, data):
+    sync_response = client.post(reverse("login"), data, content_type="application/json")
+    async_response = _call_async(AsyncLoginAPIView, "post", "/login/", data)
+    _assert_same_response(sync_response, async_response)
+
+
+@pytest.mark.django_db
+def test_login_issues_token(test_user):
+    data = {"username": "testuser", "password": "testpass123"}
+    response = _call_async(AsyncLoginAPIView, "post", "/login/", data)
+    assert response.status_code == 200
+    token = UserAccessToken(json.loads(response.content)["token"])
+    assert token["user_id"] == test_user.id
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("authorization", [None, "Bearer invalidtoken", "valid"])
+def test_auth_test_matches_sync_view(client, test_user, authorization):
+    extra = {}
+    if authorization == "valid":
+        extra["HTTP_AUTHORIZATION"] = f"Bearer {UserAccessToken.for_user(test_user)}"
+    elif authorization:
+        extra["HTTP_AUTHORIZATION"] = authorization
+
+    sync_response = client.get(reverse("auth-test"), **extra)
+    async_response = _call_async(AsyncAuthTestAPIView, "get", "/auth-test/", **extra)
+    _assert_same_response(sync_response, async_response)
+    assert async_response.get("WWW-Authenticate") == sync_response.get(
+        "WWW-Authenticate"
+    )
+
+
+@pytest.mark.django_db
+def test_async_login_throttled_matches_sync(client, test_user, settings):
+    settings.LOGIN_RATE_LIMIT = {**settings.LOGIN_RATE_LIMIT, "USERNAME_LIMIT": 1}
+    data = {"username": "testuser", "password": "wrongpass"}
+
+    _call_async(AsyncLoginAPIView, "post", "/login/", data)
+    async_response = _call_async(AsyncLoginAPIView, "post", "/login/", data)
+    sync_response = client.post(reverse("login"), data)
+
+    _assert_same_response(sync_response, async_response)
+    assert async_response.status_code == 429
+    assert async_response["Retry-After"] == sync_response["Retry-After"]
+
+
+@pytest.mark.parametrize(
+    "backend, off_loop", [(MemoryBackend(), False), (CacheBackend(), True)]
+)
+def test_async_limiter_runs_blocking_backend_off_loop(backend, off_loop):
+    limiter = LoginRateLimiter(backend)
+    threads = []
+    incr = backend.incr
+
+    def recording_incr(*args):
+        threads.append(threading.current_thread())
+        return incr(*args)
+
+    async def check():
+        await limiter.acheck("user", "10.0.0.1")
+        return threading.current_thread()
+
+    with mock.patch.object(backend, "incr", recording_incr):
+        loop_thread = async_to_sync(check)()
+
+    assert (threads[0] is not loop_thread) == off_loop
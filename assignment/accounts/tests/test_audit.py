@@ -0,0 +1,172 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+
+from accounts.async_views import AsyncLoginAPIView
+from accounts.audit import AuditLog, get_audit_log, reset_audit_log
+from accounts.models import AuditEvent, User
+
+ASSIGNMENT_DIR = Path(__file__).resolve().parents[2]
+
+# BATCH_SIZE개가 모이면 백그라운드 스레드가 저장하고, 남은 기록은 종료 시 저장
+SCRIPT = """
+import json, sys, time
+import django
+django.setup()
+from django.core.management import call_command
+from accounts.audit import get_audit_log
+from accounts.models import AuditEvent
+
+call_command("migrate", verbosity=0)
+audit_log = get_audit_log()
+for index in range(5):
+    audit_log.record(AuditEvent.LOGIN_FAILURE, f"user{index}")
+
+deadline = time.monotonic() + 5
+while audit_log.stats()["written"] < 5 and time.monotonic() < deadline:
+    time.sleep(0.01)
+written = audit_log.stats()["written"]
+
+audit_log.record(AuditEvent.LOGIN_FAILURE, "late1")
+audit_log.record(AuditEvent.LOGIN_FAILURE, "late2")
+print(json.dumps({"written_by_size": written}))
+"""
+
+
+@pytest.fixture
+def audit_log(settings):
+    settings.AUDIT_LOG = {
+        "ENABLED": True,
+        "MAX_QUEUE": 100,
+        "BATCH_SIZE": 100,
+        "FLUSH_INTERVAL": 60,
+    }
+    reset_audit_log()
+    audit_log = get_audit_log()
+    yield audit_log
+    # 백그라운드 스레드가 아닌 테스트 스레드에서 저장
+    audit_log.flush()
+
+
+@pytest.mark.django_db
+def test_signup_and_login_are_recorded_in_batch(client, audit_log):
+    body = {"username": "audited", "password": "testpass123", "nickname": "nick"}
+    client.post(reverse("signup"), body, content_type="application/json")
+    client.post(reverse("login"), body, content_type="application/json")
+    client.post(
+        reverse("login"),
+        {"username": "audited", "password": "wrong-password"},
+        content_type="application/json",
+    )
+
+    # 요청 처리 중에는 저장하지 않음
+    assert not AuditEvent.objects.exists()
+    assert User.objects.get(username="audited").last_login is None
+    assert audit_log.stats()["queued"] == 3
+
+    audit_log.flush()
+
+    user = User.objects.get(username="audited")
+    events = list(
+        AuditEvent.objects.order_by("created_at").values_list("event", "user_id")
+    )
+    assert events == [
+        (AuditEvent.SIGNUP, user.id),
+        (AuditEvent.LOGIN_SUCCESS, user.id),
+        (AuditEvent.LOGIN_FAILURE, None),
+    ]
+    assert AuditEvent.objects.filter(ip_address="127.0.0.1").count() == 3
+    assert user.last_login is not None
+    assert audit_log.stats()["last_logins"] == 1
+
+
+@pytest.mark.django_db
+def test_throttled_logins_are_recorded(client, audit_log, settings):
+    settings.LOGIN_RATE_LIMIT = {**settings.LOGIN_RATE_LIMIT, "USERNAME_LIMIT": 1}
+    sync_body = {"username": "attacked", "password": "wrong-password"}
+    async_body = {"username": "attacked-async", "password": "wrong-password"}
+    view = async_to_sync(AsyncLoginAPIView.as_view())
+    factory = AsyncRequestFactory()
+
+    statuses = []
+    for _ in range(2):
+        response = client.post(
+            reverse("login"), sync_body, content_type="application/json"
+        )
+        statuses.append(response.status_code)
+    for _ in range(2):
+        request = factory.post("/login/", async_body, content_type="application/json")
+        statuses.append(view(request).status_code)
+    assert statuses == [400, 429, 400, 429]
+
+    audit_log.flush()
+
+    # 시도 제한으로 거절된 요청도 username, IP와 함께 기록
+    events = list(
+        AuditEvent.objects.order_by("created_at").values_list("event", "username")
+    )
+    assert events == [
+        (AuditEvent.LOGIN_FAILURE, "attacked"),
+        (AuditEvent.LOGIN_THROTTLED, "attacked"),
+        (AuditEvent.LOGIN_FAILURE, "attacked-async"),
+        (AuditEvent.LOGIN_THROTTLED, "attacked-async"),
+    ]
+    assert AuditEvent.objects.filter(ip_address="127.0.0.1").count() == 4
+
+
+@pytest.mark.django_db
+def test_events_are_dropped_when_queue_is_full():
+    audit_log = AuditLog(max_queue=2, batch_size=100, flush_interval=60)
+    results = [audit_log.record(AuditEvent.LOGIN_FAILURE, "someone") for _ in range(3)]
+
+    assert results == [True, True, False]
+    assert audit_log.stats()["dropped"] == 1
+
+    audit_log.flush()
+    audit_log.close()
+    assert AuditEvent.objects.count() == 2
+    assert audit_log.stats() == {
+        "written": 2,
+        "dropped": 1,
+        "failed": 0,
+        "last_logins": 0,
+        "queued": 0,
+        "pending_last_logins": 0,
+    }
+
+
+def test_background_writer_flushes_on_size_and_exit(tmp_path):
+    database = tmp_path / "audit.sqlite3"
+    environ = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "config.settings",
+        "SECRET_KEY": "x",
+        "PYTHONPATH": str(ASSIGNMENT_DIR),
+        "DB_NAME": str(database),
+        "AUDIT_LOG_ENABLED": "True",
+        "AUDIT_LOG_BATCH_SIZE": "5",
+        "AUDIT_LOG_FLUSH_INTERVAL": "60",
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=tmp_path,
+        env=environ,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert json.loads(output.strip().splitlines()[-1]) == {"written_by_size": 5}
+    with sqlite3.connect(database) as connection:
+        (count,) = connection.execute(
+            "SELECT COUNT(*) FROM accounts_auditevent"
+        ).fetchone()
+    assert count == 7
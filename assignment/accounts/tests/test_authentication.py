@@ -0,0 +1,101 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from accounts.models import User
+from accounts.tokens import USER_CLAIMS, UserAccessToken, UserRefreshToken
+from accounts.authentication import (
+    ClaimsUser,
+    StatelessJWTAuthentication,
+    VerifiedJWTAuthentication,
+)
+
+
+@pytest.fixture
+def test_user():
+    return User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+
+
+def _request_with_token(token):
+    return APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+@pytest.mark.django_db
+def test_login_token_contains_user_claims(client, test_user):
+    response = client.post(
+        reverse("login"), {"username": "testuser", "password": "testpass123"}
+    )
+    token = UserAccessToken(response.data["token"])
+    assert token["user_id"] == test_user.id
+    assert token["username"] == "testuser"
+    assert token["nickname"] == "testnick"
+    assert token["is_active"] is True
+
+
+@pytest.mark.django_db
+def test_access_and_refresh_tokens_share_user_claims(test_user):
+    refresh = UserRefreshToken.for_user(test_user)
+    tokens = [UserAccessToken.for_user(test_user), refresh, refresh.access_token]
+
+    claims = ("user_id", *USER_CLAIMS)
+    expected = {
+        "user_id": test_user.id,
+        "username": "testuser",
+        "nickname": "testnick",
+        "is_active": True,
+    }
+    for token in tokens:
+        assert {claim: token[claim] for claim in claims} == expected
+
+
+@pytest.mark.django_db
+def test_auth_test_skips_user_query(client, test_user, django_assert_num_queries):
+    token = UserAccessToken.for_user(test_user)
+    with django_assert_num_queries(0):
+        response = client.get(
+            reverse("auth-test"), HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_stateless_user_built_from_claims(test_user):
+    token = UserAccessToken.for_user(test_user)
+    user, _ = StatelessJWTAuthentication().authenticate(_request_with_token(token))
+    assert isinstance(user, ClaimsUser)
+    assert user.id == test_user.id
+    assert user.nickname == "testnick"
+    assert user.is_authenticated
+
+
+@pytest.mark.django_db
+def test_inactive_claim_rejected(client, test_user):
+    test_user.is_active = False
+    token = UserAccessToken.for_user(test_user)
+    response = client.get(reverse("auth-test"), HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.data["error"]["code"] == "AUTHENTICATION_FAILED"
+
+
+@pytest.mark.django_db
+def test_verified_mode_reads_fresh_user_state(test_user):
+    token = UserAccessToken.for_user(test_user)
+    user, _ = VerifiedJWTAuthentication().authenticate(_request_with_token(token))
+    assert isinstance(user, User)
+
+    # 토큰 발급 이후 비활성화된 사용자는 DB 검증 모드에서만 거부됨
+    User.objects.filter(pk=test_user.pk).update(is_active=False)
+    with pytest.raises(AuthenticationFailed, match="inactive"):
+        VerifiedJWTAuthentication().authenticate(_request_with_token(token))
+
+
+@pytest.mark.django_db
+def test_verify_user_in_db_setting(settings, test_user, django_assert_num_queries):
+    settings.JWT_VERIFY_USER_IN_DB = True
+    token = UserAccessToken.for_user(test_user)
+    with django_assert_num_queries(1):
+        user, _ = StatelessJWTAuthentication().authenticate(_request_with_token(token))
+    assert isinstance(user, User)
@@ -0,0 +1,96 @@
+import io
+import json
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from accounts.bulk_import import import_users, read_rows
+from accounts.models import User
+from accounts.tokens import UserAccessToken
+
+JSONL = "\n".join(
+    [
+        json.dumps({"username": "bulk1", "password": "bulkpass123", "nickname": "b1"}),
+        json.dumps({"username": "bulk2", "password": "bulkpass123", "nickname": "b2"}),
+        json.dumps({"username": "bulk1", "password": "bulkpass123", "nickname": "b1"}),
+        json.dumps(
+            {"username": "testuser", "password": "bulkpass123", "nickname": "t"}
+        ),
+        json.dumps({"username": "bulk3", "password": "short", "nickname": "b3"}),
+        "not json",
+    ]
+)
+
+
+@pytest.fixture
+def test_user():
+    return User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+
+
+@pytest.mark.django_db
+def test_import_reports_each_row(test_user):
+    results = list(import_users(read_rows(io.StringIO(JSONL)), chunk_size=2))
+
+    assert [(r["line"], r["status"]) for r in results] == [
+        (1, "created"),
+        (2, "created"),
+        (3, "duplicate"),
+        (4, "duplicate"),
+        (5, "invalid"),
+        (6, "invalid"),
+    ]
+    assert "password" in results[4]["errors"]
+    assert User.objects.get(username="bulk2").check_password("bulkpass123")
+    assert User.objects.filter(username__startswith="bulk").count() == 2
+
+
+@pytest.mark.django_db
+def test_import_users_command_reads_csv(tmp_path, capsys):
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "username,password,nickname\ncsv1,csvpass123,c1\ncsv2,csvpass123,\n",
+        encoding="utf-8",
+    )
+
+    call_command("import_users", str(path), "--workers", "1")
+
+    out, err = capsys.readouterr()
+    statuses = [json.loads(line)["status"] for line in out.splitlines()]
+    assert statuses == ["created", "invalid"]
+    assert "created=1 duplicate=0 invalid=1" in err
+
+
+@pytest.mark.django_db
+def test_bulk_signup_endpoint_streams_report(client, test_user):
+    url = reverse("bulk-signup")
+    token = UserAccessToken.for_user(test_user)
+
+    response = client.post(
+        url,
+        JSONL,
+        content_type="application/x-ndjson",
+        HTTP_AUTHORIZATION=f"Bearer {token}",
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    test_user.is_staff = True
+    test_user.save()
+    response = client.post(
+        url + "?chunk_size=3",
+        JSONL,
+        content_type="application/x-ndjson",
+        HTTP_AUTHORIZATION=f"Bearer {token}",
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert [json.loads(line)["status"] for line in lines] == [
+        "created",
+        "created",
+        "duplicate",
+        "duplicate",
+        "invalid",
+        "invalid",
+    ]
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from config.database import database_config, replica_configs
+
+
+def test_sqlite_config_is_tuned_for_concurrent_writes():
+    config = database_config(Path("/srv"), env={})
+
+    assert config["ENGINE"] == "django.db.backends.sqlite3"
+    assert config["NAME"] == Path("/srv/db.sqlite3")
+    assert "PRAGMA journal_mode=WAL" in config["OPTIONS"]["init_command"]
+    assert "PRAGMA synchronous=NORMAL" in config["OPTIONS"]["init_command"]
+    assert config["OPTIONS"]["transaction_mode"] == "IMMEDIATE"
+    assert config["OPTIONS"]["timeout"] == 5
+
+
+def test_postgresql_pool_disables_persistent_connections():
+    config = database_config(
+        Path("/srv"),
+        env={
+            "DB_ENGINE": "postgresql",
+            "DB_NAME": "accounts",
+            "DB_CONN_MAX_AGE": "300",
+            "DB_POOL": "True",
+            "DB_POOL_MAX_SIZE": "20",
+        },
+    )
+
+    assert config["ENGINE"] == "django.db.backends.postgresql"
+    assert config["CONN_MAX_AGE"] == 0
+    assert config["OPTIONS"]["pool"]["max_size"] == 20
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        database_config(Path("/srv"), env={"DB_ENGINE": "mysql"})
+
+
+def test_replicas_share_primary_settings():
+    env = {"DB_ENGINE": "postgresql", "DB_HOST": "primary", "DB_PORT": "5432"}
+    primary = database_config(Path("/srv"), env=env)
+    replicas = replica_configs(
+        primary, env={**env, "DB_REPLICAS": "replica-a, replica-b:6432"}
+    )
+
+    assert list(replicas) == ["replica1", "replica2"]
+    assert replicas["replica1"]["HOST"] == "replica-a"
+    assert replicas["replica1"]["PORT"] == "5432"
+    assert replicas["replica2"]["PORT"] == "6432"
+    assert replicas["replica2"]["NAME"] == primary["NAME"]
+    # 테스트 실행 시에는 기본 DB를 그대로 사용
+    assert replicas["replica1"]["TEST"] == {"MIRROR": "default"}
+    assert replica_configs(primary, env=env) == {}
@@ -0,0 +1,137 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from accounts.denylist import BloomFilter, TokenDenylist
+from accounts.models import User
+from accounts.tokens import UserAccessToken, UserRefreshToken
+
+
+@pytest.fixture
+def test_user():
+    return User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+
+
+def _login(client):
+    response = client.post(
+        reverse("login"), {"username": "testuser", "password": "testpass123"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return response.data
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"jti-{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_denylist_entries_expire_at_exp():
+    denylist = TokenDenylist(capacity=10)
+    denylist.revoke("a", exp=200, now=100)
+
+    assert denylist.is_revoked("a", now=150)
+    assert not denylist.is_revoked("b", now=150)
+    assert not denylist.is_revoked("a", now=200)
+
+
+def test_denylist_rebuilds_bloom_after_expiry():
+    denylist = TokenDenylist(capacity=10)
+    for i in range(10):
+        denylist.revoke(f"old-{i}", exp=110, now=100)
+    denylist.revoke("new", exp=300, now=200)
+
+    # 만료된 항목은 제거되고 블룸 필터는 남은 항목으로 다시 구성
+    assert denylist.stats()["size"] == 1
+    assert denylist.stats()["bloom_count"] == 1
+    assert denylist.is_revoked("new", now=250)
+
+
+@pytest.mark.django_db
+def test_denylist_claim_is_single_use():
+    denylist = TokenDenylist(cache_alias="default")
+
+    assert denylist.claim("jti", exp=2_000_000_000)
+    assert not denylist.claim("jti", exp=2_000_000_000)
+
+    # 다른 프로세스(메모리가 비어 있는 인스턴스)에서도 공유 캐시로 재사용 확인
+    other = TokenDenylist(cache_alias="default")
+    assert not other.claim("jti", exp=2_000_000_000)
+    assert other.is_revoked("jti")
+
+
+@pytest.mark.django_db
+def test_login_returns_refresh_token(client, test_user):
+    data = _login(client)
+    refresh = UserRefreshToken(data["refresh"])
+    assert refresh["user_id"] == test_user.id
+    assert refresh["nickname"] == "testnick"
+    assert UserAccessToken(data["token"])["nickname"] == "testnick"
+
+
+@pytest.mark.django_db
+def test_refresh_rotates_tokens(client, test_user, django_assert_num_queries):
+    data = _login(client)
+
+    # 비밀번호 검증 없이 사용자 조회 한 번으로 갱신
+    with django_assert_num_queries(1):
+        response = client.post(reverse("token-refresh"), {"refresh": data["refresh"]})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["refresh"] != data["refresh"]
+
+    response = client.get(
+        reverse("auth-test"), HTTP_AUTHORIZATION=f"Bearer {response.data['token']}"
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # 사용한 리프레시 토큰은 재사용 불가
+    response = client.post(reverse("token-refresh"), {"refresh": data["refresh"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.data["error"]["code"] == "TOKEN_REVOKED"
+
+
+@pytest.mark.django_db
+def test_refresh_rejects_access_token(client, test_user):
+    data = _login(client)
+    response = client.post(reverse("token-refresh"), {"refresh": data["token"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_logout_revokes_tokens(client, test_user, django_assert_num_queries):
+    data = _login(client)
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {data['token']}"}
+
+    response = client.post(reverse("logout"), {"refresh": data["refresh"]}, **headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    # 폐기 확인은 DB 조회 없이 수행
+    with django_assert_num_queries(0):
+        response = client.get(reverse("auth-test"), **headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.data["error"]["code"] == "TOKEN_REVOKED"
+
+    response = client.post(reverse("token-refresh"), {"refresh": data["refresh"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.data["error"]["code"] == "TOKEN_REVOKED"
+
+
+@pytest.mark.django_db
+def test_logout_rejects_other_users_refresh_token(client, test_user):
+    other = User.objects.create_user(
+        username="other", password="otherpass123", nickname="other"
+    )
+    data = _login(client)
+
+    response = client.post(
+        reverse("logout"),
+        {"refresh": str(UserRefreshToken.for_user(other))},
+        HTTP_AUTHORIZATION=f"Bearer {data['token']}",
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
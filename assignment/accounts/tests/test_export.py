@@ -0,0 +1,101 @@
+import csv
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from accounts.export import export_users, iter_pages
+from accounts.models import User
+from accounts.tokens import UserAccessToken
+
+
+@pytest.fixture
+def users():
+    return [
+        User.objects.create_user(
+            username=f"export{index}", password="testpass123", nickname=f"닉{index}"
+        )
+        for index in range(5)
+    ]
+
+
+@pytest.mark.django_db
+def test_pages_use_keyset_pagination(users):
+    with CaptureQueriesContext(connection) as queries:
+        pages = list(iter_pages(chunk_size=2))
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [row[0] for page in pages for row in page] == [user.pk for user in users]
+    # 마지막 페이지가 chunk_size보다 작으면 더 조회하지 않음, OFFSET 사용하지 않음
+    assert len(queries) == 3
+    assert f'"id" > {users[1].pk}' in queries[1]["sql"]
+    assert all("OFFSET" not in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_ndjson_and_csv_have_same_rows(users):
+    users[0].is_active = False
+    users[0].save()
+
+    lines = "".join(export_users("ndjson", chunk_size=2)).splitlines()
+    rows = list(csv.DictReader(io.StringIO("".join(export_users("csv", 2)))))
+
+    assert json.loads(lines[0]) == {
+        "id": users[0].pk,
+        "username": "export0",
+        "nickname": "닉0",
+        "date_joined": users[0].date_joined.isoformat(),
+        "is_active": False,
+    }
+    assert rows[0] == {
+        "id": str(users[0].pk),
+        "username": "export0",
+        "nickname": "닉0",
+        "date_joined": users[0].date_joined.isoformat(),
+        "is_active": "false",
+    }
+    assert [json.loads(line)["username"] for line in lines] == [
+        row["username"] for row in rows
+    ]
+
+
+@pytest.mark.django_db
+def test_export_users_command_writes_file(users, tmp_path, capsys):
+    path = tmp_path / "users.csv"
+
+    call_command("export_users", str(path), "--chunk-size", "2")
+
+    rows = list(csv.DictReader(path.open(encoding="utf-8", newline="")))
+    assert [row["username"] for row in rows] == [user.username for user in users]
+    assert "exported=5" in capsys.readouterr().err
+
+
+@pytest.mark.django_db
+def test_user_export_endpoint_streams_for_admin(client, users):
+    url = reverse("user-export")
+    token = UserAccessToken.for_user(users[0])
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    assert client.get(url, **headers).status_code == status.HTTP_403_FORBIDDEN
+
+    users[0].is_staff = True
+    users[0].save()
+    response = client.get(url, {"chunk_size": 2}, **headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert len(lines) == 5
+
+    response = client.get(url, {"output": "csv"}, **headers)
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+    assert b"".join(response.streaming_content).startswith(b"id,username,")
+
+    response = client.get(url, {"output": "xml"}, **headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["error"]["code"] == "INVALID_OUTPUT"
@@ -0,0 +1,58 @@
+import pytest
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.urls import reverse
+from rest_framework import status
+from accounts.hashers import TunablePBKDF2PasswordHasher, TunableScryptPasswordHasher
+from accounts.models import User
+
+
+@pytest.fixture
+def pbkdf2_profile(settings):
+    settings.PASSWORD_HASHERS = settings.PASSWORD_HASHER_PROFILES["pbkdf2"]
+    settings.PASSWORD_HASHER_OPTIONS = {"PBKDF2_ITERATIONS": 1000}
+
+
+def test_work_factors_follow_settings(settings):
+    settings.PASSWORD_HASHER_OPTIONS = {
+        "PBKDF2_ITERATIONS": 1234,
+        "SCRYPT_WORK_FACTOR": 2**10,
+    }
+    assert TunablePBKDF2PasswordHasher().iterations == 1234
+    assert TunableScryptPasswordHasher().work_factor == 2**10
+
+    encoded = TunablePBKDF2PasswordHasher().encode("password", "salt")
+    assert encoded.startswith("pbkdf2_sha256$1234$")
+
+
+@pytest.mark.django_db
+def test_login_upgrades_hash_to_current_work_factor(client, settings, pbkdf2_profile):
+    user = User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+    assert identify_hasher(user.password).decode(user.password)["iterations"] == 1000
+
+    settings.PASSWORD_HASHER_OPTIONS = {"PBKDF2_ITERATIONS": 2000}
+    response = client.post(
+        reverse("login"), {"username": "testuser", "password": "testpass123"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    user.refresh_from_db()
+    assert identify_hasher(user.password).decode(user.password)["iterations"] == 2000
+
+
+@pytest.mark.django_db
+def test_login_upgrades_hash_to_preferred_algorithm(client, pbkdf2_profile, settings):
+    User.objects.create(
+        username="testuser",
+        nickname="testnick",
+        password=make_password("testpass123", hasher="pbkdf2_sha256"),
+    )
+
+    settings.PASSWORD_HASHERS = settings.PASSWORD_HASHER_PROFILES["scrypt"]
+    settings.PASSWORD_HASHER_OPTIONS = {"SCRYPT_WORK_FACTOR": 2**10}
+    response = client.post(
+        reverse("login"), {"username": "testuser", "password": "testpass123"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert User.objects.get(username="testuser").password.startswith("scrypt$1024$")
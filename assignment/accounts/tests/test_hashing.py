@@ -0,0 +1,53 @@
+import time
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.urls import reverse
+from rest_framework import status
+from accounts import hashing
+from accounts.hashing import HashPoolBusy, PasswordHashPool
+from accounts.models import User
+
+
+@pytest.fixture
+def hash_pool(monkeypatch):
+    pool = PasswordHashPool(max_workers=1, max_pending=0, retry_after=3)
+    monkeypatch.setattr(hashing, "get_hash_pool", lambda: pool)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.django_db
+def test_signup_and_login_hash_in_pool(client, hash_pool):
+    response = client.post(
+        reverse("signup"),
+        {"username": "pooluser", "password": "poolpass123", "nickname": "pool"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    user = User.objects.get(username="pooluser")
+    assert check_password("poolpass123", user.password)
+
+    response = client.post(
+        reverse("login"), {"username": "pooluser", "password": "poolpass123"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_full_queue_returns_503_with_retry_after(client, hash_pool):
+    User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+    # 작업 프로세스가 시작될 때까지 대기한 뒤 유일한 자리를 점유
+    hash_pool.run(time.sleep, 0)
+    busy = hash_pool.submit(time.sleep, 1)
+
+    with pytest.raises(HashPoolBusy):
+        hash_pool.submit(time.sleep, 0)
+
+    response = client.post(
+        reverse("login"), {"username": "testuser", "password": "testpass123"}
+    )
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response["Retry-After"] == "3"
+    assert response.data["error"]["code"] == "SERVICE_BUSY"
+    busy.result()
@@ -0,0 +1,114 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from accounts import instrumentation
+from accounts.instrumentation import phase, registry
+from accounts.models import User
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    registry.clear()
+    yield
+    registry.clear()
+
+
+@pytest.fixture
+def test_user():
+    return User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+
+
+def _login(client):
+    return client.post(
+        reverse("login"), {"username": "testuser", "password": "testpass123"}
+    )
+
+
+def _server_timing(response):
+    return {
+        entry.split(";")[0]: entry for entry in response["Server-Timing"].split(", ")
+    }
+
+
+@pytest.mark.django_db
+def test_server_timing_header_is_opt_in(client, settings, test_user):
+    response = _login(client)
+    assert response.status_code == status.HTTP_200_OK
+    assert "Server-Timing" not in response
+
+    settings.INSTRUMENTATION = {**settings.INSTRUMENTATION, "SERVER_TIMING": True}
+    response = _login(client)
+    entries = _server_timing(response)
+    assert {"validate", "authenticate", "hash", "db", "jwt", "render", "total"} <= set(
+        entries
+    )
+    assert 'desc="1 queries"' in entries["db"]
+
+
+@pytest.mark.django_db
+def test_signup_records_hash_phase(client, settings):
+    settings.INSTRUMENTATION = {**settings.INSTRUMENTATION, "SERVER_TIMING": True}
+    response = client.post(
+        reverse("signup"),
+        {"username": "newuser", "password": "newpass123", "nickname": "newnick"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert {"validate", "hash", "db"} <= set(_server_timing(response))
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exports_histograms(client, settings, test_user):
+    settings.INSTRUMENTATION = {**settings.INSTRUMENTATION, "METRICS_TOKEN": "secret"}
+    _login(client)
+    response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret")
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"].startswith("text/plain")
+
+    body = response.content.decode()
+    assert (
+        'accounts_request_seconds_count{view="login",method="POST",status="200"} 1'
+        in body
+    )
+    assert 'accounts_phase_seconds_count{view="login",phase="authenticate"} 1' in body
+    assert 'accounts_db_queries_bucket{view="login",le="1"} 1' in body
+    assert "accounts_user_cache_hits_total" in body
+
+
+@pytest.mark.django_db
+def test_metric_labels_are_bounded(client):
+    for method in ("FOO1", "FOO2"):
+        client.generic(method, reverse("login"))
+    client.get("/no-such-path-1/")
+    client.get("/no-such-path-2/")
+
+    labels = set(registry.request_seconds._series)
+    assert labels == {("login", "other", "405"), ("unmatched", "GET", "404")}
+
+
+def test_metrics_token_required(client, settings):
+    settings.INSTRUMENTATION = {**settings.INSTRUMENTATION, "METRICS_TOKEN": ""}
+    response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer ")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    settings.INSTRUMENTATION = {**settings.INSTRUMENTATION, "METRICS_TOKEN": "secret"}
+    assert client.get(reverse("metrics")).status_code == status.HTTP_403_FORBIDDEN
+    response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret")
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_instrumentation_disabled(client, settings, test_user):
+    settings.INSTRUMENTATION = {**settings.INSTRUMENTATION, "ENABLED": False}
+    _login(client)
+    assert registry.request_seconds._series == {}
+
+
+def test_phase_outside_request_is_noop():
+    with phase("validate") as current:
+        pass
+    assert current is instrumentation._null_phase
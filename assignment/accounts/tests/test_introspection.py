@@ -0,0 +1,99 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from accounts.denylist import token_denylist
+from accounts.models import User
+from accounts.tokens import UserAccessToken, UserRefreshToken
+
+
+@pytest.fixture
+def admin_headers():
+    admin = User.objects.create_user(
+        username="admin", password="adminpass123", nickname="admin", is_staff=True
+    )
+    return {"HTTP_AUTHORIZATION": f"Bearer {UserAccessToken.for_user(admin)}"}
+
+
+@pytest.fixture
+def users():
+    return [
+        User.objects.create_user(
+            username=f"user{i}", password="testpass123", nickname=f"nick{i}"
+        )
+        for i in range(3)
+    ]
+
+
+def _introspect(client, headers, tokens):
+    return client.post(
+        reverse("token-introspect"),
+        {"tokens": tokens},
+        content_type="application/json",
+        **headers,
+    )
+
+
+@pytest.mark.django_db
+def test_introspection_reports_per_token_status(client, admin_headers, users):
+    expired = UserAccessToken.for_user(users[1])
+    expired.set_exp(lifetime=-timedelta(seconds=1))
+    revoked = UserAccessToken.for_user(users[2])
+    token_denylist.revoke(revoked["jti"], revoked["exp"])
+
+    inactive_user = users[2]
+    inactive = UserAccessToken.for_user(inactive_user)
+    inactive_user.is_active = False
+    inactive_user.save()
+
+    tokens = [
+        str(UserAccessToken.for_user(users[0])),
+        str(expired),
+        "not-a-token",
+        str(revoked),
+        str(inactive),
+        str(UserRefreshToken.for_user(users[0])),
+    ]
+    response = _introspect(client, admin_headers, tokens)
+    assert response.status_code == status.HTTP_200_OK
+
+    results = response.json()["results"]
+    assert results[0]["active"] is True
+    assert results[0]["user_id"] == users[0].id
+    assert results[0]["nickname"] == "nick0"
+    assert [result.get("error", {}).get("code") for result in results[1:]] == [
+        "TOKEN_EXPIRED",
+        "INVALID_TOKEN",
+        "TOKEN_REVOKED",
+        "AUTHENTICATION_FAILED",
+        "AUTHENTICATION_FAILED",
+    ]
+    assert all(result["active"] is False for result in results[1:])
+
+
+@pytest.mark.django_db
+def test_introspection_resolves_users_in_one_query(
+    client, admin_headers, users, django_assert_num_queries
+):
+    tokens = [str(UserAccessToken.for_user(user)) for user in users] * 50
+
+    # 관리자 사용자 조회 1회 + 토큰 사용자 일괄 조회 1회
+    with django_assert_num_queries(2):
+        response = _introspect(client, admin_headers, tokens)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["results"]) == 150
+
+
+@pytest.mark.django_db
+def test_introspection_limits_batch_size(client, admin_headers, settings):
+    settings.TOKEN_INTROSPECTION = {"MAX_TOKENS": 2}
+    response = _introspect(client, admin_headers, ["a", "b", "c"])
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_introspection_requires_admin(client, users):
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {UserAccessToken.for_user(users[0])}"}
+    response = _introspect(client, headers, ["a"])
+    assert response.status_code == status.HTTP_403_FORBIDDEN
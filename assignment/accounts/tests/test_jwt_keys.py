@@ -0,0 +1,126 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.exceptions import TokenError
+from accounts import jwt_keys
+from accounts.models import User
+from accounts.tokens import UserAccessToken
+
+
+@pytest.fixture
+def test_user():
+    return User(id=1, username="testuser", nickname="testnick", is_active=True)
+
+
+@pytest.fixture(autouse=True)
+def reset_token_backend():
+    # 테스트마다 JWT_KEYS 설정을 다시 읽도록 초기화
+    jwt_keys.reset_token_backend()
+    yield
+    jwt_keys.reset_token_backend()
+
+
+@pytest.fixture
+def use_keys(settings, tmp_path):
+    def configure(keys, algorithm="HS256", active_kid="", accept_legacy=True):
+        for path in tmp_path.glob("*.pem"):
+            path.unlink()
+        for kid, data in keys.items():
+            (tmp_path / f"{kid}.pem").write_bytes(data)
+        settings.JWT_KEYS = {
+            "DIR": str(tmp_path),
+            "ALGORITHM": algorithm,
+            "ACTIVE_KID": active_kid,
+            "ACCEPT_LEGACY": accept_legacy,
+            "JWKS_MAX_AGE": 300,
+        }
+        jwt_keys.reset_token_backend()
+
+    return configure
+
+
+def test_default_keyring_issues_tokens_without_kid(test_user):
+    token = str(UserAccessToken.for_user(test_user))
+    assert "kid" not in jwt.get_unverified_header(token)
+    assert UserAccessToken(token)["username"] == "testuser"
+
+
+def test_key_rotation_keeps_old_tokens_valid(use_keys, test_user):
+    keys = {"k1": b"first-secret", "k2": b"second-secret"}
+    use_keys(keys, active_kid="k1")
+    old_token = str(UserAccessToken.for_user(test_user))
+    assert jwt.get_unverified_header(old_token)["kid"] == "k1"
+
+    # 새 키 활성화 후에도 이전 키로 서명한 토큰은 검증
+    use_keys(keys, active_kid="k2")
+    new_token = str(UserAccessToken.for_user(test_user))
+    assert jwt.get_unverified_header(new_token)["kid"] == "k2"
+    assert UserAccessToken(old_token)["user_id"] == 1
+
+    # 이전 키를 제거하면 해당 키로 서명한 토큰은 거절
+    use_keys({"k2": keys["k2"]})
+    assert UserAccessToken(new_token)["user_id"] == 1
+    with pytest.raises(TokenError):
+        UserAccessToken(old_token)
+
+
+def test_unknown_kid_rejected(use_keys, test_user):
+    use_keys({"k1": b"first-secret"})
+    token = jwt.encode(
+        {"user_id": 1, "token_type": "access", "exp": 2_000_000_000, "jti": "x"},
+        "first-secret",
+        algorithm="HS256",
+        headers={"kid": "other"},
+    )
+    with pytest.raises(TokenError):
+        UserAccessToken(token)
+
+
+def test_legacy_tokens_accepted_only_when_enabled(use_keys, test_user):
+    legacy_token = str(UserAccessToken.for_user(test_user))
+
+    use_keys({"k1": b"first-secret"})
+    assert UserAccessToken(legacy_token)["user_id"] == 1
+
+    use_keys({"k1": b"first-secret"}, accept_legacy=False)
+    with pytest.raises(TokenError):
+        UserAccessToken(legacy_token)
+
+
+def test_backend_is_cached(use_keys):
+    use_keys({"k1": b"first-secret"})
+    assert jwt_keys.get_token_backend() is jwt_keys.get_token_backend()
+
+
+def test_jwks_excludes_symmetric_keys(client, use_keys):
+    use_keys({"k1": b"first-secret"})
+    response = client.get(reverse("jwks"))
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"keys": []}
+    assert response["Cache-Control"] == "public, max-age=300"
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "EdDSA"])
+def test_asymmetric_tokens_verified_with_jwks(client, use_keys, test_user, algorithm):
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+    use_keys({"2025-01": pem}, algorithm=algorithm)
+    token = str(UserAccessToken.for_user(test_user))
+
+    # 다른 서비스처럼 JWKS의 공개 키만으로 검증
+    jwks = client.get(reverse("jwks")).json()
+    assert [key["kid"] for key in jwks["keys"]] == ["2025-01"]
+    public_key = jwt.PyJWK(jwks["keys"][0]).key
+    payload = jwt.decode(token, public_key, algorithms=[algorithm])
+    assert payload["username"] == "testuser"
@@ -0,0 +1,114 @@
+import pytest
+from asgiref.sync import SyncToAsync, async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import AsyncClient, Client
+from django.urls import path, reverse
+from config.middleware import RouteGroupMiddleware
+from accounts.models import User
+from accounts.tokens import UserAccessToken
+
+
+async def _ping_view(request):
+    return HttpResponse()
+
+
+urlpatterns = [path("ping/", _ping_view, name="ping")]
+
+
+async def _async_get_response(request):
+    return HttpResponse()
+
+
+@pytest.fixture
+def admin_user():
+    return User.objects.create_superuser(
+        username="admin", password="adminpass123", nickname="admin"
+    )
+
+
+@pytest.mark.django_db
+def test_api_routes_skip_session_middleware(client):
+    user = User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+    token = UserAccessToken.for_user(user)
+
+    response = client.get(
+        reverse("auth-test"), headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    # 관리자 그룹 미들웨어(XFrameOptions, Session 등)는 실행되지 않음
+    assert "X-Frame-Options" not in response
+    assert not hasattr(response.wsgi_request, "session")
+
+
+@pytest.mark.django_db
+def test_admin_routes_run_full_middleware(client, admin_user):
+    response = client.get("/admin/login/")
+
+    assert response.status_code == 200
+    assert response["X-Frame-Options"] == "DENY"
+    assert "csrftoken" in response.cookies
+
+    client.force_login(admin_user)
+    assert client.get("/admin/").status_code == 200
+
+
+@pytest.mark.django_db
+def test_admin_csrf_process_view_is_applied():
+    client = Client(enforce_csrf_checks=True)
+
+    response = client.post(
+        "/admin/login/", {"username": "admin", "password": "adminpass123"}
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db(transaction=True)
+def test_route_groups_under_asgi(admin_user):
+    client = AsyncClient()
+
+    admin_response = async_to_sync(client.get)("/admin/login/")
+    api_response = async_to_sync(client.get)(reverse("auth-test"))
+
+    assert admin_response.status_code == 200
+    assert admin_response["X-Frame-Options"] == "DENY"
+    assert api_response.status_code == 401
+    assert "X-Frame-Options" not in api_response
+
+
+def test_hooks_are_exposed_only_for_groups_with_hooks(settings):
+    settings.MIDDLEWARE_GROUPS = {}
+    settings.MIDDLEWARE_ROUTES = []
+    middleware = RouteGroupMiddleware(_async_get_response)
+    assert not hasattr(middleware, "process_view")
+    assert not hasattr(middleware, "process_template_response")
+    assert not hasattr(middleware, "process_exception")
+
+    settings.MIDDLEWARE_GROUPS = {
+        "csrf": ["django.middleware.csrf.CsrfViewMiddleware"],
+    }
+    middleware = RouteGroupMiddleware(_async_get_response)
+    assert iscoroutinefunction(middleware.process_view)
+    assert not hasattr(middleware, "process_exception")
+
+
+@pytest.mark.urls(__name__)
+def test_ungrouped_async_route_has_no_thread_hop(monkeypatch):
+    called = []
+    original = SyncToAsync.__call__
+
+    async def record(self, *args, **kwargs):
+        called.append(getattr(self.func, "__qualname__", repr(self.func)))
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(SyncToAsync, "__call__", record)
+    response = async_to_sync(AsyncClient().get)("/ping/")
+
+    assert response.status_code == 200
+    # 경로별 그룹/프로파일링 미들웨어의 훅으로 인한 스레드 전환 없음
+    # (Django 기본 MiddlewareMixin 미들웨어의 전환은 제외)
+    ours = ("RouteGroupMiddleware.", "ProfilingMiddleware.", "MiddlewareChain.")
+    assert not [name for name in called if name.startswith(ours)]
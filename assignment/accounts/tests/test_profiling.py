@@ -0,0 +1,194 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import AsyncClient
+from django.urls import path, reverse
+from rest_framework import status
+from accounts.models import User
+from accounts.profiling import (
+    ProfilingMiddleware,
+    SamplingProfiler,
+    get_profiler,
+    reset_profiler,
+)
+from accounts.tokens import UserAccessToken
+
+
+@pytest.fixture(autouse=True)
+def profiling_settings(settings, tmp_path):
+    settings.PROFILING = {**settings.PROFILING, "DIR": str(tmp_path)}
+    reset_profiler()
+    yield
+    reset_profiler()
+
+
+@pytest.fixture
+def admin_headers():
+    admin = User.objects.create_user(
+        username="admin", password="adminpass123", nickname="admin", is_staff=True
+    )
+    return {"HTTP_AUTHORIZATION": f"Bearer {UserAccessToken.for_user(admin)}"}
+
+
+def _busy_loop(stop):
+    while not stop.is_set():
+        sum(range(100))
+
+
+def _spin(seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sum(range(100))
+
+
+async def _busy_async_view(request):
+    _spin(0.2)
+    return HttpResponse()
+
+
+def _busy_sync_view(request):
+    _spin(0.2)
+    return HttpResponse()
+
+
+urlpatterns = [
+    path("busy-async/", _busy_async_view, name="busy-async"),
+    path("busy-sync/", _busy_sync_view, name="busy-sync"),
+]
+
+
+def test_sampler_writes_collapsed_stacks(tmp_path):
+    profiler = SamplingProfiler(str(tmp_path))
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,))
+    worker.start()
+    try:
+        profiler.start("login", worker.ident)
+        for _ in range(5):
+            profiler.sample()
+    finally:
+        stop.set()
+        worker.join()
+
+    assert profiler.samples == 5
+    path = profiler.flush(force=True)
+    lines = Path(path).read_text().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("login;")
+    assert "test_profiling:_busy_loop" in stack
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == 5
+
+
+def test_sampler_bounds_distinct_stacks(tmp_path):
+    profiler = SamplingProfiler(str(tmp_path), max_stacks=1)
+    frame = sys._getframe()
+    profiler._record("login", frame)
+    profiler._record("login", frame.f_back)
+    assert profiler.stacks["login;[truncated]"] == 1
+    assert len(profiler.stacks) == 2
+
+
+def test_control_file_is_shared_between_workers(tmp_path):
+    control_file = str(tmp_path / "profiling.json")
+    first = SamplingProfiler(str(tmp_path), control_file=control_file)
+    second = SamplingProfiler(str(tmp_path), control_file=control_file)
+
+    first.configure(["login"], rate=1.0, duration=60)
+    assert second.should_profile("login")
+    assert not second.should_profile("signup")
+
+    first.disable()
+    second._control_checked = 0.0
+    assert not second.should_profile("login")
+
+
+def test_profiling_expires():
+    profiler = get_profiler()
+    profiler.configure(["login"], rate=1.0, duration=60)
+    profiler.clock = lambda: time.time() + 61
+    assert not profiler.should_profile("login")
+
+
+def test_async_middleware_provides_async_process_view():
+    async def get_response(request):
+        return HttpResponse()
+
+    # Django 핸들러가 process_view를 sync_to_async로 감싸지 않음
+    assert iscoroutinefunction(ProfilingMiddleware(get_response).process_view)
+    assert not iscoroutinefunction(ProfilingMiddleware(HttpResponse).process_view)
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.parametrize(
+    "view_name,function",
+    [("busy-async", "_busy_async_view"), ("busy-sync", "_busy_sync_view")],
+)
+def test_asgi_samples_view_thread(view_name, function):
+    profiler = get_profiler()
+    profiler.configure([view_name], rate=1.0, duration=60)
+
+    response = async_to_sync(AsyncClient().get)(f"/{view_name}/")
+
+    assert response.status_code == status.HTTP_200_OK
+    # 비동기 뷰는 이벤트 루프 스레드, 동기 뷰는 뷰를 실행한 스레드의 스택을 수집
+    in_view = sum(
+        count
+        for stack, count in profiler.stacks.items()
+        if f"test_profiling:{function}" in stack
+    )
+    assert profiler.samples > 0
+    assert in_view >= profiler.samples / 2
+
+
+@pytest.mark.django_db
+def test_profiling_endpoint_toggles_view(client, admin_headers, monkeypatch):
+    started = []
+    monkeypatch.setattr(
+        SamplingProfiler, "start", lambda self, view_name: started.append(view_name)
+    )
+
+    response = client.post(
+        reverse("profiling"),
+        {"views": ["auth-test"], "rate": 1.0, "duration": 60},
+        content_type="application/json",
+        **admin_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["active"] is True
+
+    client.get(reverse("auth-test"), **admin_headers)
+    client.get(reverse("user-cache-stats"), **admin_headers)
+    assert started == ["auth-test"]
+
+    response = client.delete(reverse("profiling"), **admin_headers)
+    assert response.json()["active"] is False
+    client.get(reverse("auth-test"), **admin_headers)
+    assert started == ["auth-test"]
+
+
+@pytest.mark.django_db
+def test_profiling_endpoint_validates_request(client, admin_headers, settings):
+    settings.PROFILING = {**settings.PROFILING, "MAX_DURATION": 60}
+    response = client.post(
+        reverse("profiling"),
+        {"views": ["login"], "rate": 2, "duration": 61},
+        content_type="application/json",
+        **admin_headers,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert {"rate", "duration"} <= set(response.json())
+
+
+@pytest.mark.django_db
+def test_profiling_endpoint_requires_admin(client):
+    user = User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {UserAccessToken.for_user(user)}"}
+    response = client.get(reverse("profiling"), **headers)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,150 @@
+import pytest
+from unittest import mock
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework import status
+from accounts.models import User
+from accounts.ratelimit import (
+    CacheBackend,
+    LoginRateLimiter,
+    LoginThrottled,
+    MemoryBackend,
+    get_client_ip,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["memory", "cache"])
+def backend(request):
+    if request.param == "memory":
+        yield MemoryBackend()
+        return
+    caches["default"].clear()
+    yield CacheBackend(window=60)
+    caches["default"].clear()
+
+
+def test_ip_limit_uses_sliding_window(backend):
+    clock = FakeClock(1200.0)  # 구간 시작 시점
+    limiter = LoginRateLimiter(backend, window=60, ip_limit=3, clock=clock)
+
+    for _ in range(3):
+        limiter.check("user", "10.0.0.1")
+    with pytest.raises(LoginThrottled) as exc_info:
+        limiter.check("user", "10.0.0.1")
+    assert exc_info.value.wait >= 1
+
+    # 다른 IP는 영향 없음
+    limiter.check("user", "10.0.0.2")
+
+    # 다음 구간 절반이 지나면 이전 구간 횟수의 절반만 반영
+    clock.now = 1290.0
+    limiter.check("user", "10.0.0.1")
+    with pytest.raises(LoginThrottled):
+        limiter.check("user", "10.0.0.1")
+
+
+def test_username_lockout_and_reset_on_success(backend):
+    clock = FakeClock()
+    limiter = LoginRateLimiter(
+        backend, window=60, username_limit=3, lockout=300, clock=clock
+    )
+
+    limiter.failure("victim")
+    limiter.failure("victim")
+    limiter.success("victim")
+    limiter.failure("victim")
+    limiter.failure("victim")
+    limiter.check("victim", None)
+
+    limiter.failure("victim")
+    with pytest.raises(LoginThrottled) as exc_info:
+        limiter.check("victim", None)
+    assert exc_info.value.wait == 300
+
+    # 잠금 시간이 지나면 다시 시도 가능
+    clock.now += 301
+    limiter.check("victim", None)
+
+
+def test_memory_backend_is_bounded():
+    backend = MemoryBackend(max_size=2)
+    for key in ("a", "b", "c"):
+        backend.incr(key, 1)
+    assert backend.get("a", 1) == (0, 0)
+    assert backend.get("c", 1) == (1, 0)
+
+
+@pytest.mark.django_db
+def test_login_throttled_before_password_hashing(client, settings):
+    settings.LOGIN_RATE_LIMIT = {**settings.LOGIN_RATE_LIMIT, "USERNAME_LIMIT": 2}
+    User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+    url = reverse("login")
+    data = {"username": "testuser", "password": "wrongpass"}
+
+    for _ in range(2):
+        assert client.post(url, data).status_code == status.HTTP_400_BAD_REQUEST
+
+    with mock.patch("accounts.serializers.authenticate") as authenticate:
+        response = client.post(url, {"username": "testuser", "password": "testpass123"})
+
+    authenticate.assert_not_called()
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.json()["error"]["code"] == "TOO_MANY_LOGIN_ATTEMPTS"
+    assert int(response["Retry-After"]) > 0
+
+
+@pytest.mark.django_db
+def test_login_rate_limit_disabled(client, settings):
+    settings.LOGIN_RATE_LIMIT = {
+        **settings.LOGIN_RATE_LIMIT,
+        "ENABLED": False,
+        "USERNAME_LIMIT": 1,
+    }
+    url = reverse("login")
+    data = {"username": "nobody", "password": "wrongpass"}
+
+    for _ in range(3):
+        assert client.post(url, data).status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_client_ip_ignores_forwarded_for_without_trusted_proxies(rf, settings):
+    request = rf.get(
+        "/", REMOTE_ADDR="10.0.0.9", HTTP_X_FORWARDED_FOR="1.1.1.1, 2.2.2.2"
+    )
+    assert get_client_ip(request) == "10.0.0.9"
+
+    settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+    assert get_client_ip(request) == "2.2.2.2"
+    settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 5}
+    assert get_client_ip(request) == "1.1.1.1"
+
+
+@pytest.mark.django_db
+def test_spoofed_forwarded_for_does_not_reset_ip_limit(client, settings):
+    settings.LOGIN_RATE_LIMIT = {**settings.LOGIN_RATE_LIMIT, "IP_LIMIT": 2}
+    url = reverse("login")
+
+    statuses = [
+        client.post(
+            url,
+            {"username": f"user{index}", "password": "wrongpass"},
+            HTTP_X_FORWARDED_FOR=f"203.0.113.{index}",
+        ).status_code
+        for index in range(3)
+    ]
+
+    assert statuses == [
+        status.HTTP_400_BAD_REQUEST,
+        status.HTTP_400_BAD_REQUEST,
+        status.HTTP_429_TOO_MANY_REQUESTS,
+    ]
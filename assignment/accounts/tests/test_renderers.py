@@ -0,0 +1,116 @@
+import datetime
+import decimal
+import io
+import uuid
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils.serializer_helpers import ReturnDict
+from accounts.parsers import FastJSONContentNegotiation, FastJSONParser
+from accounts.models import User
+from accounts.renderers import FastJSONRenderer, PreEncodedDict
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"message": "인증 성공"},
+        {"error": {"code": ErrorDetail("INVALID", code="invalid"), "message": "x"}},
+        ReturnDict({"username": [ErrorDetail("필수 항목입니다.")]}, serializer=None),
+        {"line": "  ", "quote": '"\\/'},
+        {"token": "eyJ0eXAi.1e5.2E-9", "nested": [{"ratio": 0.5}]},
+        {"when": datetime.datetime(2025, 1, 2, 3, 4, 5, 678901)},
+        {"amount": decimal.Decimal("1.50"), "ratio": 1e-05, "big": 10**20},
+        {1: "non-str key", "id": uuid.UUID(int=1)},
+        {"lazy": gettext_lazy("This field is required."), "items": {1, 2}},
+        [],
+    ],
+)
+def test_renderer_output_matches_json_renderer(data):
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renderer_indent_matches_json_renderer():
+    data = {"message": "인증 성공"}
+    media_type = "application/json; indent=4"
+    assert FastJSONRenderer().render(data, media_type) == JSONRenderer().render(
+        data, media_type
+    )
+
+
+@pytest.mark.django_db
+def test_login_response_is_rendered_by_orjson_only(client, monkeypatch):
+    User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+
+    # 토큰 문자열의 "숫자 + e" 등은 JSONRenderer로 다시 렌더링하지 않음
+    def fail(*args, **kwargs):
+        raise AssertionError("JSONRenderer fallback")
+
+    monkeypatch.setattr(JSONRenderer, "render", fail)
+    for _ in range(20):
+        response = client.post(
+            reverse("login"),
+            {"username": "testuser", "password": "testpass123"},
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+        assert response.json()["token"]
+
+
+def test_pre_encoded_dict_is_read_only():
+    data = PreEncodedDict({"message": "인증 성공"})
+
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(dict(data))
+    with pytest.raises(TypeError):
+        data["message"] = "changed"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"username": "testuser", "password": "testpass123"}',
+        b'{"id": 123456789012345678901234567890}',
+        b'{"username": "\\u2028"}',
+        b'{"username": "testuser",}',
+        b'{"value": NaN}',
+        b"\xff",
+    ],
+)
+def test_parser_matches_json_parser(body):
+    def parse(parser):
+        try:
+            return parser.parse(io.BytesIO(body))
+        except ParseError as exc:
+            return ("error", str(exc.detail))
+
+    assert parse(FastJSONParser()) == parse(JSONParser())
+
+
+@pytest.mark.parametrize(
+    "accept,query",
+    [
+        (None, ""),
+        ("*/*", ""),
+        ("application/json", ""),
+        ("application/json; indent=4", ""),
+        ("text/html", ""),
+        ("*/*", "?format=api"),
+    ],
+)
+def test_negotiation_matches_default(accept, query):
+    headers = {"HTTP_ACCEPT": accept} if accept else {}
+    request = Request(APIRequestFactory().get(f"/auth-test/{query}", **headers))
+    renderers = [FastJSONRenderer(), BrowsableAPIRenderer()]
+
+    fast = FastJSONContentNegotiation().select_renderer(request, renderers)
+    default = DefaultContentNegotiation().select_renderer(request, renderers)
+
+    assert fast == default
@@ -0,0 +1,118 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from accounts.models import User
+from accounts.routers import (
+    PrimaryReplicaRouter,
+    mark_written,
+    primary_if_written,
+    use_primary,
+)
+
+ASSIGNMENT_DIR = Path(__file__).resolve().parents[2]
+
+# 기본 DB와 복제본 대역(SQLite 파일 두 개)으로 회원가입 후 로그인
+# 복제는 sqlite3 백업으로 기본 DB 파일을 복제본 파일에 복사하여 흉내냄
+SCRIPT = """
+import json, os, sqlite3
+import django
+django.setup()
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections
+from django.test import Client
+from django.test.utils import setup_test_environment
+
+def replicate():
+    connections.close_all()
+    with sqlite3.connect(os.environ["DB_NAME"]) as source:
+        with sqlite3.connect(os.environ["DB_REPLICAS"]) as target:
+            source.backup(target)
+
+setup_test_environment()
+call_command("migrate", verbosity=0)
+replicate()
+
+client = Client()
+body = {"username": "replicated", "password": "testpass123", "nickname": "nick"}
+login = lambda: client.post("/login/", body, content_type="application/json").status_code
+
+result = {"signup": client.post("/signup/", body, content_type="application/json").status_code}
+result["sticky_login"] = login()
+cache.clear()
+result["replica_login"] = login()
+replicate()
+result["replicated_login"] = login()
+print(json.dumps(result))
+"""
+
+
+@pytest.fixture
+def replicas(settings):
+    settings.DATABASE_ROUTING = {**settings.DATABASE_ROUTING, "REPLICAS": ["replica1"]}
+
+
+def test_reads_go_to_replica_and_writes_to_primary(replicas):
+    router = PrimaryReplicaRouter()
+    assert router.db_for_read(User) == "replica1"
+    assert router.db_for_write(User) == "default"
+
+    with use_primary():
+        assert router.db_for_read(User) == "default"
+    assert router.db_for_read(User) == "replica1"
+
+
+def test_router_is_inactive_without_replicas():
+    router = PrimaryReplicaRouter()
+    assert router.db_for_read(User) is None
+    assert router.db_for_write(User) is None
+
+
+def test_recent_writes_are_read_from_primary(replicas):
+    router = PrimaryReplicaRouter()
+    mark_written("username:fresh")
+
+    with primary_if_written("username:fresh"):
+        assert router.db_for_read(User) == "default"
+    with primary_if_written("username:other"):
+        assert router.db_for_read(User) == "replica1"
+
+
+@pytest.mark.django_db
+def test_reads_inside_transaction_use_primary(replicas):
+    # 테스트 트랜잭션 안에서는 방금 기록한 데이터를 읽도록 기본 DB 사용
+    assert PrimaryReplicaRouter().db_for_read(User) == "default"
+
+
+def test_login_after_signup_with_sqlite_replica(tmp_path):
+    environ = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "config.settings",
+        "SECRET_KEY": "x",
+        "PYTHONPATH": str(ASSIGNMENT_DIR),
+        "PROCESS_PROFILE": "api",
+        "PASSWORD_HASHER_PROFILE": "fast",
+        "DB_NAME": str(tmp_path / "primary.sqlite3"),
+        "DB_REPLICAS": str(tmp_path / "replica.sqlite3"),
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=tmp_path,
+        env=environ,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+
+    assert result["signup"] == 201
+    # 가입 직후 로그인은 기본 DB에서 조회
+    assert result["sticky_login"] == 200
+    # 기간이 지나면 복제본에서 조회 (아직 복제되지 않은 사용자)
+    assert result["replica_login"] == 400
+    assert result["replicated_login"] == 200
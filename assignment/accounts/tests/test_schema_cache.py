@@ -0,0 +1,166 @@
+import gzip
+import pytest
+from unittest import mock
+from django.core.management import call_command
+from django.urls import reverse
+from drf_spectacular.generators import SchemaGenerator
+from accounts.schema_cache import schema_cache, warm_schema_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    schema_cache.clear()
+    yield
+    schema_cache.clear()
+
+
+@pytest.mark.django_db
+def test_schema_generated_once(client):
+    url = reverse("schema")
+    get_schema = SchemaGenerator.get_schema
+    calls = []
+
+    def counting_get_schema(self, *args, **kwargs):
+        calls.append(1)
+        return get_schema(self, *args, **kwargs)
+
+    with mock.patch.object(SchemaGenerator, "get_schema", counting_get_schema):
+        first = client.get(url)
+        second = client.get(url)
+
+    assert len(calls) == 1
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert first["ETag"] == second["ETag"]
+    assert first["Content-Type"] == "application/vnd.oai.openapi; charset=utf-8"
+
+
+@pytest.mark.django_db
+def test_schema_not_modified(client):
+    url = reverse("schema")
+    etag = client.get(url)["ETag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_schema_gzip_and_json(client):
+    url = reverse("schema")
+    plain = client.get(url, headers={"Accept": "application/json"})
+    compressed = client.get(
+        url, headers={"Accept": "application/json", "Accept-Encoding": "gzip"}
+    )
+
+    assert plain["Content-Type"].startswith("application/json")
+    assert "Content-Encoding" not in plain
+    assert compressed["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.content) == plain.content
+    assert compressed["ETag"] == plain["ETag"][:-1] + '-gzip"'
+    assert compressed["Vary"] == plain["Vary"] == "Accept, Accept-Encoding"
+    assert plain.json()["openapi"].startswith("3.")
+
+
+@pytest.mark.django_db
+def test_schema_etag_depends_on_encoding(client):
+    url = reverse("schema")
+    etag = client.get(url)["ETag"]
+    gzip_etag = client.get(url, headers={"Accept-Encoding": "gzip"})["ETag"]
+
+    # 압축하지 않은 본문의 ETag로는 gzip 본문을 재사용하지 않음
+    response = client.get(
+        url, headers={"If-None-Match": etag, "Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response["Content-Encoding"] == "gzip"
+
+    response = client.get(url, headers={"If-None-Match": gzip_etag})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response
+
+    response = client.get(
+        url, headers={"If-None-Match": gzip_etag, "Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 304
+    assert response["ETag"] == gzip_etag
+
+
+def _counting_get_schema(calls):
+    get_schema = SchemaGenerator.get_schema
+
+    def counting_get_schema(self, *args, **kwargs):
+        calls.append(self.api_version)
+        return get_schema(self, *args, **kwargs)
+
+    return mock.patch.object(SchemaGenerator, "get_schema", counting_get_schema)
+
+
+@pytest.mark.django_db
+def test_unknown_query_values_share_default_entry(client):
+    url = reverse("schema")
+    calls = []
+
+    with _counting_get_schema(calls):
+        default = client.get(url)
+        responses = [
+            client.get(url, {"version": "v1"}),
+            client.get(url, {"version": "../../x"}),
+            client.get(url, {"lang": "zz"}),
+        ]
+        client.get(url, headers={"Accept": "application/json"})
+        indented = client.get(url, headers={"Accept": "application/json; indent=3"})
+
+    # 요청 값마다 스키마를 생성하거나 캐시 항목을 늘리지 않음 (yaml, json 형식별 한 번)
+    assert calls == [None, None]
+    assert len(schema_cache._entries) == 2
+    for response in responses:
+        assert response.content == default.content
+        assert response["Content-Disposition"] == default["Content-Disposition"]
+    assert indented["Content-Type"] == "application/json"
+
+
+@pytest.mark.django_db
+def test_allowed_version_and_language_are_cached_separately(client, settings):
+    settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "ALLOWED_VERSIONS": ["v1"]}
+    url = reverse("schema")
+    calls = []
+
+    with _counting_get_schema(calls):
+        response = client.get(url, {"version": "v1"})
+        client.get(url, {"version": "v1"})
+        client.get(url, {"version": "v2"})
+        client.get(url, {"lang": "ko"})
+
+    assert calls == ["v1", None, None]
+    assert "(v1)" in response["Content-Disposition"]
+    assert len(schema_cache._entries) == 3
+
+
+@pytest.mark.django_db
+def test_warm_schema_cache(client):
+    url = reverse("schema")
+    generated = client.get(url, headers={"Accept": "application/json"})
+    schema_cache.clear()
+
+    warm_schema_cache()
+    with mock.patch.object(SchemaGenerator, "get_schema") as get_schema:
+        response = client.get(url, headers={"Accept": "application/json"})
+
+    get_schema.assert_not_called()
+    assert response.content == generated.content
+
+
+@pytest.mark.django_db
+def test_render_schema_files_are_served(client, settings, tmp_path):
+    call_command("render_schema", output=str(tmp_path), stdout=mock.Mock())
+    assert (tmp_path / "schema.yaml.gz").exists()
+    settings.SCHEMA_CACHE = {"DIR": str(tmp_path)}
+
+    with mock.patch.object(SchemaGenerator, "get_schema") as get_schema:
+        response = client.get(reverse("schema"))
+
+    get_schema.assert_not_called()
+    assert response.content == (tmp_path / "schema.yaml").read_bytes()
@@ -0,0 +1,189 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from accounts.models import User
+from accounts.routers import PrimaryReplicaRouter
+from accounts.sharding import (
+    decode_user_id,
+    encode_user_id,
+    jump_hash,
+    shard_for_username,
+    shard_index,
+    user_queryset,
+)
+
+ASSIGNMENT_DIR = Path(__file__).resolve().parents[2]
+SHARDS = ["default", "shard1", "shard2"]
+
+# 샤드 SQLite 파일에 회원가입/로그인/DB 검증 인증 후, 사용자별 저장 위치 출력
+SIGNUP_SCRIPT = """
+import json
+import django
+django.setup()
+from django.conf import settings
+from django.core.management import call_command
+from django.test import Client
+from django.test.utils import setup_test_environment
+from accounts.models import User
+from accounts.sharding import decode_user_id
+from accounts.tokens import UserAccessToken
+
+setup_test_environment()
+for alias in settings.USER_SHARDS:
+    call_command("migrate", database=alias, verbosity=0)
+
+client = Client()
+result = {"signup": [], "login": [], "auth": [], "claims": {}}
+for index in range(30):
+    body = {"username": f"user{index}", "password": "testpass123", "nickname": "nick"}
+    result["signup"].append(client.post("/signup/", body, content_type="application/json").status_code)
+    response = client.post("/login/", body, content_type="application/json")
+    result["login"].append(response.status_code)
+    token = response.json()["token"]
+    result["claims"][body["username"]] = decode_user_id(UserAccessToken(token)["user_id"])[0]
+    result["auth"].append(client.get("/auth-test/", HTTP_AUTHORIZATION=f"Bearer {token}").status_code)
+
+result["duplicate"] = client.post(
+    "/signup/", {"username": "user0", "password": "testpass123", "nickname": "nick"},
+    content_type="application/json",
+).status_code
+result["locations"] = {
+    user.username: alias
+    for alias in settings.USER_SHARDS
+    for user in User.objects.using(alias).all()
+}
+print(json.dumps(result))
+"""
+
+# 샤드를 추가한 설정으로 사용자 이동 후 로그인
+RESHARD_SCRIPT = """
+import json, io
+import django
+django.setup()
+from django.conf import settings
+from django.core.management import call_command
+from django.test import Client
+from django.test.utils import setup_test_environment
+from accounts.models import User
+
+setup_test_environment()
+call_command("migrate", database=settings.USER_SHARDS[-1], verbosity=0)
+call_command("reshard_users", stdout=io.StringIO(), stderr=io.StringIO())
+
+client = Client()
+result = {"login": [], "locations": {}}
+for index in range(30):
+    body = {"username": f"user{index}", "password": "testpass123"}
+    result["login"].append(client.post("/login/", body, content_type="application/json").status_code)
+result["locations"] = {
+    user.username: alias
+    for alias in settings.USER_SHARDS
+    for user in User.objects.using(alias).all()
+}
+print(json.dumps(result))
+"""
+
+
+@pytest.fixture
+def shards(settings):
+    settings.USER_SHARDS = SHARDS
+
+
+def test_jump_hash_only_moves_keys_to_new_bucket():
+    keys = range(0, 2**64, 2**54 + 12345)
+    for buckets in range(1, 8):
+        for key in keys:
+            before, after = jump_hash(key, buckets), jump_hash(key, buckets + 1)
+            assert after in (before, buckets)
+
+
+def test_unsharded_user_id_is_pk():
+    user = User(id=42, username="someone")
+    assert shard_for_username("someone") is None
+    assert encode_user_id(user) == 42
+    assert decode_user_id(42) == (None, 42)
+
+
+def test_user_id_encodes_shard(shards):
+    user = User(id=42, username="someone")
+    alias = SHARDS[shard_index("someone")]
+    assert shard_for_username("someone") == alias
+    assert decode_user_id(encode_user_id(user)) == (alias, 42)
+
+    # 0번 샤드 사용자는 샤딩 전과 같은 user_id
+    user._state.db = "default"
+    assert encode_user_id(user) == 42
+
+
+def test_unknown_shard_matches_no_user(shards):
+    with pytest.raises(LookupError):
+        decode_user_id(7 << 40 | 1)
+    assert user_queryset(7 << 40 | 1).query.is_empty()
+
+
+def test_router_uses_user_shard(shards):
+    router = PrimaryReplicaRouter()
+    user = User(username="someone")
+    assert router.db_for_write(User, instance=user) == shard_for_username("someone")
+    user._state.db = "shard2"
+    assert router.db_for_read(User, instance=user) == "shard2"
+
+
+def _run(script, tmp_path, shard_count):
+    environ = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "config.settings",
+        "SECRET_KEY": "x",
+        "PYTHONPATH": str(ASSIGNMENT_DIR),
+        "PROCESS_PROFILE": "api",
+        "PASSWORD_HASHER_PROFILE": "fast",
+        "LOGIN_RATE_LIMIT_ENABLED": "False",
+        "JWT_VERIFY_USER_IN_DB": "True",
+        "DB_NAME": str(tmp_path / "shard0.sqlite3"),
+        "DB_USER_SHARDS": ",".join(
+            str(tmp_path / f"shard{index}.sqlite3") for index in range(1, shard_count)
+        ),
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        env=environ,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_signup_login_and_reshard_with_sqlite_shards(tmp_path):
+    result = _run(SIGNUP_SCRIPT, tmp_path, shard_count=3)
+    assert set(result["signup"]) == {201}
+    assert set(result["login"]) == {200}
+    # DB 검증 모드에서도 토큰의 샤드만 조회하여 인증
+    assert set(result["auth"]) == {200}
+    assert result["duplicate"] == 400
+
+    expected = {
+        f"user{index}": SHARDS[shard_index(f"user{index}", 3)] for index in range(30)
+    }
+    assert result["locations"] == expected
+    assert result["claims"] == expected
+    assert len(set(expected.values())) == 3
+
+    # 샤드를 추가하면 새 샤드로 옮겨야 하는 사용자만 이동
+    result = _run(RESHARD_SCRIPT, tmp_path, shard_count=4)
+    assert set(result["login"]) == {200}
+    shards = [*SHARDS, "shard3"]
+    moved = {
+        f"user{index}": shards[shard_index(f"user{index}", 4)] for index in range(30)
+    }
+    assert result["locations"] == moved
+    assert "shard3" in moved.values()
+    assert all(
+        moved[username] in (alias, "shard3") for username, alias in expected.items()
+    )
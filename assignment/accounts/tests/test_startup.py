@@ -0,0 +1,109 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from django.urls import resolve
+from config.lazy import LazyView
+
+ASSIGNMENT_DIR = Path(__file__).resolve().parents[2]
+
+# WSGI 애플리케이션을 불러온 뒤의 프로세스 상태
+SCRIPT = """
+import json, os, sys
+from config.wsgi import application
+from django.conf import settings
+from django.db import connections
+from django.urls import Resolver404, resolve
+
+def resolves(path):
+    try:
+        resolve(path)
+        return True
+    except Resolver404:
+        return False
+
+print(json.dumps({
+    "profile": settings.PROCESS_PROFILE,
+    "environ_profile": os.environ.get("PROCESS_PROFILE"),
+    "admin_installed": "django.contrib.admin" in settings.INSTALLED_APPS,
+    "docs_imported": "drf_spectacular.views" in sys.modules,
+    "openapi_imported": "drf_spectacular.openapi" in sys.modules,
+    "schema_modules": sorted(
+        name for name in ("accounts.schemas", "drf_spectacular")
+        if name in sys.modules
+    ),
+    "module_count": len(sys.modules),
+    "schema_cached": (
+        len(sys.modules["accounts.schema_cache"].schema_cache._entries)
+        if "accounts.schema_cache" in sys.modules
+        else 0
+    ),
+    "db_connected": connections["default"].connection is not None,
+    "schema": resolves("/schema/"),
+    "login": resolves("/login/"),
+}))
+"""
+
+
+def _load_app(tmp_path, dotenv="", **env):
+    # .env 파일은 현재 디렉토리 기준으로 탐색 (python -c 실행)
+    (tmp_path / ".env").write_text(dotenv)
+    environ = {
+        key: value for key, value in os.environ.items() if key != "PROCESS_PROFILE"
+    }
+    environ.update(
+        DJANGO_SETTINGS_MODULE="config.settings",
+        SECRET_KEY="x",
+        PYTHONPATH=str(ASSIGNMENT_DIR),
+        **env,
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=tmp_path,
+        env=environ,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_full_profile_imports_docs_lazily(tmp_path):
+    state = _load_app(tmp_path)
+    assert state["profile"] == "full"
+    assert state["admin_installed"] and state["schema"] and state["login"]
+    assert not state["docs_imported"]
+    assert not state["db_connected"]
+
+
+def test_docs_profile_renders_schema_at_startup(tmp_path):
+    state = _load_app(tmp_path, PROCESS_PROFILE="docs")
+    assert state["profile"] == "docs"
+    assert state["docs_imported"]
+    # 형식별(yaml, json 각 2개 media type) 기본 스키마를 첫 요청 전에 렌더링
+    assert state["schema_cached"] == 4
+    assert not state["db_connected"]
+
+
+def test_api_profile_from_dotenv_skips_docs_apps(tmp_path):
+    state = _load_app(tmp_path, dotenv="PROCESS_PROFILE=api\n")
+    assert state["profile"] == "api"
+    # .env 값은 os.environ에 기록하지 않음
+    assert state["environ_profile"] is None
+    assert not state["admin_installed"]
+    assert not state["docs_imported"] and not state["openapi_imported"]
+    # 문서화 모듈(@extend_schema, 예시 데이터)을 불러오지 않음
+    # (yaml, uritemplate는 설치되어 있으면 rest_framework.compat이 항상 불러옴)
+    assert state["schema_modules"] == []
+    assert state["module_count"] < _load_app(tmp_path)["module_count"]
+    assert not state["schema"] and state["login"]
+    assert not state["db_connected"]
+
+
+def test_docs_views_are_lazy(client):
+    view = resolve("/schema/").func
+    assert isinstance(view, LazyView)
+    assert client.get("/schema/").status_code == 200
+    assert view._view is not None
@@ -0,0 +1,101 @@
+import time
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from accounts.authentication import StatelessJWTAuthentication
+from accounts.cache import token_cache, token_cache_key
+from accounts.denylist import token_denylist
+from accounts.models import User
+from accounts.tokens import UserAccessToken
+
+
+@pytest.fixture
+def test_user():
+    return User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    # 서명 검증(JWTAuthentication.get_validated_token) 호출 횟수
+    calls = []
+    original = JWTAuthentication.get_validated_token
+
+    def counting(self, raw_token):
+        calls.append(raw_token)
+        return original(self, raw_token)
+
+    monkeypatch.setattr(JWTAuthentication, "get_validated_token", counting)
+    return calls
+
+
+def _authenticate(token):
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    return StatelessJWTAuthentication().authenticate(request)
+
+
+def _auth_test(client, token):
+    return client.get(reverse("auth-test"), HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+@pytest.mark.django_db
+def test_repeated_token_skips_verification(test_user, decode_calls):
+    token = UserAccessToken.for_user(test_user)
+    hits = token_cache.stats()["hits"]
+    first_user, first_token = _authenticate(token)
+    second_user, second_token = _authenticate(token)
+
+    assert len(decode_calls) == 1
+    assert second_token is first_token
+    assert second_user.id == first_user.id == test_user.id
+    assert token_cache.stats()["hits"] == hits + 1
+
+
+@pytest.mark.django_db
+def test_cache_entry_expires_with_token(test_user):
+    token = UserAccessToken.for_user(test_user)
+    token.set_exp(lifetime=timedelta(seconds=2))
+    _authenticate(token)
+
+    _, expires_at = token_cache._data[token_cache_key(str(token).encode())]
+    assert expires_at - time.monotonic() <= 2
+
+
+@pytest.mark.django_db
+def test_verification_errors_are_not_cached(client, test_user, decode_calls):
+    expired = UserAccessToken.for_user(test_user)
+    expired.set_exp(lifetime=-timedelta(seconds=1))
+
+    for _ in range(2):
+        response = _auth_test(client, expired)
+        assert response.json()["error"]["code"] == "TOKEN_EXPIRED"
+        response = _auth_test(client, "not-a-token")
+        assert response.json()["error"]["code"] == "INVALID_TOKEN"
+
+    assert len(decode_calls) == 4
+    assert token_cache.stats()["size"] == 0
+
+
+@pytest.mark.django_db
+def test_revoked_token_rejected_after_caching(client, test_user):
+    token = UserAccessToken.for_user(test_user)
+    assert _auth_test(client, token).status_code == status.HTTP_200_OK
+
+    token_denylist.revoke(token["jti"], token["exp"])
+    response = _auth_test(client, token)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["error"]["code"] == "TOKEN_REVOKED"
+
+
+@pytest.mark.django_db
+def test_token_cache_disabled(settings, test_user, decode_calls):
+    settings.TOKEN_CACHE = {**settings.TOKEN_CACHE, "ENABLED": False}
+    token = UserAccessToken.for_user(test_user)
+    _authenticate(token)
+    _authenticate(token)
+    assert len(decode_calls) == 2
@@ -0,0 +1,121 @@
+import time
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+from accounts.models import User
+from accounts.cache import LRUCache, user_cache
+from accounts.tokens import UserAccessToken
+from accounts.authentication import (
+    StatelessJWTAuthentication,
+    VerifiedJWTAuthentication,
+)
+
+
+@pytest.fixture
+def test_user():
+    return User.objects.create_user(
+        username="testuser", password="testpass123", nickname="testnick"
+    )
+
+
+@pytest.fixture(autouse=True)
+def verify_user_in_db(settings):
+    # 사용자 캐시는 JWT_VERIFY_USER_IN_DB 설정에 따른 DB 검증에서만 사용
+    settings.JWT_VERIFY_USER_IN_DB = True
+
+
+def _authenticate(token, authentication_class=StatelessJWTAuthentication):
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    return authentication_class().authenticate(request)
+
+
+def test_lru_eviction_and_counters():
+    cache = LRUCache(max_size=2, ttl=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"
+    cache.set(3, "c")  # 가장 오래 사용되지 않은 2 제거
+    assert cache.get(2) is None
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "size": 2,
+        "max_size": 2,
+    }
+
+
+def test_ttl_expiry():
+    cache = LRUCache(max_size=2, ttl=60)
+    cache.set("key", "value", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("key") is None
+
+
+@pytest.mark.django_db
+def test_repeated_requests_hit_cache(test_user, django_assert_num_queries):
+    token = UserAccessToken.for_user(test_user)
+    with django_assert_num_queries(1):
+        first, _ = _authenticate(token)
+        second, _ = _authenticate(token)
+    assert first.pk == second.pk == test_user.pk
+    # 캐시된 인스턴스와 반환된 인스턴스는 분리
+    assert first is not second
+
+
+@pytest.mark.django_db
+def test_save_and_delete_invalidate_cache(test_user):
+    token = UserAccessToken.for_user(test_user)
+    _authenticate(token)
+    assert user_cache.get(test_user.pk) is not None
+
+    test_user.set_password("changedpass123")
+    test_user.save()
+    assert user_cache.get(test_user.pk) is None
+
+    _authenticate(token)
+    test_user.delete()
+    assert user_cache.get(test_user.pk) is None
+
+
+@pytest.mark.django_db
+def test_cached_user_is_stale_until_ttl(test_user, monkeypatch):
+    monkeypatch.setattr(user_cache, "ttl", 0.05)
+    token = UserAccessToken.for_user(test_user)
+    _authenticate(token)
+
+    # 시그널을 거치지 않는 변경(QuerySet.update(), 다른 워커)은 TTL이 지날 때까지 반영되지 않음
+    User.objects.filter(pk=test_user.pk).update(is_active=False)
+    user, _ = _authenticate(token)
+    assert user.is_active
+
+    time.sleep(0.06)
+    with pytest.raises(AuthenticationFailed, match="inactive"):
+        _authenticate(token)
+
+
+@pytest.mark.django_db
+def test_verified_authentication_bypasses_cache(test_user, django_assert_num_queries):
+    token = UserAccessToken.for_user(test_user)
+    _authenticate(token)
+
+    User.objects.filter(pk=test_user.pk).update(is_active=False)
+    with django_assert_num_queries(1):
+        with pytest.raises(AuthenticationFailed, match="inactive"):
+            _authenticate(token, VerifiedJWTAuthentication)
+
+
+@pytest.mark.django_db
+def test_stats_endpoint_requires_admin(client, test_user):
+    url = reverse("user-cache-stats")
+    token = UserAccessToken.for_user(test_user)
+    response = client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    test_user.is_staff = True
+    test_user.save()
+    response = client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.data) == {"hits", "misses", "evictions", "size", "max_size"}
@@ -0,0 +1,76 @@
+import pytest
+from django.http import QueryDict
+
+from accounts.serializers import LoginSerializer, SignupSerializer
+from accounts.validation import login_validator, signup_validator
+
+
+class _LoginFieldsSerializer(LoginSerializer):
+    # 필드 검증 결과만 비교 (사용자 인증 제외)
+    def validate(self, data):
+        return data
+
+
+SIGNUP_BODIES = [
+    {"username": "user", "password": "testpass123", "nickname": "nick"},
+    {"username": "  user  ", "password": " testpass123 ", "nickname": " nick "},
+    {"username": 12345, "password": 1.5, "nickname": "nick"},
+    {"username": "user", "password": "testpass123"},
+    {},
+    {"username": "", "password": "   ", "nickname": None},
+    {"username": True, "password": ["a"], "nickname": {"a": 1}},
+    {"username": "u" * 151, "password": "p" * 129, "nickname": "n" * 51},
+    {"username": "user\x00", "password": "testpass123", "nickname": "nick"},
+    {"username": "user", "password": "testpass123", "nickname": "nick", "x": 1},
+    None,
+    [],
+    "username",
+]
+
+
+def _errors(serializer):
+    # is_valid() 실패 시 serializer.errors, 성공 시 None
+    return None if serializer.is_valid() else serializer.errors
+
+
+@pytest.mark.parametrize("body", SIGNUP_BODIES)
+def test_signup_validator_matches_serializer(body):
+    serializer = SignupSerializer(data=body)
+    errors = _errors(serializer)
+    data, compiled_errors = signup_validator.validate(body)
+
+    assert compiled_errors == errors
+    if errors is None:
+        assert data == dict(serializer.validated_data)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"username": "user", "password": "testpass123"},
+        {"username": " user ", "password": ""},
+        {"password": None},
+        {"username": False, "password": 0},
+        None,
+        [{"username": "user"}],
+    ],
+)
+def test_login_validator_matches_serializer(body):
+    serializer = _LoginFieldsSerializer(data=body)
+    errors = _errors(serializer)
+    data, compiled_errors = login_validator.validate(body)
+
+    assert compiled_errors == errors
+    if errors is None:
+        assert data == dict(serializer.validated_data)
+
+
+def test_form_data_uses_last_value():
+    body = QueryDict("username=first&username=second&password=testpass123")
+    serializer = _LoginFieldsSerializer(data=body)
+    assert serializer.is_valid()
+
+    data, errors = login_validator.validate(body)
+    assert errors is None
+    assert data == dict(serializer.validated_data)
+    assert data == {"username": "second", "password": "testpass123"}
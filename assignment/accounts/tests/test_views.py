@@ -6,6 +6,8 @@ from rest_framework_simplejwt.tokens import AccessToken
 from django.utils import timezone
 import jwt
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 @pytest.fixture
@@ -100,3 +102,21 @@ def test_auth_expired_token(client, test_user, settings):
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.data["error"]["code"] == "TOKEN_EXPIRED"
     assert response.data["error"]["message"] == "토큰이 만료되었습니다."
+
+
+@pytest.mark.django_db
+def test_signup_single_insert(client):
+    url = reverse("signup")
+    data = {"username": "newuser", "password": "newpass123", "nickname": "newnick"}
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(url, data)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    # 테스트 트랜잭션 안에서 추가되는 SAVEPOINT 문을 제외하면 INSERT 한 번만 실행
+    statements = [
+        query["sql"]
+        for query in queries.captured_queries
+        if "SAVEPOINT" not in query["sql"]
+    ]
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT")
@@ -0,0 +1,61 @@
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from .instrumentation import phase
+from .jwt_keys import get_token_backend
+from .sharding import encode_user_id
+
+# DB 조회 없이 사용자 정보를 복원하기 위해 토큰에 함께 담는 클레임 목록
+USER_CLAIMS = ("username", "nickname", "is_active")
+
+
+class KeyringTokenMixin:
+    """
+    settings.JWT_KEYS의 키로 서명/검증하고, 사용자 정보 클레임을 담아 발급하는 토큰
+    - 서명/검증은 accounts.jwt_keys.KeyringTokenBackend 사용
+    - for_user()는 기본 user_id 클레임(샤드 번호 포함)과 USER_CLAIMS를 set_user_claims()로 설정
+      (액세스 토큰과 리프레시 토큰의 클레임이 항상 같도록 한 곳에서 처리)
+    """
+
+    @property
+    def token_backend(self):
+        return get_token_backend()
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token.set_user_claims(user)
+        return token
+
+    def set_user_claims(self, user):
+        self[api_settings.USER_ID_CLAIM] = encode_user_id(user)
+
+        # 사용자 정보를 클레임으로 추가
+        for claim in USER_CLAIMS:
+            self[claim] = getattr(user, claim)
+
+
+class UserAccessToken(KeyringTokenMixin, AccessToken):
+    """
+    사용자 정보 클레임을 포함하는 액세스 토큰
+    - 인증 시 StatelessJWTAuthentication이 이 클레임만으로 사용자 객체를 구성
+    """
+
+
+class UserRefreshToken(KeyringTokenMixin, RefreshToken):
+    """
+    사용자 정보 클레임을 포함하는 리프레시 토큰
+    - access_token으로 발급하는 액세스 토큰에도 같은 클레임이 복사됨
+    - 교체(rotation) 시 사용한 토큰은 accounts.denylist.token_denylist에 등록되어 재사용 불가
+    """
+
+    access_token_class = UserAccessToken
+
+
+def issue_tokens(user):
+    """
+    로그인/토큰 갱신 응답 본문 (액세스 토큰과 리프레시 토큰)
+    """
+    with phase("jwt"):
+        refresh = UserRefreshToken.for_user(user)
+        return {"token": str(refresh.access_token), "refresh": str(refresh)}
@@ -4,5 +4,22 @@ from . import views
 urlpatterns = [
     path("signup/", views.SignupAPIView.as_view(), name="signup"),
     path("login/", views.LoginAPIView.as_view(), name="login"),
+    path("token/refresh/", views.TokenRefreshAPIView.as_view(), name="token-refresh"),
+    path(
+        "token/introspect/",
+        views.TokenIntrospectionAPIView.as_view(),
+        name="token-introspect",
+    ),
+    path("logout/", views.LogoutAPIView.as_view(), name="logout"),
+    path(".well-known/jwks.json", views.JWKSAPIView.as_view(), name="jwks"),
     path("auth-test/", views.AuthTestAPIView.as_view(), name="auth-test"),
+    path("bulk-signup/", views.BulkSignupAPIView.as_view(), name="bulk-signup"),
+    path("users/export/", views.UserExportAPIView.as_view(), name="user-export"),
+    path("metrics/", views.MetricsAPIView.as_view(), name="metrics"),
+    path("profiling/", views.ProfilingAPIView.as_view(), name="profiling"),
+    path(
+        "user-cache/stats/",
+        views.UserCacheStatsAPIView.as_view(),
+        name="user-cache-stats",
+    ),
 ]
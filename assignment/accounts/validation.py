@@ -0,0 +1,167 @@
+"""
+요청 본문 검증 모듈
+
+회원가입/로그인 API는 요청마다 Serializer 인스턴스를 만들면서 필드 객체를 복사하고,
+SignupSerializer는 ModelSerializer로서 User 모델의 필드 정보를 다시 읽어 필드를 구성합니다.
+RequestValidator는 serializer의 필드 규칙을 import 시점에 한 번만 읽어 두고,
+요청마다 dict 하나만 만들어 같은 순서로 검증합니다.
+
+- 규칙: 필수 여부, 빈 값/None 허용 여부, 앞뒤 공백 제거, 필드 검증기 목록
+  (User 모델에서 가져온 최대 길이, 필드에 지정한 검증기 등 serializer 필드의 validators를 그대로 사용)
+- 에러: serializer.errors와 같은 구조와 메시지(ErrorDetail)를 반환하여 응답 본문이 동일
+- serializer의 validate()(로그인의 사용자 인증 등)는 실행하지 않으므로 호출하는 쪽에서 수행
+"""
+
+from collections.abc import Mapping
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.fields import CharField, empty, get_error_detail
+from rest_framework.serializers import Serializer
+from rest_framework.settings import api_settings
+from rest_framework.utils import html
+
+from .serializers import LoginSerializer, SignupSerializer
+
+# serializer 자체의 에러 메시지 (본문이 dict가 아니거나 null인 경우)
+INVALID_DATA_MESSAGE = Serializer.default_error_messages["invalid"]
+NO_DATA_MESSAGE = "No data provided"
+
+
+class CompiledField:
+    """
+    serializer 문자열 필드 하나의 검증 규칙
+    """
+
+    __slots__ = (
+        "name",
+        "required",
+        "allow_blank",
+        "allow_null",
+        "trim_whitespace",
+        "validators",
+        "error_messages",
+    )
+
+    def __init__(self, field):
+        if not isinstance(field, CharField) or type(field).to_internal_value is not (
+            CharField.to_internal_value
+        ):
+            raise TypeError(f"Unsupported field {field.field_name!r}: {field!r}")
+        if any(getattr(v, "requires_context", False) for v in field.validators):
+            raise TypeError(f"Field {field.field_name!r} has context validators.")
+        if field.default is not empty:
+            raise TypeError(f"Field {field.field_name!r} has a default value.")
+
+        self.name = field.field_name
+        self.required = field.required
+        self.allow_blank = field.allow_blank
+        self.allow_null = field.allow_null
+        self.trim_whitespace = field.trim_whitespace
+        self.validators = tuple(field.validators)
+        self.error_messages = field.error_messages
+
+    def get_value(self, data, is_html):
+        """
+        요청 데이터에서 필드 값 추출 (Field.get_value와 동일), 값이 없으면 empty
+        - 폼 데이터(QueryDict)는 같은 키의 마지막 값 사용
+        """
+        if not is_html:
+            return data.get(self.name, empty)
+        if self.name not in data:
+            return empty
+        value = data[self.name]
+        if value == "" and self.allow_null:
+            return "" if self.allow_blank else None
+        if value == "" and not self.required:
+            return "" if self.allow_blank else empty
+        return value
+
+    def error(self, key):
+        return [ErrorDetail(str(self.error_messages[key]), code=key)]
+
+    def validate(self, value):
+        """
+        CharField.run_validation과 같은 순서로 검증하여 (값, 에러 목록) 반환, 값이 없으면 empty
+        """
+        if value is empty:
+            # 필수가 아닌 필드는 검증된 데이터에서 제외
+            if not self.required:
+                return empty, None
+            return None, self.error("required")
+
+        if value == "" or (self.trim_whitespace and str(value).strip() == ""):
+            if not self.allow_blank:
+                return None, self.error("blank")
+            return "", None
+
+        if value is None:
+            if not self.allow_null:
+                return None, self.error("null")
+            return None, None
+
+        if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            return None, self.error("invalid")
+        value = str(value)
+        if self.trim_whitespace:
+            value = value.strip()
+
+        errors = None
+        for validator in self.validators:
+            try:
+                validator(value)
+            except ValidationError as exc:
+                errors = (errors or []) + list(exc.detail)
+            except DjangoValidationError as exc:
+                errors = (errors or []) + get_error_detail(exc)
+        return value, errors
+
+
+class RequestValidator:
+    """
+    serializer 클래스의 쓰기 가능한 필드를 미리 읽어 둔 검증기
+    """
+
+    def __init__(self, serializer_class):
+        fields = serializer_class().fields.values()
+        self.fields = tuple(
+            CompiledField(field) for field in fields if not field.read_only
+        )
+
+    def validate(self, data):
+        """
+        (검증된 데이터, None) 또는 (None, serializer.errors와 같은 에러 dict)
+        """
+        if data is None:
+            return None, {
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    ErrorDetail(NO_DATA_MESSAGE, code="null")
+                ]
+            }
+        if not isinstance(data, Mapping):
+            message = str(INVALID_DATA_MESSAGE).format(datatype=type(data).__name__)
+            return None, {
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    ErrorDetail(message, code="invalid")
+                ]
+            }
+
+        is_html = html.is_html_input(data)
+        validated = {}
+        errors = None
+        for field in self.fields:
+            value, field_errors = field.validate(field.get_value(data, is_html))
+            if field_errors:
+                if errors is None:
+                    errors = {}
+                errors[field.name] = field_errors
+            elif value is not empty:
+                validated[field.name] = value
+
+        if errors:
+            return None, errors
+        return validated, None
+
+
+signup_validator = RequestValidator(SignupSerializer)
+login_validator = RequestValidator(LoginSerializer)
@@ -1,60 +1,71 @@
+import json
+
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.contrib.auth import authenticate
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework_simplejwt.tokens import AccessToken
-from rest_framework.permissions import AllowAny, IsAuthenticated
-from .serializers import SignupSerializer, LoginSerializer
-from rest_framework import serializers
-from drf_spectacular.utils import extend_schema
-from .schemas import (
-    ErrorResponseSerializer,
-    TokenResponseSerializer,
-    MessageResponseSerializer,
-    SIGNUP_REQUEST_EXAMPLE,
-    SIGNUP_SUCCESS_EXAMPLE,
-    SIGNUP_ERROR_EXAMPLE,
-    LOGIN_REQUEST_EXAMPLE,
-    LOGIN_SUCCESS_EXAMPLE,
-    LOGIN_ERROR_EXAMPLE,
-    AUTH_SUCCESS_EXAMPLE,
-    TOKEN_EXPIRED_EXAMPLE,
-    INVALID_TOKEN_EXAMPLE,
-    TOKEN_NOT_FOUND_EXAMPLE,
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from .serializers import (
+    LogoutSerializer,
+    ProfilingSerializer,
+    TokenIntrospectionSerializer,
+    TokenRefreshSerializer,
+    authenticate_login,
+    create_user,
 )
+from .validation import login_validator, signup_validator
+from .tokens import issue_tokens
+from .denylist import token_denylist
+from .jwt_keys import get_token_backend
+from .introspection import introspect_tokens
+from .instrumentation import HasMetricsToken, phase, registry
+from .profiling import get_profiler
+from .authentication import StatelessJWTAuthentication, VerifiedJWTAuthentication
+from .cache import user_cache
+from .bulk_import import import_users, read_rows
+from .export import CONTENT_TYPES, FORMATS, export_users
+from .audit import record_event
+from .models import AuditEvent
+from .renderers import PreEncodedDict
+from rest_framework import serializers
+from rest_framework_simplejwt.settings import api_settings
 
 """
 APIView 구현
 
-schemas.py에서 API 문서화 관련 코드를 모듈화하여:
+API 문서화(@extend_schema)는 schemas.py에서 스키마 생성 시에만 적용하여:
 - 코드 중복을 제거하고 유지보수성을 높였습니다.
 - 재사용 가능한 응답 형식과 예시를 활용하여 문서화 효율성을 증대했습니다.
 - 모든 API 응답이 일관된 형식을 유지하도록 표준화했습니다.
+- API 요청만 처리하는 프로세스는 문서화 모듈(drf_spectacular, 예시 데이터)을 불러오지 않습니다.
 """
 
-@extend_schema(
-    tags=["Signup"],
-    operation_id="2_signup",
-    description="회원가입을 위한 API. 과제 요구사항에 따라 비밀번호 유효성 검사 수정(CommonPasswordValidator, NumericPasswordValidator 주석처리)",
-    request=SignupSerializer,
-    responses={201: SignupSerializer, 400: ErrorResponseSerializer},
-    examples=[SIGNUP_REQUEST_EXAMPLE, SIGNUP_SUCCESS_EXAMPLE, SIGNUP_ERROR_EXAMPLE],
-)
+# 고정 응답 본문 (인코딩 결과 재사용)
+AUTH_SUCCESS_RESPONSE = PreEncodedDict({"message": "인증 성공"})
+LOGOUT_SUCCESS_RESPONSE = PreEncodedDict({"message": "로그아웃 성공"})
+
+
 class SignupAPIView(APIView):
     # 모든 사용자가 접근 가능하도록 설정
     permission_classes = [AllowAny]
 
     # 회원가입 기능
     def post(self, request):
-        # 요청 데이터를 직렬화
-        serializer = SignupSerializer(data=request.data)
+        # SignupSerializer와 같은 규칙으로 요청 데이터 검증 (accounts.validation)
+        with phase("validate"):
+            data, errors = signup_validator.validate(request.data)
 
-        # 직렬화된 데이터가 유효한 경우
-        if serializer.is_valid():
+        # 검증된 데이터가 유효한 경우
+        if errors is None:
             # 데이터를 DB에 저장
             try:
-                user = serializer.save()
+                user = create_user(data)
+                record_event(
+                    AuditEvent.SIGNUP, user.username, user=user, request=request
+                )
                 return Response(
                     {"username": user.username, "nickname": user.nickname},
                     status=status.HTTP_201_CREATED,
@@ -62,17 +73,9 @@ class SignupAPIView(APIView):
             except serializers.ValidationError as e:
                 return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
         else:
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-@extend_schema(
-    tags=["Login"],
-    operation_id="1_login",
-    description="로그인을 위한 API. 과제 요구사항에 따라 비밀번호 유효성 검사 옵션 수정(CommonPasswordValidator, NumericPasswordValidator 주석처리)",
-    request=LoginSerializer,
-    responses={200: TokenResponseSerializer, 400: ErrorResponseSerializer},
-    examples=[LOGIN_REQUEST_EXAMPLE, LOGIN_SUCCESS_EXAMPLE, LOGIN_ERROR_EXAMPLE],
-)
 class LoginAPIView(APIView):
     # 모든 사용자가 접근 가능하도록 설정
     permission_classes = [AllowAny]
@@ -80,38 +83,217 @@ class LoginAPIView(APIView):
     # 로그인 기능
     # 서버의 상태를 변경하는 기능이므로 POST 요청을 사용
     def post(self, request):
-        # LoginSerializer를 사용하여 데이터 검증
-        serializer = LoginSerializer(data=request.data)
+        # LoginSerializer와 같은 규칙으로 요청 데이터 검증 (accounts.validation)
+        with phase("validate"):
+            data, errors = login_validator.validate(request.data)
+        if errors is not None:
+            # 검증 에러 반환
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
-        # 직렬화된 데이터가 유효한 경우
-        if serializer.is_valid():
-            # 검증된 데이터에서 user 객체 가져오기
+        # 사용자 인증 (시도 제한에 사용할 클라이언트 정보를 위해 request 전달)
+        try:
+            user = authenticate_login(
+                data["username"], data["password"], request=request
+            )
+        except serializers.ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        # 액세스/리프레시 토큰 생성 (사용자 정보 클레임 포함)
+        return Response(issue_tokens(user), status=status.HTTP_200_OK)
+
+
+class AuthTestAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # 인증 테스트 기능
+    def get(self, request):
+        return Response(AUTH_SUCCESS_RESPONSE, status=status.HTTP_200_OK)
+
+
+class TokenRefreshAPIView(APIView):
+    # 리프레시 토큰 자체로 인증하므로 Authorization 헤더 인증은 사용하지 않음
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get_authenticate_header(self, request):
+        # 인증 클래스가 없어도 토큰 오류는 403이 아닌 401로 응답
+        return StatelessJWTAuthentication().authenticate_header(request)
+
+    # 토큰 갱신 기능
+    def post(self, request):
+        serializer = TokenRefreshSerializer(data=request.data)
+
+        with phase("validate"):
+            is_valid = serializer.is_valid()
+        if is_valid:
             user = serializer.validated_data["user"]
+            return Response(issue_tokens(user), status=status.HTTP_200_OK)
+        else:
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-            # 토큰 생성
-            access_token = AccessToken.for_user(user)
-            return Response({"token": str(access_token)}, status=status.HTTP_200_OK)
+
+class LogoutAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    # 로그아웃 기능
+    def post(self, request):
+        serializer = LogoutSerializer(data=request.data, context={"request": request})
+
+        if serializer.is_valid():
+            # 액세스 토큰과 리프레시 토큰을 각 토큰의 만료 시각까지 폐기
+            tokens = [request.auth, serializer.validated_data.get("refresh_token")]
+            for token in tokens:
+                if token is not None:
+                    token_denylist.revoke(token[api_settings.JTI_CLAIM], token["exp"])
+            return Response(LOGOUT_SUCCESS_RESPONSE, status=status.HTTP_200_OK)
         else:
-            # 직렬화 에러 반환
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class UserCacheStatsAPIView(APIView):
+    # 관리자 권한은 최신 사용자 상태로 확인
+    authentication_classes = [VerifiedJWTAuthentication]
+    permission_classes = [IsAdminUser]
 
-@extend_schema(
-    tags=["Auth-Test"],
-    operation_id="3_auth_test",
-    description="인증 테스트를 위한 API.",
-    responses={200: MessageResponseSerializer, 401: ErrorResponseSerializer},
-    examples=[
-        AUTH_SUCCESS_EXAMPLE,
-        TOKEN_EXPIRED_EXAMPLE,
-        INVALID_TOKEN_EXAMPLE,
-        TOKEN_NOT_FOUND_EXAMPLE,
-    ],
-)
-class AuthTestAPIView(APIView):
-    permission_classes = [IsAuthenticated]
+    # 캐시 통계 조회 기능
+    def get(self, request):
+        return Response(user_cache.stats(), status=status.HTTP_200_OK)
 
-    # 인증 테스트 기능
+
+def _chunk_size(request, default):
+    # 쿼리 파라미터 chunk_size (1 이상의 정수)
+    try:
+        chunk_size = int(request.query_params.get("chunk_size", default))
+    except ValueError:
+        chunk_size = 0
+    if chunk_size < 1:
+        raise serializers.ValidationError(
+            {
+                "error": {
+                    "code": "INVALID_CHUNK_SIZE",
+                    "message": "chunk_size는 1 이상의 정수여야 합니다.",
+                }
+            }
+        )
+    return chunk_size
+
+
+class BulkSignupAPIView(APIView):
+    # 관리자 권한은 최신 사용자 상태로 확인
+    authentication_classes = [VerifiedJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    # 대량 회원가입 기능
+    def post(self, request):
+        chunk_size = _chunk_size(request, settings.BULK_IMPORT["CHUNK_SIZE"])
+
+        # 요청 본문을 파싱하지 않고 스트림에서 한 줄씩 읽어 처리
+        fmt = "csv" if request.content_type.startswith("text/csv") else "jsonl"
+        results = import_users(
+            read_rows(request.stream or [], fmt),
+            chunk_size=chunk_size,
+            workers=settings.BULK_IMPORT["WORKERS"],
+        )
+
+        return StreamingHttpResponse(
+            (json.dumps(result, ensure_ascii=False) + "\n" for result in results),
+            content_type="application/x-ndjson",
+        )
+
+
+class UserExportAPIView(APIView):
+    # 관리자 권한은 최신 사용자 상태로 확인
+    authentication_classes = [VerifiedJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    # 사용자 목록 내보내기 기능
     def get(self, request):
-        return Response({"message": "인증 성공"}, status=status.HTTP_200_OK)
+        # format 쿼리 파라미터는 DRF 렌더러 선택에 사용되므로 output으로 형식 지정
+        fmt = request.query_params.get("output", "ndjson")
+        if fmt not in FORMATS:
+            raise serializers.ValidationError(
+                {
+                    "error": {
+                        "code": "INVALID_OUTPUT",
+                        "message": "output은 ndjson 또는 csv여야 합니다.",
+                    }
+                }
+            )
+        chunk_size = _chunk_size(request, settings.USER_EXPORT["CHUNK_SIZE"])
+
+        response = StreamingHttpResponse(
+            export_users(fmt, chunk_size=chunk_size), content_type=CONTENT_TYPES[fmt]
+        )
+        response["Content-Disposition"] = f'attachment; filename="users.{fmt}"'
+        return response
+
+
+class JWKSAPIView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    # 공개 키 목록 조회 기능
+    def get(self, request):
+        response = Response(get_token_backend().keyring.jwks, status=status.HTTP_200_OK)
+        # 검증하는 서비스가 키 목록을 캐시하도록 허용 (키 교체 시 이전 키도 함께 제공되므로 안전)
+        response["Cache-Control"] = "public, max-age=%d" % settings.JWT_KEYS.get(
+            "JWKS_MAX_AGE", 300
+        )
+        return response
+
+
+class TokenIntrospectionAPIView(APIView):
+    # 관리자 권한은 최신 사용자 상태로 확인
+    authentication_classes = [VerifiedJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    # 토큰 일괄 검증 기능
+    def post(self, request):
+        serializer = TokenIntrospectionSerializer(data=request.data)
+
+        if serializer.is_valid():
+            results = introspect_tokens(serializer.validated_data["tokens"])
+            return Response({"results": results}, status=status.HTTP_200_OK)
+        else:
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class MetricsAPIView(APIView):
+    authentication_classes = []
+    permission_classes = [HasMetricsToken]
+
+    # 측정값 조회 기능
+    def get(self, request):
+        return HttpResponse(
+            registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+
+
+class ProfilingAPIView(APIView):
+    # 관리자 권한은 최신 사용자 상태로 확인
+    authentication_classes = [VerifiedJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    # 프로파일러 상태 조회 기능
+    def get(self, request):
+        profiler = get_profiler()
+        profiler.refresh_config()
+        return Response(profiler.stats(), status=status.HTTP_200_OK)
+
+    # 프로파일 시작 기능
+    def post(self, request):
+        serializer = ProfilingSerializer(data=request.data)
+
+        if serializer.is_valid():
+            profiler = get_profiler()
+            profiler.configure(**serializer.validated_data)
+            return Response(profiler.stats(), status=status.HTTP_200_OK)
+        else:
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    # 프로파일 종료 기능
+    def delete(self, request):
+        profiler = get_profiler()
+        profiler.disable()
+        profiler.flush(force=True)
+        return Response(profiler.stats(), status=status.HTTP_200_OK)
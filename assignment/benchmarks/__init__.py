@@ -0,0 +1,40 @@
+"""
+성능 측정 스크립트 모음
+
+assignment 디렉토리에서 모듈로 실행합니다.
+    python -m benchmarks.bench_hashers
+"""
+
+import os
+from contextlib import contextmanager
+
+
+def setup_django():
+    """
+    벤치마크 스크립트에서 Django 설정을 로드
+    """
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """
+    실제 DB 대신 테스트 DB를 만들어 벤치마크를 수행하고 종료 시 삭제
+    """
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+        teardown_test_environment,
+    )
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
@@ -0,0 +1,142 @@
+"""
+동시 회원가입 시 SQLite 쓰기 잠금 경합 측정
+
+여러 프로세스(gunicorn 워커 역할)가 같은 SQLite 파일에 동시에 회원가입을 수행할 때
+기본 설정과 config.database의 튜닝 설정(WAL, synchronous=NORMAL, IMMEDIATE 트랜잭션 등)의
+처리량, 지연 시간, 잠금 오류(database is locked) 수를 비교합니다.
+DB 비용만 비교하기 위해 기본적으로 저비용 해시 프로필(fast)을 사용합니다.
+
+    python -m benchmarks.bench_concurrent_signup --workers 8 --count 200
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+
+def database_settings(mode, path):
+    from config.database import database_config
+
+    if mode == "default":
+        # 변경 전 settings.py의 설정
+        return {"ENGINE": "django.db.backends.sqlite3", "NAME": path}
+    return database_config(Path(path).parent, env={"DB_NAME": path})
+
+
+def _setup(mode, path, hasher_profile):
+    import django
+    from django.conf import settings
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    settings.DATABASES = {"default": database_settings(mode, path)}
+    django.setup()
+    settings.PASSWORD_HASHERS = settings.PASSWORD_HASHER_PROFILES[hasher_profile]
+
+
+def _worker(mode, path, hasher_profile, worker_id, count, start):
+    _setup(mode, path, hasher_profile)
+    from django.db import OperationalError, close_old_connections
+
+    from accounts.serializers import SignupSerializer
+
+    latencies = []
+    errors = 0
+    start.wait()
+    for i in range(count):
+        close_old_connections()
+        started = time.perf_counter()
+        try:
+            serializer = SignupSerializer(
+                data={
+                    "username": f"{mode}-{worker_id}-{i}",
+                    "password": "benchmark-password",
+                    "nickname": "bench",
+                }
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+        except OperationalError:
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+    return latencies, errors
+
+
+def _migrate(mode, path, hasher_profile):
+    _setup(mode, path, hasher_profile)
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def measure(mode, workers, count, hasher_profile):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.sqlite3")
+
+        # 스키마 생성은 별도 프로세스에서 수행 (현재 프로세스의 DB 설정을 바꾸지 않음)
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(1) as pool:
+            pool.apply(_migrate, (mode, path, hasher_profile))
+
+        start = ctx.Manager().Event()
+        with ctx.Pool(workers) as pool:
+            jobs = [
+                pool.apply_async(
+                    _worker, (mode, path, hasher_profile, worker_id, count, start)
+                )
+                for worker_id in range(workers)
+            ]
+            # 모든 워커가 준비된 후 동시에 시작
+            time.sleep(1)
+            started = time.perf_counter()
+            start.set()
+            results = [job.get() for job in jobs]
+            elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for result, _ in results for latency in result)
+    quantiles = statistics.quantiles(latencies, n=100)
+    errors = sum(error for _, error in results)
+    return {
+        "signups_per_sec": round((len(latencies) - errors) / elapsed, 2),
+        "p50_ms": round(quantiles[49] * 1000, 2),
+        "p95_ms": round(quantiles[94] * 1000, 2),
+        "p99_ms": round(quantiles[98] * 1000, 2),
+        "locked_errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8, help="동시 실행 프로세스 수")
+    parser.add_argument(
+        "--count", type=int, default=200, help="프로세스별 회원가입 횟수"
+    )
+    parser.add_argument(
+        "--hasher-profile", default="fast", help="사용할 비밀번호 해시 프로필"
+    )
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    results = {
+        mode: measure(mode, args.workers, args.count, args.hasher_profile)
+        for mode in ("default", "tuned")
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for mode, result in results.items():
+        print(
+            f"{mode:<7} {result['signups_per_sec']:>10.2f} signups/s "
+            f"p50 {result['p50_ms']:>8.2f}ms p95 {result['p95_ms']:>8.2f}ms "
+            f"p99 {result['p99_ms']:>8.2f}ms locked {result['locked_errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
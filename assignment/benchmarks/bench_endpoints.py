@@ -0,0 +1,346 @@
+"""
+회원가입/로그인/인증 테스트 API 부하 측정 및 기준값(baseline) 비교
+
+- inprocess: 테스트 DB와 Django 테스트 클라이언트로 API를 직접 호출 (요청당 SQL 쿼리 수 포함)
+- gunicorn / uvicorn: 임시 SQLite DB로 로컬 서버를 실행하고 HTTP로 동시 요청
+
+시나리오별 p50/p95/p99 지연 시간, 초당 요청 수, 요청당 SQL 쿼리 수(inprocess만)를 출력하고,
+--save로 결과를 JSON 기준값으로 저장, --compare로 기준값과 비교하여 임계값보다 나빠지면 종료 코드 1을 반환합니다.
+로그인 시도 제한은 측정 중 비활성화합니다.
+
+    python -m benchmarks.bench_endpoints --mode inprocess --count 200 --save benchmarks/baselines/inprocess.json
+    python -m benchmarks.bench_endpoints --mode gunicorn --workers 4 --concurrency 16 --count 2000
+    python -m benchmarks.bench_endpoints --mode inprocess --compare benchmarks/baselines/inprocess.json
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks import setup_django, test_database
+
+ASSIGNMENT_DIR = Path(__file__).resolve().parent.parent
+SCENARIOS = ("signup", "login", "auth_test")
+PASSWORD = "benchmark-password"
+
+
+def summarize(latencies, elapsed, queries=None, errors=0):
+    latencies = sorted(latencies)
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    quantile = (lambda n: quantiles[n - 1]) if quantiles else (lambda n: latencies[0])
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(quantile(50) * 1000, 3),
+        "p95_ms": round(quantile(95) * 1000, 3),
+        "p99_ms": round(quantile(99) * 1000, 3),
+        "requests_per_sec": round(len(latencies) / elapsed, 2),
+        "queries_per_request": (
+            round(queries / len(latencies), 2) if queries is not None else None
+        ),
+        "errors": errors,
+    }
+
+
+def scenario_request(scenario, index, token):
+    """
+    (method, path, body, headers) 시나리오별 요청
+    """
+    if scenario == "signup":
+        body = {"username": f"bench-{index}", "password": PASSWORD, "nickname": "b"}
+        return "POST", "/signup/", body, {}
+    if scenario == "login":
+        return "POST", "/login/", {"username": "bench", "password": PASSWORD}, {}
+    return "GET", "/auth-test/", None, {"Authorization": f"Bearer {token}"}
+
+
+def run_inprocess(args):
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+
+    from accounts.models import User
+
+    settings.LOGIN_RATE_LIMIT = {**settings.LOGIN_RATE_LIMIT, "ENABLED": False}
+    if args.hasher_profile:
+        settings.PASSWORD_HASHERS = settings.PASSWORD_HASHER_PROFILES[
+            args.hasher_profile
+        ]
+
+    results = {}
+    with test_database():
+        client = Client()
+        User.objects.create_user(username="bench", password=PASSWORD, nickname="b")
+        token = client.post(
+            "/login/", {"username": "bench", "password": PASSWORD}
+        ).json()["token"]
+
+        for scenario in SCENARIOS:
+            latencies = []
+            errors = 0
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                for index in range(args.count):
+                    method, path, body, headers = scenario_request(
+                        scenario, index, token
+                    )
+                    request_started = time.perf_counter()
+                    if method == "POST":
+                        response = client.post(
+                            path, body, content_type="application/json"
+                        )
+                    else:
+                        response = client.get(path, headers=headers)
+                    latencies.append(time.perf_counter() - request_started)
+                    errors += response.status_code >= 400
+                elapsed = time.perf_counter() - started
+            results[scenario] = summarize(
+                latencies, elapsed, len(queries.captured_queries), errors
+            )
+    return results
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _server_command(mode, port, workers):
+    if mode == "gunicorn":
+        return [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "config.wsgi:application",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ]
+    return [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "config.asgi:application",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+    ]
+
+
+def _request(port, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        headers = dict(headers or {})
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        connection.request(method, path, payload, headers)
+        response = connection.getresponse()
+        return response.status, response.read()
+    finally:
+        connection.close()
+
+
+def run_server(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "config.settings",
+            "SECRET_KEY": os.getenv("SECRET_KEY", "benchmark-secret-key"),
+            "DEBUG": "False",
+            "DB_NAME": os.path.join(tmp, "bench.sqlite3"),
+            "LOGIN_RATE_LIMIT_ENABLED": "False",
+        }
+        if args.hasher_profile:
+            env["PASSWORD_HASHER_PROFILE"] = args.hasher_profile
+        if args.mode == "uvicorn":
+            env["ACCOUNTS_ASYNC_VIEWS"] = "True"
+
+        subprocess.run(
+            [sys.executable, "manage.py", "migrate", "--verbosity", "0"],
+            cwd=ASSIGNMENT_DIR,
+            env=env,
+            check=True,
+        )
+
+        port = _free_port()
+        server = subprocess.Popen(
+            _server_command(args.mode, port, args.workers),
+            cwd=ASSIGNMENT_DIR,
+            env=env,
+        )
+        try:
+            _wait_for_server(server, port)
+            return _run_http_scenarios(args, port)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+def _wait_for_server(server, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with code {server.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+def _run_http_scenarios(args, port):
+    _request(
+        port,
+        "POST",
+        "/signup/",
+        {"username": "bench", "password": PASSWORD, "nickname": "b"},
+    )
+    status, body = _request(
+        port, "POST", "/login/", {"username": "bench", "password": PASSWORD}
+    )
+    if status != 200:
+        raise RuntimeError(f"login failed: {status} {body[:200]!r}")
+    token = json.loads(body)["token"]
+
+    results = {}
+    for scenario in SCENARIOS:
+
+        def send(index):
+            method, path, body, headers = scenario_request(scenario, index, token)
+            started = time.perf_counter()
+            status, _ = _request(port, method, path, body, headers)
+            return time.perf_counter() - started, status >= 400
+
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            started = time.perf_counter()
+            outcomes = list(pool.map(send, range(args.count)))
+            elapsed = time.perf_counter() - started
+
+        results[scenario] = summarize(
+            [latency for latency, _ in outcomes],
+            elapsed,
+            errors=sum(error for _, error in outcomes),
+        )
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    기준값 대비 나빠진 항목 목록
+    - p95 지연 시간 증가 또는 초당 요청 수 감소가 threshold 비율을 넘는 경우
+    - 요청당 쿼리 수가 늘어난 경우, 오류 응답이 생긴 경우
+    """
+    regressions = []
+    for scenario, base in baseline.get("scenarios", {}).items():
+        current = results["scenarios"].get(scenario)
+        if current is None:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{scenario}: p95 {base['p95_ms']}ms -> {current['p95_ms']}ms"
+            )
+        if current["requests_per_sec"] < base["requests_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{scenario}: {base['requests_per_sec']} -> "
+                f"{current['requests_per_sec']} requests/s"
+            )
+        if (
+            current["queries_per_request"] is not None
+            and base.get("queries_per_request") is not None
+            and current["queries_per_request"] > base["queries_per_request"]
+        ):
+            regressions.append(
+                f"{scenario}: {base['queries_per_request']} -> "
+                f"{current['queries_per_request']} queries/request"
+            )
+        if current["errors"] > base.get("errors", 0):
+            regressions.append(f"{scenario}: {current['errors']} error responses")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--mode", choices=("inprocess", "gunicorn", "uvicorn"), default="inprocess"
+    )
+    parser.add_argument("--count", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="동시 요청 수 (서버 모드)"
+    )
+    parser.add_argument("--workers", type=int, default=2, help="서버 워커 프로세스 수")
+    parser.add_argument(
+        "--hasher-profile", default=None, help="비밀번호 해시 프로필 (기본값: 설정값)"
+    )
+    parser.add_argument("--save", help="결과를 저장할 기준값 JSON 파일")
+    parser.add_argument("--compare", help="비교할 기준값 JSON 파일")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="허용하는 p95 증가 / 처리량 감소 비율",
+    )
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    if args.mode == "inprocess":
+        scenarios = run_inprocess(args)
+    else:
+        scenarios = run_server(args)
+
+    results = {
+        "mode": args.mode,
+        "count": args.count,
+        "concurrency": 1 if args.mode == "inprocess" else args.concurrency,
+        "workers": None if args.mode == "inprocess" else args.workers,
+        "hasher_profile": args.hasher_profile,
+        "scenarios": scenarios,
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for scenario, result in scenarios.items():
+            queries = result["queries_per_request"]
+            print(
+                f"{scenario:<10} p50 {result['p50_ms']:>8.2f}ms "
+                f"p95 {result['p95_ms']:>8.2f}ms p99 {result['p99_ms']:>8.2f}ms "
+                f"{result['requests_per_sec']:>9.2f} requests/s"
+                + (f"  {queries} queries/request" if queries is not None else "")
+                + (f"  errors {result['errors']}" if result["errors"] else "")
+            )
+
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+비밀번호 해시 프로필별 처리량 측정
+
+각 프로필의 선호 해셔로 해시를 만든 뒤 check_password()를 반복 실행하여
+단일 코어 기준 초당 로그인(비밀번호 검증) 수를 출력합니다.
+필요한 라이브러리가 없는 프로필(argon2 등)은 건너뜁니다.
+
+    python -m benchmarks.bench_hashers --duration 2
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks import setup_django
+
+
+def measure_profile(hashers, duration):
+    from django.contrib.auth.hashers import check_password, make_password
+    from django.test.utils import override_settings
+
+    with override_settings(PASSWORD_HASHERS=hashers):
+        encoded = make_password("benchmark-password")
+
+        count = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < duration:
+            check_password("benchmark-password", encoded)
+            count += 1
+        elapsed = time.perf_counter() - started
+
+    return {
+        "hasher": hashers[0].rsplit(".", 1)[-1],
+        "logins_per_sec_per_core": round(count / elapsed, 2),
+        "ms_per_login": round(elapsed / count * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--duration", type=float, default=2.0, help="프로필별 측정 시간(초)"
+    )
+    parser.add_argument(
+        "--profile", action="append", help="측정할 프로필 (기본값: 전체)"
+    )
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+
+    profiles = args.profile or list(settings.PASSWORD_HASHER_PROFILES)
+    results = {}
+    for name in profiles:
+        try:
+            results[name] = measure_profile(
+                settings.PASSWORD_HASHER_PROFILES[name], args.duration
+            )
+        except ValueError as exc:
+            # 해셔 라이브러리 미설치
+            results[name] = {"skipped": str(exc)}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<8} skipped: {result['skipped']}")
+        else:
+            print(
+                f"{name:<8} {result['hasher']:<32} "
+                f"{result['logins_per_sec_per_core']:>10.2f} logins/s/core "
+                f"{result['ms_per_login']:>10.3f} ms/login"
+            )
+
+
+if __name__ == "__main__":
+    main()
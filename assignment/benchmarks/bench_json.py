@@ -0,0 +1,97 @@
+"""
+JSON 렌더링/파싱/콘텐츠 협상 비용 측정
+
+DRF 기본 JSONRenderer, JSONParser, DefaultContentNegotiation과
+accounts의 FastJSONRenderer, FastJSONParser, FastJSONContentNegotiation을
+accounts API 크기의 요청/응답으로 비교합니다.
+
+    python -m benchmarks.bench_json --count 100000
+"""
+
+import argparse
+import io
+import json
+import time
+
+from benchmarks import setup_django
+
+LOGIN_BODY = b'{"username": "testuser", "password": "testpass123"}'
+
+
+def timeit(fn, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return round((time.perf_counter() - started) / count * 1_000_000, 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000, help="항목별 반복 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.negotiation import DefaultContentNegotiation
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from accounts.parsers import FastJSONContentNegotiation, FastJSONParser
+    from accounts.renderers import FastJSONRenderer
+    from accounts.serializers import INVALID_CREDENTIALS_ERROR
+    from accounts.views import AUTH_SUCCESS_RESPONSE
+
+    token = {"token": "x" * 200}
+    request = Request(APIRequestFactory().get("/auth-test/"))
+    renderers = [JSONRenderer(), BrowsableAPIRenderer()]
+
+    cases = {
+        "render_token": lambda renderer: lambda: renderer.render(token),
+        "render_constant": lambda renderer: lambda: renderer.render(
+            AUTH_SUCCESS_RESPONSE
+        ),
+        "render_error": lambda renderer: lambda: renderer.render(
+            INVALID_CREDENTIALS_ERROR
+        ),
+    }
+
+    results = {}
+    for name, case in cases.items():
+        results[name] = {
+            "drf_us": timeit(case(JSONRenderer()), args.count),
+            "fast_us": timeit(case(FastJSONRenderer()), args.count),
+        }
+    results["parse_login"] = {
+        "drf_us": timeit(
+            lambda: JSONParser().parse(io.BytesIO(LOGIN_BODY)), args.count
+        ),
+        "fast_us": timeit(
+            lambda: FastJSONParser().parse(io.BytesIO(LOGIN_BODY)), args.count
+        ),
+    }
+    results["negotiate"] = {
+        "drf_us": timeit(
+            lambda: DefaultContentNegotiation().select_renderer(request, renderers),
+            args.count,
+        ),
+        "fast_us": timeit(
+            lambda: FastJSONContentNegotiation().select_renderer(request, renderers),
+            args.count,
+        ),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(
+            f"{name:<16} drf {result['drf_us']:>8.3f}us "
+            f"fast {result['fast_us']:>8.3f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
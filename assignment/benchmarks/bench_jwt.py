@@ -0,0 +1,135 @@
+"""
+JWT 알고리즘별 서명/검증 처리량 측정
+
+알고리즘마다 임시 키를 만들어 KeyringTokenBackend로 액세스 토큰 크기의 payload를 서명/검증하고,
+키 문자열(PEM)을 토큰마다 다시 파싱하는 경우(uncached)와 비교합니다.
+RS256/EdDSA는 cryptography 패키지가 없으면 건너뜁니다.
+
+    python -m benchmarks.bench_jwt --count 5000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks import setup_django
+
+ALGORITHMS = ["HS256", "RS256", "EdDSA"]
+
+
+def generate_key(algorithm):
+    """
+    알고리즘별 키 파일 내용, 사용할 수 없는 알고리즘이면 None
+    """
+    if algorithm.startswith("HS"):
+        return b"benchmark-secret-key-0123456789abcdef"
+
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+    except ImportError:
+        return None
+
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def timeit(fn, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    elapsed = time.perf_counter() - started
+    return round(elapsed / count * 1_000_000, 2), round(count / elapsed)
+
+
+def measure(algorithm, key_data, count):
+    import jwt
+
+    from accounts.jwt_keys import KeyRing, KeyringTokenBackend
+
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, "bench.pem").write_bytes(key_data)
+        backend = KeyringTokenBackend(KeyRing.from_directory(directory, algorithm))
+
+    payload = {
+        "token_type": "access",
+        "exp": 2_000_000_000,
+        "iat": 1_700_000_000,
+        "jti": "0123456789abcdef0123456789abcdef",
+        "user_id": 1,
+        "username": "bench",
+        "nickname": "bench",
+        "is_active": True,
+    }
+    token = backend.encode(payload)
+
+    # 공개 키(PEM)를 토큰마다 파싱하는 경우
+    key = backend.keyring.active
+    if algorithm.startswith("HS"):
+        verifying_pem = key_data
+    else:
+        from cryptography.hazmat.primitives import serialization
+
+        verifying_pem = key.verifying_key.public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+
+    sign_us, sign_ops = timeit(lambda: backend.encode(payload), count)
+    verify_us, verify_ops = timeit(lambda: backend.decode(token), count)
+    uncached_us, _ = timeit(
+        lambda: jwt.decode(token, verifying_pem, algorithms=[algorithm]), count
+    )
+    return {
+        "sign_us": sign_us,
+        "sign_per_sec": sign_ops,
+        "verify_us": verify_us,
+        "verify_per_sec": verify_ops,
+        "verify_uncached_us": uncached_us,
+        "token_bytes": len(token),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000, help="항목별 반복 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    setup_django()
+
+    results = {}
+    for algorithm in ALGORITHMS:
+        key_data = generate_key(algorithm)
+        if key_data is None:
+            results[algorithm] = None
+            continue
+        results[algorithm] = measure(algorithm, key_data, args.count)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for algorithm, result in results.items():
+        if result is None:
+            print(f"{algorithm:<6} skipped (cryptography 패키지 필요)")
+            continue
+        print(
+            f"{algorithm:<6} sign {result['sign_us']:>8.2f}us ({result['sign_per_sec']}/s)  "
+            f"verify {result['verify_us']:>8.2f}us ({result['verify_per_sec']}/s)  "
+            f"verify(uncached) {result['verify_uncached_us']:>8.2f}us  "
+            f"token {result['token_bytes']}B"
+        )
+
+
+if __name__ == "__main__":
+    main()
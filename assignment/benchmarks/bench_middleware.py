@@ -0,0 +1,129 @@
+"""
+미들웨어 스택별 요청당 오버헤드 측정
+
+- stack: 아무 일도 하지 않는 뷰 앞에서 미들웨어 체인만 실행한 시간
+- request: 테스트 클라이언트로 /auth-test/ 요청 전체를 처리한 시간
+
+변경 전 MIDDLEWARE(모든 요청에 세션/CSRF/인증/메시지 미들웨어 적용)와
+현재 설정의 API 경로(그룹 미들웨어 없음), 관리자 경로(full 그룹)를 비교합니다.
+api_uninstrumented는 현재 설정에서 InstrumentationMiddleware만 뺀 경우로, 구간 측정 오버헤드를 확인합니다.
+
+    python -m benchmarks.bench_middleware --count 20000
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks import setup_django
+
+LEGACY_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+
+def measure_stack(middleware, path, count):
+    from django.http import HttpResponse
+    from django.test import RequestFactory
+
+    from config.middleware import MiddlewareChain
+
+    def view(request):
+        return HttpResponse(b"{}", content_type="application/json")
+
+    def get_response(request):
+        # Django 핸들러처럼 뷰 실행 전 process_view 훅 호출
+        for hook in chain.view_hooks:
+            response = hook(request, view, (), {})
+            if response is not None:
+                return response
+        return view(request)
+
+    chain = MiddlewareChain(middleware, get_response, is_async=False)
+    factory = RequestFactory()
+    requests = [factory.get(path) for _ in range(count)]
+
+    started = time.perf_counter()
+    for request in requests:
+        chain.handler(request)
+    elapsed = time.perf_counter() - started
+    return round(elapsed / count * 1_000_000, 2)
+
+
+def measure_request(middleware, count):
+    from django.test import Client
+    from django.test.utils import override_settings
+
+    from accounts.models import User
+    from accounts.tokens import UserAccessToken
+
+    # 토큰 클레임만으로 인증하므로 DB에 저장하지 않은 사용자로 토큰 발급
+    token = UserAccessToken.for_user(
+        User(id=1, username="bench", nickname="bench", is_active=True)
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with override_settings(MIDDLEWARE=middleware):
+        client = Client()
+        client.get("/auth-test/", headers=headers)
+
+        started = time.perf_counter()
+        for _ in range(count):
+            client.get("/auth-test/", headers=headers)
+        elapsed = time.perf_counter() - started
+    return round(elapsed / count * 1_000_000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000, help="방식별 요청 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    middleware = list(settings.MIDDLEWARE)
+    uninstrumented = [
+        path for path in middleware if not path.endswith("InstrumentationMiddleware")
+    ]
+
+    results = {
+        "legacy": {
+            "stack_us": measure_stack(LEGACY_MIDDLEWARE, "/auth-test/", args.count),
+            "request_us": measure_request(LEGACY_MIDDLEWARE, args.count // 10),
+        },
+        "api": {
+            "stack_us": measure_stack(middleware, "/auth-test/", args.count),
+            "request_us": measure_request(middleware, args.count // 10),
+        },
+        "api_uninstrumented": {
+            "stack_us": measure_stack(uninstrumented, "/auth-test/", args.count),
+            "request_us": measure_request(uninstrumented, args.count // 10),
+        },
+        "admin": {
+            "stack_us": measure_stack(middleware, "/admin/", args.count),
+        },
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        line = f"{name:<18} stack {result['stack_us']:>8.2f}us/request"
+        if "request_us" in result:
+            line += f"  /auth-test/ {result['request_us']:>8.2f}us/request"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
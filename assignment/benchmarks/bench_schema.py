@@ -0,0 +1,75 @@
+"""
+OpenAPI 스키마 응답 시간 측정
+
+요청마다 스키마를 생성하는 SpectacularAPIView와
+한 번 생성한 결과를 메모리에서 응답하는 CachedSpectacularAPIView를 비교합니다.
+
+    python -m benchmarks.bench_schema --count 50
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks import setup_django
+
+
+def measure(view, count, **headers):
+    from django.test import RequestFactory
+
+    factory = RequestFactory()
+    durations = []
+    for _ in range(count):
+        request = factory.get("/schema/", headers=headers)
+        started = time.perf_counter()
+        response = view(request)
+        # DRF Response는 렌더링까지 포함하여 측정
+        if hasattr(response, "render"):
+            response.render()
+        durations.append(time.perf_counter() - started)
+        assert response.status_code in (200, 304)
+
+    durations.sort()
+    return {
+        "requests_per_sec": round(count / sum(durations), 2),
+        "p50_ms": round(durations[len(durations) // 2] * 1000, 3),
+        "bytes": len(response.content),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50, help="방식별 요청 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import RequestFactory
+    from drf_spectacular.views import SpectacularAPIView
+
+    from accounts.schema_cache import CachedSpectacularAPIView
+
+    cached = CachedSpectacularAPIView.as_view()
+    # 첫 요청에서 스키마 생성
+    etag = cached(RequestFactory().get("/schema/"))["ETag"]
+
+    results = {
+        "uncached": measure(SpectacularAPIView.as_view(), args.count),
+        "cached": measure(cached, args.count),
+        "cached_gzip": measure(cached, args.count, **{"Accept-Encoding": "gzip"}),
+        "cached_304": measure(cached, args.count, **{"If-None-Match": etag}),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(
+            f"{name:<12} {result['requests_per_sec']:>10.2f} req/s "
+            f"p50 {result['p50_ms']:>8.3f}ms {result['bytes']:>8} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
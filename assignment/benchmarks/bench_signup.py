@@ -0,0 +1,92 @@
+"""
+회원가입 경로의 SQL 문 수와 처리량 측정
+
+이전 방식(exists() 사전 확인 + create() + set_password() + save())과
+현재 방식(해시 후 한 번의 INSERT, 중복은 unique 제약으로 확인)을 비교합니다.
+DB 비용만 비교하기 위해 기본적으로 저비용 해시 프로필(fast)을 사용합니다.
+
+    python -m benchmarks.bench_signup --count 500
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks import setup_django, test_database
+
+
+def legacy_signup(data):
+    # 변경 전 SignupSerializer.validate() + create() 동작
+    from accounts.models import User
+
+    if User.objects.filter(username=data["username"]).exists():
+        return None
+    user = User.objects.create(username=data["username"], nickname=data["nickname"])
+    user.set_password(data["password"])
+    user.save()
+    return user
+
+
+def current_signup(data):
+    from accounts.serializers import SignupSerializer
+
+    serializer = SignupSerializer(data=data)
+    serializer.is_valid(raise_exception=True)
+    return serializer.save()
+
+
+def measure(name, signup, count):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for i in range(count):
+            signup(
+                {
+                    "username": f"{name}-{i}",
+                    "password": "benchmark-password",
+                    "nickname": "bench",
+                }
+            )
+        elapsed = time.perf_counter() - started
+
+    return {
+        "statements_per_signup": round(len(queries.captured_queries) / count, 2),
+        "signups_per_sec": round(count / elapsed, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=500, help="방식별 회원가입 횟수")
+    parser.add_argument(
+        "--hasher-profile", default="fast", help="사용할 비밀번호 해시 프로필"
+    )
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.test.utils import override_settings
+
+    hashers = settings.PASSWORD_HASHER_PROFILES[args.hasher_profile]
+    with override_settings(PASSWORD_HASHERS=hashers), test_database():
+        results = {
+            "before": measure("legacy", legacy_signup, args.count),
+            "after": measure("current", current_signup, args.count),
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(
+            f"{name:<7} {result['statements_per_signup']:>6.2f} statements/signup "
+            f"{result['signups_per_sec']:>10.2f} signups/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+프로세스 프로필별 시작 시간과 워커당 메모리 측정
+
+- import: 새 프로세스에서 config.wsgi(설정, 앱, 미들웨어, URL 설정과 뷰)를 불러오는 시간,
+  불러온 모듈 수, RSS를 PROCESS_PROFILE(full/api/docs)별로 측정 (--count회 중앙값)
+- gunicorn: --server 지정 시 프로필별로 gunicorn을 --preload 없이/함께 실행하여
+  첫 응답까지 걸린 시간과 워커당 RSS/PSS를 측정 (PSS는 fork로 공유하는 메모리를 워커 수로 나눈 값)
+
+    python -m benchmarks.bench_startup --count 5
+    python -m benchmarks.bench_startup --server --workers 4
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_endpoints import _free_port, _request
+
+ASSIGNMENT_DIR = Path(__file__).resolve().parent.parent
+PROFILES = ("full", "api", "docs")
+
+IMPORT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+from config.wsgi import application
+elapsed = time.perf_counter() - started
+rss = [line for line in open("/proc/self/status") if line.startswith("VmRSS")]
+print(json.dumps({
+    "import_ms": elapsed * 1000,
+    "modules": len(sys.modules),
+    "rss_kb": int(rss[0].split()[1]) if rss else None,
+}))
+"""
+
+
+def _env(profile, tmp):
+    return {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "config.settings",
+        "SECRET_KEY": os.getenv("SECRET_KEY", "benchmark-secret-key"),
+        "DEBUG": "False",
+        "DB_NAME": os.path.join(tmp, "bench.sqlite3"),
+        "PROCESS_PROFILE": profile,
+    }
+
+
+def measure_import(profile, count, tmp):
+    runs = []
+    for _ in range(count):
+        started = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            cwd=ASSIGNMENT_DIR,
+            env=_env(profile, tmp),
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        result["process_ms"] = (time.perf_counter() - started) * 1000
+        runs.append(result)
+    return {
+        "process_ms": round(statistics.median(r["process_ms"] for r in runs), 1),
+        "import_ms": round(statistics.median(r["import_ms"] for r in runs), 1),
+        "modules": runs[-1]["modules"],
+        "rss_mb": (
+            round(statistics.median(r["rss_kb"] for r in runs) / 1024, 1)
+            if runs[-1]["rss_kb"] is not None
+            else None
+        ),
+    }
+
+
+def _memory_kb(pid):
+    """
+    (RSS, PSS) 킬로바이트
+    """
+    status = Path(f"/proc/{pid}/status").read_text()
+    rss = next(int(line.split()[1]) for line in status.splitlines() if "VmRSS" in line)
+    pss = None
+    rollup = Path(f"/proc/{pid}/smaps_rollup")
+    if rollup.exists():
+        for line in rollup.read_text().splitlines():
+            if line.startswith("Pss:"):
+                pss = int(line.split()[1])
+    return rss, pss
+
+
+def _children(pid):
+    children = []
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        children.extend(int(child) for child in (task / "children").read_text().split())
+    return children
+
+
+def measure_gunicorn(profile, workers, preload, tmp):
+    port = _free_port()
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "config.wsgi:application",
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+    ]
+    if preload:
+        command.append("--preload")
+
+    started = time.perf_counter()
+    server = subprocess.Popen(command, cwd=ASSIGNMENT_DIR, env=_env(profile, tmp))
+    try:
+        # 인증 없이 요청하면 DB 없이 401 응답
+        deadline = time.monotonic() + 60
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError(f"gunicorn exited with code {server.returncode}")
+            try:
+                _request(port, "GET", "/auth-test/")
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("gunicorn did not start")
+                time.sleep(0.05)
+        ready_ms = (time.perf_counter() - started) * 1000
+
+        # 모든 워커가 요청을 처리하도록 여러 번 요청한 뒤 측정
+        for _ in range(workers * 10):
+            _request(port, "GET", "/auth-test/")
+        time.sleep(0.5)
+
+        memory = [_memory_kb(pid) for pid in _children(server.pid)]
+        rss = [value for value, _ in memory]
+        pss = [value for _, value in memory if value is not None]
+        return {
+            "ready_ms": round(ready_ms, 1),
+            "workers": len(memory),
+            "rss_mb_per_worker": round(statistics.mean(rss) / 1024, 1),
+            "pss_mb_per_worker": (
+                round(statistics.mean(pss) / 1024, 1) if pss else None
+            ),
+        }
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=5, help="프로필별 import 측정 횟수"
+    )
+    parser.add_argument(
+        "--profiles", nargs="+", choices=PROFILES, default=list(PROFILES)
+    )
+    parser.add_argument(
+        "--server", action="store_true", help="gunicorn 워커 메모리도 측정"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn 워커 수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in args.profiles:
+            results[profile] = {"import": measure_import(profile, args.count, tmp)}
+            if args.server:
+                for preload in (False, True):
+                    key = "gunicorn_preload" if preload else "gunicorn"
+                    results[profile][key] = measure_gunicorn(
+                        profile, args.workers, preload, tmp
+                    )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for profile, result in results.items():
+        imported = result["import"]
+        print(
+            f"{profile:<5} import {imported['import_ms']:>7.1f}ms "
+            f"process {imported['process_ms']:>7.1f}ms "
+            f"{imported['modules']:>5} modules RSS {imported['rss_mb']} MB"
+        )
+        for key in ("gunicorn", "gunicorn_preload"):
+            if key in result:
+                server = result[key]
+                print(
+                    f"      {key:<17} ready {server['ready_ms']:>7.1f}ms "
+                    f"{server['workers']} workers, per worker "
+                    f"RSS {server['rss_mb_per_worker']} MB "
+                    f"PSS {server['pss_mb_per_worker']} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+검증된 토큰 캐시 사용 전/후 JWT 인증 비용 측정
+
+StatelessJWTAuthentication.authenticate()를 다음 세 경우로 반복 호출합니다.
+- cold: 매번 캐시를 비우고 인증 (디코딩 + 서명 검증 + 캐시 저장)
+- warm: 같은 토큰을 반복 인증 (캐시 조회 + 폐기 여부 확인)
+- disabled: TOKEN_CACHE 비활성화 (변경 전과 같은 경로)
+
+    python -m benchmarks.bench_token_cache --count 20000
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks import setup_django
+
+
+def timeit(fn, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    elapsed = time.perf_counter() - started
+    return {
+        "us": round(elapsed / count * 1_000_000, 2),
+        "per_sec": round(count / elapsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000, help="경우별 반복 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from rest_framework.test import APIRequestFactory
+
+    from accounts.authentication import StatelessJWTAuthentication
+    from accounts.cache import token_cache
+    from accounts.tokens import UserAccessToken
+
+    token = UserAccessToken()
+    token.payload.update(
+        {"user_id": 1, "username": "bench", "nickname": "bench", "is_active": True}
+    )
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    auth = StatelessJWTAuthentication()
+
+    def cold():
+        token_cache.clear()
+        auth.authenticate(request)
+
+    enabled = settings.TOKEN_CACHE
+    results = {"cold": timeit(cold, args.count)}
+    token_cache.clear()
+    results["warm"] = timeit(lambda: auth.authenticate(request), args.count)
+    settings.TOKEN_CACHE = {**enabled, "ENABLED": False}
+    results["disabled"] = timeit(lambda: auth.authenticate(request), args.count)
+    settings.TOKEN_CACHE = enabled
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(f"{name:<9} {result['us']:>8.2f}us/auth {result['per_sec']:>9}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+회원가입/로그인 요청 검증 비용 측정
+
+요청마다 Serializer를 만들어 is_valid()를 호출하는 변경 전 방식과
+accounts.validation의 미리 읽어 둔 검증 규칙(RequestValidator)을
+정상 요청과 잘못된 요청으로 비교합니다. (로그인의 사용자 인증은 제외)
+
+    python -m benchmarks.bench_validation --count 100000
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks import setup_django
+
+SIGNUP_BODY = {"username": "testuser", "password": "testpass123", "nickname": "nick"}
+SIGNUP_INVALID_BODY = {"username": "", "password": None, "nickname": "n" * 51}
+LOGIN_BODY = {"username": "testuser", "password": "testpass123"}
+LOGIN_INVALID_BODY = {"username": "testuser"}
+
+
+def timeit(fn, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return round((time.perf_counter() - started) / count * 1_000_000, 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000, help="항목별 반복 횟수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    setup_django()
+    from accounts.serializers import LoginSerializer, SignupSerializer
+    from accounts.validation import login_validator, signup_validator
+
+    class LoginFieldsSerializer(LoginSerializer):
+        # 변경 전 비동기 로그인 뷰와 같이 필드 검증만 수행
+        def validate(self, data):
+            return data
+
+    cases = {
+        "signup": (SignupSerializer, signup_validator, SIGNUP_BODY),
+        "signup_invalid": (SignupSerializer, signup_validator, SIGNUP_INVALID_BODY),
+        "login": (LoginFieldsSerializer, login_validator, LOGIN_BODY),
+        "login_invalid": (LoginFieldsSerializer, login_validator, LOGIN_INVALID_BODY),
+    }
+
+    results = {}
+    for name, (serializer_class, validator, body) in cases.items():
+        results[name] = {
+            "serializer_us": timeit(
+                lambda: serializer_class(data=body).is_valid(), args.count
+            ),
+            "compiled_us": timeit(lambda: validator.validate(body), args.count),
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(
+            f"{name:<16} serializer {result['serializer_us']:>8.3f}us "
+            f"compiled {result['compiled_us']:>8.3f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
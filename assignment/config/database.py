@@ -0,0 +1,139 @@
+"""
+환경 변수 기반 데이터베이스 설정 모듈
+
+settings.DATABASES["default"]를 환경 변수로 구성합니다.
+
+- DB_ENGINE: sqlite(기본값) 또는 postgresql
+- PostgreSQL: DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT로 접속 정보 지정
+  - DB_CONN_MAX_AGE(초)만큼 연결을 재사용하고, DB_CONN_HEALTH_CHECKS로 재사용 전 연결 상태 확인
+  - DB_POOL=True이면 psycopg 연결 풀 사용 (psycopg[pool] 필요, 영구 연결과 함께 사용할 수 없음)
+- SQLite: 여러 gunicorn 워커가 동시에 쓰는 환경을 위해 연결마다 PRAGMA 적용
+  - WAL 저널 모드(읽기와 쓰기가 서로를 막지 않음), synchronous=NORMAL, mmap
+  - 쓰기 잠금 대기 시간(DB_SQLITE_TIMEOUT) 동안 재시도하고,
+    트랜잭션은 IMMEDIATE 모드로 시작하여 읽기 후 쓰기 전환 시의 교착(database is locked) 방지
+- DB_REPLICAS: 읽기 복제본 목록 (쉼표로 구분, accounts.routers.PrimaryReplicaRouter가 읽기 쿼리를 분배)
+  - PostgreSQL: 복제본 호스트(host 또는 host:port), 나머지 접속 정보는 기본 DB와 같음
+  - SQLite: 복제본 파일 경로 (로컬 개발/테스트에서 기본 DB 파일을 복사하여 복제본 대역으로 사용)
+- DB_USER_SHARDS: 기본 DB 외의 사용자 샤드 목록 (쉼표로 구분, 형식은 DB_REPLICAS와 같음, accounts.sharding)
+"""
+
+import copy
+import os
+
+ENGINES = {
+    "sqlite": "django.db.backends.sqlite3",
+    "postgresql": "django.db.backends.postgresql",
+}
+
+
+def _env_bool(env, name, default):
+    return env.get(name, default) == "True"
+
+
+def sqlite_init_command(mmap_size, cache_size):
+    """
+    SQLite 연결마다 실행할 PRAGMA 목록
+    """
+    return ";".join(
+        [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            f"PRAGMA mmap_size={mmap_size}",
+            f"PRAGMA cache_size={cache_size}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+    )
+
+
+def database_config(base_dir, env=None):
+    """
+    환경 변수로 DATABASES["default"] 설정 생성
+    """
+    env = os.environ if env is None else env
+    engine = env.get("DB_ENGINE", "sqlite")
+    if engine not in ENGINES:
+        raise ValueError(
+            f"DB_ENGINE must be one of {', '.join(ENGINES)}, got {engine!r}."
+        )
+
+    if engine == "sqlite":
+        return {
+            "ENGINE": ENGINES[engine],
+            "NAME": env.get("DB_NAME") or base_dir / "db.sqlite3",
+            # SQLite 연결 생성 비용은 작지만 PRAGMA 적용을 줄이기 위해 연결 재사용
+            "CONN_MAX_AGE": int(env.get("DB_CONN_MAX_AGE", "60")),
+            "CONN_HEALTH_CHECKS": _env_bool(env, "DB_CONN_HEALTH_CHECKS", "False"),
+            "OPTIONS": {
+                "init_command": sqlite_init_command(
+                    mmap_size=int(env.get("DB_SQLITE_MMAP_SIZE", str(128 * 1024**2))),
+                    cache_size=int(env.get("DB_SQLITE_CACHE_SIZE", "-16000")),
+                ),
+                "transaction_mode": "IMMEDIATE",
+                "timeout": float(env.get("DB_SQLITE_TIMEOUT", "5")),
+            },
+        }
+
+    config = {
+        "ENGINE": ENGINES[engine],
+        "NAME": env.get("DB_NAME", "assignment"),
+        "USER": env.get("DB_USER", ""),
+        "PASSWORD": env.get("DB_PASSWORD", ""),
+        "HOST": env.get("DB_HOST", ""),
+        "PORT": env.get("DB_PORT", ""),
+        "CONN_MAX_AGE": int(env.get("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": _env_bool(env, "DB_CONN_HEALTH_CHECKS", "True"),
+        "OPTIONS": {},
+    }
+
+    if _env_bool(env, "DB_POOL", "False"):
+        # 연결 풀은 영구 연결(CONN_MAX_AGE)과 함께 사용할 수 없음
+        config["CONN_MAX_AGE"] = 0
+        config["OPTIONS"]["pool"] = {
+            "min_size": int(env.get("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(env.get("DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(env.get("DB_POOL_TIMEOUT", "10")),
+        }
+
+    return config
+
+
+def _copy_configs(primary, env, name, prefix):
+    """
+    환경 변수 name의 항목마다 기본 DB 설정을 복사하여 접속 대상만 바꾼 설정 생성
+    - PostgreSQL: host 또는 host:port, SQLite: 파일 경로
+    """
+    entries = [entry.strip() for entry in env.get(name, "").split(",")]
+
+    configs = {}
+    for index, entry in enumerate(filter(None, entries), start=1):
+        config = copy.deepcopy(primary)
+        if config["ENGINE"] == ENGINES["sqlite"]:
+            config["NAME"] = entry
+        else:
+            host, _, port = entry.partition(":")
+            config["HOST"] = host
+            config["PORT"] = port or config["PORT"]
+        configs[f"{prefix}{index}"] = config
+
+    return configs
+
+
+def replica_configs(primary, env=None):
+    """
+    DB_REPLICAS로 읽기 복제본 설정 생성 ({"replica1": {...}, "replica2": {...}})
+    - 테스트 실행 시에는 기본 DB를 미러링하여 별도의 테스트 DB를 만들지 않음
+    """
+    env = os.environ if env is None else env
+    replicas = _copy_configs(primary, env, "DB_REPLICAS", "replica")
+    for config in replicas.values():
+        config["TEST"] = {"MIRROR": "default"}
+    return replicas
+
+
+def shard_configs(primary, env=None):
+    """
+    DB_USER_SHARDS로 사용자 샤드 설정 생성 ({"shard1": {...}, "shard2": {...}})
+    - 0번 샤드는 기본 DB(default)이며, 샤드는 목록 뒤에 추가만 가능 (순서가 토큰의 user_id에 기록됨)
+    """
+    env = os.environ if env is None else env
+    return _copy_configs(primary, env, "DB_USER_SHARDS", "shard")
@@ -0,0 +1,45 @@
+"""
+지연 import 뷰 모듈
+
+API 문서 뷰(drf_spectacular.views)는 스키마 생성기, yaml 렌더러 등 많은 모듈을 불러오지만
+API 요청만 처리하는 워커에서는 사용되지 않습니다.
+LazyView는 URL 설정에서 뷰 클래스 경로만 등록하고, 첫 요청 시 import하여 as_view() 결과를 재사용합니다.
+"""
+
+import threading
+
+from django.utils.module_loading import import_string
+
+
+class LazyView:
+    """
+    첫 요청 시 뷰 클래스를 import하는 뷰 함수
+    """
+
+    # APIView.as_view()와 같이 CSRF 검사 제외 (문서 뷰는 조회만 제공)
+    csrf_exempt = True
+
+    def __init__(self, view_path, **initkwargs):
+        self.view_path = view_path
+        self.initkwargs = initkwargs
+        self._view = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._view is None:
+            with self._lock:
+                if self._view is None:
+                    view_class = import_string(self.view_path)
+                    self._view = view_class.as_view(**self.initkwargs)
+        return self._view
+
+    @property
+    def cls(self):
+        # 스키마 생성기가 APIView 엔드포인트를 찾을 때 사용 (문서 생성 시에만 import)
+        return self.load().cls
+
+    def __call__(self, request, *args, **kwargs):
+        return self.load()(request, *args, **kwargs)
+
+    def __repr__(self):
+        return f"<LazyView {self.view_path}>"
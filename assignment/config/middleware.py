@@ -0,0 +1,193 @@
+"""
+경로별 미들웨어 그룹 모듈
+
+settings.MIDDLEWARE는 모든 요청에 같은 미들웨어를 적용합니다.
+JWT 기반 JSON API는 세션, CSRF, 세션 인증, 메시지 미들웨어를 사용하지 않으므로,
+RouteGroupMiddleware는 요청 경로에 따라 미리 구성한 미들웨어 체인 중 하나만 실행합니다.
+
+- settings.MIDDLEWARE_GROUPS: 그룹 이름 -> 미들웨어 경로 목록
+- settings.MIDDLEWARE_ROUTES: (경로 접두사, 그룹 이름) 목록, 첫 번째로 일치하는 그룹 사용
+- 그룹 내 미들웨어의 process_view / process_template_response / process_exception도
+  Django 핸들러와 같은 순서로 호출 (CsrfViewMiddleware 등)
+  어느 그룹에도 해당 훅이 없으면 메서드를 제공하지 않아 Django 핸들러가 요청마다 호출하지 않으며,
+  비동기(ASGI) 모드에서는 코루틴으로 제공하여 요청마다 sync_to_async 스레드 전환이 생기지 않음
+  (process_exception은 Django 핸들러가 항상 동기로 호출하므로 동기 메서드)
+- 동기(WSGI)/비동기(ASGI) 변환은 Django 핸들러의 adapt_method_mode를 그대로 사용
+"""
+
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.handlers.base import BaseHandler
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger("django.request")
+
+
+class MiddlewareChain:
+    """
+    미들웨어 목록으로 구성한 체인과 훅 목록 (BaseHandler.load_middleware와 같은 방식으로 구성)
+    """
+
+    def __init__(self, middleware_paths, get_response, is_async):
+        adapter = BaseHandler()
+        self.view_hooks = []
+        self.template_response_hooks = []
+        self.exception_hooks = []
+
+        handler = get_response
+        handler_is_async = is_async
+        for middleware_path in reversed(middleware_paths):
+            middleware = import_string(middleware_path)
+            middleware_can_sync = getattr(middleware, "sync_capable", True)
+            middleware_can_async = getattr(middleware, "async_capable", False)
+            if not middleware_can_sync and not middleware_can_async:
+                raise RuntimeError(
+                    "Middleware %s must have at least one of "
+                    "sync_capable/async_capable set to True." % middleware_path
+                )
+            elif not handler_is_async and middleware_can_sync:
+                middleware_is_async = False
+            else:
+                middleware_is_async = middleware_can_async
+
+            try:
+                adapted_handler = adapter.adapt_method_mode(
+                    middleware_is_async,
+                    handler,
+                    handler_is_async,
+                    debug=settings.DEBUG,
+                    name="middleware %s" % middleware_path,
+                )
+                mw_instance = middleware(adapted_handler)
+            except MiddlewareNotUsed:
+                logger.debug("MiddlewareNotUsed: %r", middleware_path)
+                continue
+            handler = adapted_handler
+
+            if mw_instance is None:
+                raise ImproperlyConfigured(
+                    "Middleware factory %s returned None." % middleware_path
+                )
+
+            # 그룹 내 훅은 RouteGroupMiddleware와 같은 모드(동기/비동기)로 변환
+            # (process_exception은 Django 핸들러와 같이 항상 동기로 호출)
+            if hasattr(mw_instance, "process_view"):
+                self.view_hooks.insert(
+                    0, adapter.adapt_method_mode(is_async, mw_instance.process_view)
+                )
+            if hasattr(mw_instance, "process_template_response"):
+                self.template_response_hooks.append(
+                    adapter.adapt_method_mode(
+                        is_async, mw_instance.process_template_response
+                    )
+                )
+            if hasattr(mw_instance, "process_exception"):
+                self.exception_hooks.append(
+                    adapter.adapt_method_mode(False, mw_instance.process_exception)
+                )
+
+            handler = convert_exception_to_response(mw_instance)
+            handler_is_async = middleware_is_async
+
+        self.handler = adapter.adapt_method_mode(is_async, handler, handler_is_async)
+
+
+class RouteGroupMiddleware:
+    """
+    요청 경로에 따라 미들웨어 그룹 하나를 실행하는 미들웨어
+    - settings.MIDDLEWARE의 이 미들웨어 위치에서 그룹의 미들웨어가 실행됨
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+        self.routes = list(getattr(settings, "MIDDLEWARE_ROUTES", []))
+        self.chains = {
+            group: MiddlewareChain(middleware_paths, get_response, self.is_async)
+            for group, middleware_paths in getattr(
+                settings, "MIDDLEWARE_GROUPS", {}
+            ).items()
+        }
+        for prefix, group in self.routes:
+            if group not in self.chains:
+                raise ImproperlyConfigured(
+                    "MIDDLEWARE_ROUTES refers to unknown group %r." % group
+                )
+
+        # 일치하는 경로가 없으면 그룹 미들웨어 없이 바로 다음 단계 실행
+        self.default_chain = MiddlewareChain([], get_response, self.is_async)
+
+        # 그룹에 훅이 있을 때만 Django 핸들러에 훅 메서드 제공
+        mode = "async" if self.is_async else "sync"
+        for name, hooks, method in (
+            ("process_view", "view_hooks", f"_{mode}_process_view"),
+            (
+                "process_template_response",
+                "template_response_hooks",
+                f"_{mode}_process_template_response",
+            ),
+            ("process_exception", "exception_hooks", "_process_exception"),
+        ):
+            if any(getattr(chain, hooks) for chain in self.chains.values()):
+                setattr(self, name, getattr(self, method))
+
+    def get_chain(self, request):
+        path = request.path_info
+        for prefix, group in self.routes:
+            if path.startswith(prefix):
+                return self.chains[group]
+        return self.default_chain
+
+    def __call__(self, request):
+        # 비동기 모드에서는 그룹 체인도 비동기로 구성되어 코루틴을 반환
+        return self.get_chain(request).handler(request)
+
+    def _sync_process_view(self, request, view_func, view_args, view_kwargs):
+        for hook in self.get_chain(request).view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    async def _async_process_view(self, request, view_func, view_args, view_kwargs):
+        for hook in self.get_chain(request).view_hooks:
+            response = await hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def _sync_process_template_response(self, request, response):
+        for hook in self.get_chain(request).template_response_hooks:
+            response = hook(request, response)
+            if response is None:
+                raise ValueError(
+                    "%r didn't return an HttpResponse object. "
+                    "It returned None instead." % hook
+                )
+        return response
+
+    async def _async_process_template_response(self, request, response):
+        for hook in self.get_chain(request).template_response_hooks:
+            response = await hook(request, response)
+            if response is None:
+                raise ValueError(
+                    "%r didn't return an HttpResponse object. "
+                    "It returned None instead." % hook
+                )
+        return response
+
+    def _process_exception(self, request, exception):
+        for hook in self.get_chain(request).exception_hooks:
+            response = hook(request, exception)
+            if response is not None:
+                return response
+        return None
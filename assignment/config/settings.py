@@ -12,25 +12,59 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
-from dotenv import load_dotenv
+import tempfile
+from dotenv import dotenv_values, find_dotenv
 
-load_dotenv()
+from .database import database_config, replica_configs, shard_configs
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# .env 파일 값은 os.environ을 변경하지 않고 읽기만 함 (프로세스 환경 변수가 우선)
+# import 시 부작용이 없으므로 gunicorn --preload로 마스터 프로세스에서 미리 불러와도 워커 환경이 바뀌지 않음
+_env = {**dotenv_values(find_dotenv()), **os.environ}
+
+
+def getenv(name, default=None):
+    return _env.get(name, default)
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = os.getenv("SECRET_KEY")
+SECRET_KEY = getenv("SECRET_KEY")
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.getenv("DEBUG", "True") == "True"
+DEBUG = getenv("DEBUG", "True") == "True"
 
 ALLOWED_HOSTS = ['3.38.135.6', 'localhost', '127.0.0.1']
 
+# 프로세스 프로필 (PROCESS_PROFILE)
+# - full: API, 관리자 페이지, API 문서를 모두 제공 (문서 뷰는 첫 문서 요청 시 import)
+# - api: JSON API만 제공, 관리자/세션/메시지/정적 파일/drf_spectacular 앱과 URL을 로드하지 않음
+# - docs: 관리자 페이지와 API 문서 전용 프로세스, 시작 시 문서 뷰까지 import
+#   (스키마 생성을 위해 API URL도 등록, 로드 밸런서에서 /admin/, /schema/, /swagger/, /redoc/만 전달)
+PROCESS_PROFILES = ("full", "api", "docs")
+PROCESS_PROFILE = getenv("PROCESS_PROFILE", "full")
+if PROCESS_PROFILE not in PROCESS_PROFILES:
+    raise ValueError(
+        f"PROCESS_PROFILE must be one of {', '.join(PROCESS_PROFILES)}, "
+        f"got {PROCESS_PROFILE!r}."
+    )
+
+# 관리자 페이지와 API 문서를 제공하는지 여부
+SERVE_DOCS = PROCESS_PROFILE != "api"
+
+# 관리자 페이지와 API 문서에만 필요한 앱 (api 프로필에서 제외)
+DOCS_APPS = [
+    "django.contrib.admin",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "drf_spectacular",
+]
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -48,16 +82,44 @@ INSTALLED_APPS = [
     "accounts",
 ]
 
+if not SERVE_DOCS:
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in DOCS_APPS]
+
 MIDDLEWARE = [
+    # 요청별 구간 측정 (INSTRUMENTATION), 전체 처리 시간을 측정하도록 가장 앞에 위치
+    "accounts.instrumentation.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    # 지정한 뷰의 요청 일부를 샘플링 프로파일 (PROFILING), 대상이 없으면 설정 확인만 수행
+    "accounts.profiling.ProfilingMiddleware",
+    # 경로별 미들웨어 그룹 실행 (MIDDLEWARE_GROUPS, MIDDLEWARE_ROUTES)
+    "config.middleware.RouteGroupMiddleware",
 ]
 
+# 세션/CSRF/세션 인증/메시지를 사용하는 경로(관리자 페이지)에만 적용하는 미들웨어
+# JWT 기반 JSON API는 그룹 미들웨어 없이 실행
+MIDDLEWARE_GROUPS = {
+    "full": [
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+        "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    ],
+}
+
+# (경로 접두사, 그룹 이름) 목록, 첫 번째로 일치하는 그룹 사용
+MIDDLEWARE_ROUTES = [
+    ("/admin/", "full"),
+]
+
+if not SERVE_DOCS:
+    MIDDLEWARE_GROUPS = {}
+    MIDDLEWARE_ROUTES = []
+
+# 관리자 페이지에 필요한 세션/인증/메시지 미들웨어는 MIDDLEWARE_GROUPS["full"]로 적용
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -81,11 +143,29 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# 데이터베이스 설정은 환경 변수(DB_ENGINE, DB_NAME, DB_CONN_MAX_AGE, DB_POOL 등)로 지정
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": database_config(BASE_DIR, _env),
+}
+
+# 읽기 복제본(DB_REPLICAS)은 replica1, replica2, ... 별칭으로 추가
+_replicas = replica_configs(DATABASES["default"], _env)
+DATABASES.update(_replicas)
+
+# 사용자 샤드(DB_USER_SHARDS)는 shard1, shard2, ... 별칭으로 추가, 0번 샤드는 기본 DB
+# 둘 이상이면 User를 username 해시로 나누어 저장하고 토큰의 user_id에 샤드 번호 기록 (accounts.sharding)
+# 샤드는 목록 뒤에 추가만 가능하며, 추가 후 manage.py reshard_users로 사용자 이동
+_shards = shard_configs(DATABASES["default"], _env)
+DATABASES.update(_shards)
+USER_SHARDS = ["default", *_shards]
+
+# 복제본이 있으면 읽기 쿼리(로그인 시 사용자 조회 등)는 복제본, 쓰기와 트랜잭션 안의 읽기는 기본 DB에서 수행
+# 회원가입한 사용자는 STICKY_SECONDS 동안 기본 DB에서 조회 (복제 지연 대비, 워커 간 공유하려면 CACHES에 공유 캐시 지정)
+DATABASE_ROUTERS = ["accounts.routers.PrimaryReplicaRouter"]
+DATABASE_ROUTING = {
+    "REPLICAS": list(_replicas),
+    "STICKY_SECONDS": int(getenv("DB_REPLICA_STICKY_SECONDS", "5")),
+    "CACHE_ALIAS": "default",
 }
 
 AUTH_USER_MODEL = "accounts.User"
@@ -109,26 +189,236 @@ AUTH_PASSWORD_VALIDATORS = [
     # },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+# 첫 번째 해셔로 새 비밀번호를 저장하고, 나머지 해셔는 기존 해시 검증과 자동 업그레이드에 사용
+# - fast 프로필은 테스트 전용 (MD5, 운영 환경에서 사용 금지)
+# - argon2 프로필은 argon2-cffi 패키지 설치 필요
+
+PASSWORD_HASHER_PROFILES = {
+    "pbkdf2": [
+        "accounts.hashers.TunablePBKDF2PasswordHasher",
+        "accounts.hashers.TunableScryptPasswordHasher",
+        "accounts.hashers.TunableArgon2PasswordHasher",
+    ],
+    "scrypt": [
+        "accounts.hashers.TunableScryptPasswordHasher",
+        "accounts.hashers.TunablePBKDF2PasswordHasher",
+        "accounts.hashers.TunableArgon2PasswordHasher",
+    ],
+    "argon2": [
+        "accounts.hashers.TunableArgon2PasswordHasher",
+        "accounts.hashers.TunableScryptPasswordHasher",
+        "accounts.hashers.TunablePBKDF2PasswordHasher",
+    ],
+    "fast": [
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+        "accounts.hashers.TunablePBKDF2PasswordHasher",
+        "accounts.hashers.TunableScryptPasswordHasher",
+        "accounts.hashers.TunableArgon2PasswordHasher",
+    ],
+}
+
+PASSWORD_HASHER_PROFILE = getenv("PASSWORD_HASHER_PROFILE", "pbkdf2")
+
+PASSWORD_HASHERS = PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]
+
+# 해셔별 작업 비용 (기본값은 Django 기본 해셔와 동일)
+PASSWORD_HASHER_OPTIONS = {
+    "PBKDF2_ITERATIONS": int(getenv("PBKDF2_ITERATIONS", "1000000")),
+    "SCRYPT_WORK_FACTOR": int(getenv("SCRYPT_WORK_FACTOR", str(2**14))),
+    "SCRYPT_BLOCK_SIZE": int(getenv("SCRYPT_BLOCK_SIZE", "8")),
+    "SCRYPT_PARALLELISM": int(getenv("SCRYPT_PARALLELISM", "5")),
+    "SCRYPT_MAXMEM": int(getenv("SCRYPT_MAXMEM", "0")),
+    "ARGON2_TIME_COST": int(getenv("ARGON2_TIME_COST", "2")),
+    "ARGON2_MEMORY_COST": int(getenv("ARGON2_MEMORY_COST", "102400")),
+    "ARGON2_PARALLELISM": int(getenv("ARGON2_PARALLELISM", "8")),
+}
+
+# 비밀번호 해시를 별도 프로세스 풀에서 수행 (대기열이 가득 차면 503 + Retry-After 응답)
+PASSWORD_HASH_POOL = {
+    "ENABLED": getenv("PASSWORD_HASH_POOL_ENABLED", "False") == "True",
+    "MAX_WORKERS": int(getenv("PASSWORD_HASH_POOL_WORKERS", "2")),
+    "MAX_PENDING": int(getenv("PASSWORD_HASH_POOL_MAX_PENDING", "16")),
+    "RETRY_AFTER": int(getenv("PASSWORD_HASH_POOL_RETRY_AFTER", "1")),
+    "START_METHOD": getenv("PASSWORD_HASH_POOL_START_METHOD", "spawn"),
+}
+
+# 사용자 대량 가입 API 설정 (관리 명령 import_users는 옵션으로 지정)
+BULK_IMPORT = {
+    "CHUNK_SIZE": int(getenv("BULK_IMPORT_CHUNK_SIZE", "1000")),
+    "WORKERS": int(getenv("BULK_IMPORT_WORKERS", "1")),
+}
+
+# 사용자 목록 내보내기 API 설정 (관리 명령 export_users는 옵션으로 지정)
+USER_EXPORT = {
+    "CHUNK_SIZE": int(getenv("USER_EXPORT_CHUNK_SIZE", "1000")),
+}
+
+AUTHENTICATION_BACKENDS = ["accounts.backends.HashPoolModelBackend"]
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.StatelessJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "EXCEPTION_HANDLER": "accounts.exception_handler.custom_exception_handler",
+    # orjson 기반 JSON 렌더러/파서 (출력은 JSONRenderer와 동일), 일반 JSON 요청은 협상 생략
+    "DEFAULT_RENDERER_CLASSES": (
+        "accounts.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "accounts.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    "DEFAULT_CONTENT_NEGOTIATION_CLASS": "accounts.parsers.FastJSONContentNegotiation",
     "NON_FIELD_ERRORS_KEY": "error",
+    # 앞단의 신뢰하는 프록시 수, 0이면 X-Forwarded-For를 무시하고 REMOTE_ADDR로 클라이언트 IP 판단
+    # (로그인 시도 제한, 감사 기록, DRF 스로틀에 사용)
+    "NUM_PROXIES": int(getenv("NUM_PROXIES", "0")),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+SIMPLE_JWT = {
+    "TOKEN_USER_CLASS": "accounts.authentication.ClaimsUser",
+    "AUTH_TOKEN_CLASSES": ("accounts.tokens.UserAccessToken",),
+}
+
+# JWT 서명 키 설정 (accounts.jwt_keys)
+# DIR이 없으면 SIMPLE_JWT 기본값(HS256, SECRET_KEY)으로 서명, 있으면 DIR의 <kid>.pem 키로 서명하고 kid 헤더 기록
+# ACCEPT_LEGACY: kid가 없는 기존 토큰을 SIMPLE_JWT 기본 키로 계속 검증할지 여부 (키 전환 기간용)
+JWT_KEYS = {
+    "DIR": getenv("JWT_KEYS_DIR", ""),
+    "ALGORITHM": getenv("JWT_ALGORITHM", "RS256"),
+    "ACTIVE_KID": getenv("JWT_ACTIVE_KID", ""),
+    "ACCEPT_LEGACY": getenv("JWT_ACCEPT_LEGACY", "True") == "True",
+    "JWKS_MAX_AGE": int(getenv("JWT_JWKS_MAX_AGE", "300")),
+}
+
+# True로 설정하면 모든 JWT 인증에서 토큰 클레임 대신 DB의 사용자 정보를 조회
+JWT_VERIFY_USER_IN_DB = getenv("JWT_VERIFY_USER_IN_DB", "False") == "True"
+
+# JWT_VERIFY_USER_IN_DB=True인 DB 검증에서 사용하는 프로세스 내 사용자 캐시 설정
+# 같은 프로세스의 save()/delete()는 즉시 무효화되지만, QuerySet.update()나 다른 워커의 변경은
+# 최대 TTL(초) 동안 반영되지 않음 (VerifiedJWTAuthentication을 사용하는 관리자 API는 캐시를 사용하지 않음)
+USER_CACHE = {
+    "MAX_SIZE": int(getenv("USER_CACHE_MAX_SIZE", "1024")),
+    "TTL": int(getenv("USER_CACHE_TTL", "60")),
+}
+
+# 서명 검증을 통과한 JWT 캐시 (accounts.cache.token_cache)
+# 같은 토큰의 반복 요청은 디코딩과 서명 검증을 생략, 항목은 TTL(초)과 토큰 만료 시각 중 이른 시점에 만료
+# 키 교체로 제거한 키의 토큰은 최대 TTL 동안 캐시에서 인정될 수 있음 (reset_token_backend()는 캐시도 비움)
+TOKEN_CACHE = {
+    "ENABLED": getenv("TOKEN_CACHE_ENABLED", "True") == "True",
+    "MAX_SIZE": int(getenv("TOKEN_CACHE_MAX_SIZE", "10000")),
+    "TTL": int(getenv("TOKEN_CACHE_TTL", "300")),
+}
+
+# 로그아웃/리프레시 토큰 교체로 폐기된 토큰 목록 설정 (accounts.denylist)
+# CHECK_SHARED: True이면 액세스 토큰 인증 시 메모리에 없는 jti를 CACHES의 CACHE_ALIAS에서도 확인 (여러 워커 간 즉시 반영)
+TOKEN_DENYLIST = {
+    "CAPACITY": int(getenv("TOKEN_DENYLIST_CAPACITY", "100000")),
+    "ERROR_RATE": float(getenv("TOKEN_DENYLIST_ERROR_RATE", "0.001")),
+    "CACHE_ALIAS": "default",
+    "CHECK_SHARED": getenv("TOKEN_DENYLIST_CHECK_SHARED", "False") == "True",
+}
+
+# 토큰 일괄 검증 API(/token/introspect/) 요청당 최대 토큰 수
+TOKEN_INTROSPECTION = {
+    "MAX_TOKENS": int(getenv("TOKEN_INTROSPECTION_MAX_TOKENS", "500")),
+}
+
+# 요청별 구간 측정 (accounts.instrumentation)
+# SERVER_TIMING: True이면 응답에 Server-Timing 헤더 추가 (구간별 시간이 노출되므로 필요한 환경에서만 사용)
+# METRICS_TOKEN: /metrics/ 요청에 Authorization: Bearer <token> 필요 (설정하지 않으면 /metrics/ 비활성화, 항상 403)
+INSTRUMENTATION = {
+    "ENABLED": getenv("INSTRUMENTATION_ENABLED", "True") == "True",
+    "SERVER_TIMING": getenv("SERVER_TIMING_ENABLED", "False") == "True",
+    "METRICS_TOKEN": getenv("METRICS_TOKEN", ""),
+}
+
+# 샘플링 프로파일러 (accounts.profiling), 관리자 API /profiling/ 또는 CONTROL_FILE로 실행 중 켜고 끔
+# DIR: collapsed stack 출력 디렉터리 (워커별 profile-<pid>.collapsed)
+# CONTROL_FILE: 설정하면 켜기/끄기 상태를 이 파일로 공유하여 모든 워커에 반영 (직접 수정해도 최대 1초 안에 반영)
+# INTERVAL: 스택 수집 간격(초), MAX_STACKS: 워커별로 보관하는 서로 다른 스택 수 상한
+PROFILING = {
+    "DIR": getenv(
+        "PROFILING_DIR", os.path.join(tempfile.gettempdir(), "accounts-profiles")
+    ),
+    "CONTROL_FILE": getenv("PROFILING_CONTROL_FILE", ""),
+    "INTERVAL": float(getenv("PROFILING_INTERVAL", "0.005")),
+    "MAX_STACKS": int(getenv("PROFILING_MAX_STACKS", "5000")),
+    "MAX_DURATION": int(getenv("PROFILING_MAX_DURATION", "3600")),
+}
+
+# 로그인/회원가입 감사 기록 (accounts.audit, AuditEvent 모델)
+# 요청 처리 중에는 프로세스 내 대기열(MAX_QUEUE)에 추가만 하고, 백그라운드 스레드가 BATCH_SIZE개가 모이거나
+# FLUSH_INTERVAL(초)이 지나면 bulk_create로 저장, 대기열이 가득 차면 버리고 dropped로 집계
+# 로그인 성공 시 last_login도 같은 주기로 모아서 갱신하며, 프로세스 종료 시 남은 기록 저장
+AUDIT_LOG = {
+    "ENABLED": getenv("AUDIT_LOG_ENABLED", "True") == "True",
+    "MAX_QUEUE": int(getenv("AUDIT_LOG_MAX_QUEUE", "10000")),
+    "BATCH_SIZE": int(getenv("AUDIT_LOG_BATCH_SIZE", "500")),
+    "FLUSH_INTERVAL": float(getenv("AUDIT_LOG_FLUSH_INTERVAL", "1")),
+}
+
+# 로그인 시도 제한 (IP별 시도 횟수, username별 실패 잠금)
+# BACKEND: memory(프로세스 내) 또는 cache(CACHES의 CACHE_ALIAS, 여러 워커가 공유)
+LOGIN_RATE_LIMIT = {
+    "ENABLED": getenv("LOGIN_RATE_LIMIT_ENABLED", "True") == "True",
+    "BACKEND": getenv("LOGIN_RATE_LIMIT_BACKEND", "memory"),
+    "CACHE_ALIAS": "default",
+    "WINDOW": int(getenv("LOGIN_RATE_LIMIT_WINDOW", "60")),
+    "IP_LIMIT": int(getenv("LOGIN_RATE_LIMIT_IP", "30")),
+    "USERNAME_LIMIT": int(getenv("LOGIN_RATE_LIMIT_USERNAME", "5")),
+    "LOCKOUT": int(getenv("LOGIN_RATE_LIMIT_LOCKOUT", "300")),
+}
+
+# 공유 캐시 설정 (기본값은 프로세스 내 LocMemCache, 여러 워커가 공유하려면 Redis 등 지정)
+CACHES = {
+    "default": {
+        "BACKEND": getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": getenv("CACHE_LOCATION", ""),
+    }
+}
+
+# True로 설정하면 회원가입/로그인/인증 테스트 API를 비동기 뷰(accounts.async_views)로 제공 (ASGI 배포용)
+ACCOUNTS_ASYNC_VIEWS = getenv("ACCOUNTS_ASYNC_VIEWS", "False") == "True"
+
+if not SERVE_DOCS:
+    # API 전용 프로세스는 스키마를 생성하지 않으므로 스키마 클래스를 불러오지 않음
+    # (@extend_schema는 스키마 생성 시에만 적용, accounts.schema_extensions)
+    REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = None
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Assignment API",
     "DESCRIPTION": "Assignment API",
     "VERSION": "1.0.0",
+    # 스키마 생성 시에만 drf_spectacular 확장과 뷰 문서(@extend_schema)를 불러옴 (API 요청 처리에는 불필요)
+    "DEFAULT_GENERATOR_CLASS": "accounts.schema_extensions.AccountsSchemaGenerator",
     "POSTPROCESSING_HOOKS": [
         "drf_spectacular.hooks.postprocess_schema_enums",
         "accounts.schemas.custom_order_operations",
     ],
     # OTHER SETTINGS
 }
+
+if ACCOUNTS_ASYNC_VIEWS:
+    # 비동기 뷰는 DRF APIView가 아니므로 API 문서는 같은 URL의 동기 뷰 기준으로 생성
+    SPECTACULAR_SETTINGS["SERVE_URLCONF"] = "accounts.urls"
+
+# OpenAPI 스키마 캐시
+# DIR: render_schema 명령으로 미리 렌더링한 스키마 파일 디렉토리
+# (없으면 docs 프로필은 시작 시, 그 외는 첫 요청 시 생성)
+SCHEMA_CACHE = {
+    "DIR": getenv("SCHEMA_CACHE_DIR") or None,
+}
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -15,27 +15,43 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from django.contrib import admin
+from django.conf import settings
 from django.urls import path, include
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+
+from .lazy import LazyView
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
-    path("", include("accounts.urls")),
+    # ASGI 환경에서는 비동기 뷰 사용 가능 (ACCOUNTS_ASYNC_VIEWS=True)
+    path(
+        "",
+        include(
+            "accounts.async_urls" if settings.ACCOUNTS_ASYNC_VIEWS else "accounts.urls"
+        ),
+    ),
 ]
 
-# API 문서화 URL 패턴
+# API 문서화 URL 패턴 (PROCESS_PROFILE=api에서는 관리자 페이지와 함께 제외)
 # - /swagger: Swagger UI 메인 접속 경로
-# - /schema/: API 스키마 JSON 파일 접근 경로
+# - /schema/: API 스키마 JSON 파일 접근 경로 (한 번 생성한 결과를 메모리에서 응답, ETag/gzip 지원)
 # - /redoc/: ReDoc UI 접속 경로
-urlpatterns += [
-    path("schema/", SpectacularAPIView.as_view(), name="schema"),
-    path(
-        "swagger/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"
-    ),
-    path("redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
-]
+# 문서 뷰는 첫 요청 시 import (docs 프로필은 시작 시 import)
+if settings.SERVE_DOCS:
+    from django.contrib import admin
+
+    schema_view = LazyView("accounts.schema_cache.CachedSpectacularAPIView")
+    swagger_view = LazyView(
+        "drf_spectacular.views.SpectacularSwaggerView", url_name="schema"
+    )
+    redoc_view = LazyView(
+        "drf_spectacular.views.SpectacularRedocView", url_name="schema"
+    )
+    if settings.PROCESS_PROFILE == "docs":
+        for view in (schema_view, swagger_view, redoc_view):
+            view.load()
+
+    urlpatterns += [
+        path("admin/", admin.site.urls),
+        path("schema/", schema_view, name="schema"),
+        path("swagger/", swagger_view, name="swagger-ui"),
+        path("redoc/", redoc_view, name="redoc"),
+    ]
@@ -10,7 +10,19 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.conf import settings
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# 첫 요청 전에 URL 설정과 뷰 모듈을 불러옴
+# (gunicorn --preload 사용 시 마스터 프로세스에서 한 번만 불러오고 워커는 fork 후 메모리를 공유)
+get_resolver().url_patterns
+
+if settings.PROCESS_PROFILE == "docs":
+    from accounts.schema_cache import warm_schema_cache
+
+    # 문서 전용 프로세스는 첫 /schema/ 요청을 기다리지 않고 시작 시 스키마를 렌더링
+    warm_schema_cache()